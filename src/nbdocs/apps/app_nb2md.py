@@ -6,9 +6,13 @@ from typing import Optional, Sequence
 from argparsecfg import ArgumentParserCfg, field_argument, parse_args
 from rich import print as rprint
 
-from nbdocs.convert import convert2md, filter_changed
+from nbdocs.convert import collect_garbage, convert2md, filter_changed
+from nbdocs.changes import select_changed
 from nbdocs.core import get_nb_names
 from nbdocs.cfg_tools import get_config
+from nbdocs.manifest import Manifest
+from nbdocs.profiling import profile_if
+from nbdocs.timings import report_timings
 
 
 parser_cfg = ArgumentParserCfg(description="Nb2Md. Convert notebooks to Markdown.")
@@ -41,24 +45,78 @@ class AppConfig:
         action="store_true",
         help="Run in silent mode.",
     )
+    jobs: int = field_argument(
+        "-j",
+        default=1,
+        help="Number of parallel jobs, 0 - use all cpu.",
+    )
+    recursive: bool = field_argument(
+        "-r",
+        default=False,
+        action="store_true",
+        help="Find notebooks at subdirectories, mirror tree at docs.",
+    )
+    timings: bool = field_argument(
+        default=False,
+        action="store_true",
+        help="Print time of conversion stages.",
+    )
+    timings_out: str = field_argument(
+        default=None,
+        flag="--timings-out",
+        help="Write timings to file as json lines, enable timings.",
+    )
+    profile_out: str = field_argument(
+        default=None,
+        flag="--profile-out",
+        help="Profile build with cProfile, write stats to file (.prof).",
+    )
+    profile_nb: str = field_argument(
+        default=None,
+        flag="--profile-nb",
+        help="Profile only notebooks matching glob patterns, comma separated.",
+    )
+    memory: bool = field_argument(
+        default=False,
+        action="store_true",
+        help="Trace memory of conversion stages, print peak and retained memory.",
+    )
+    memory_budget: float = field_argument(
+        default=None,
+        flag="--memory-budget",
+        help="Memory budget for notebook, MB. Mark notebooks with bigger peak, enable memory.",
+    )
+    since: str = field_argument(
+        default=None,
+        help="Convert only notebooks changed since git ref, no check for changes.",
+    )
+    files_from: str = field_argument(
+        default=None,
+        flag="--files-from",
+        help="Convert only notebooks listed at file, one per line, '-' - stdin.",
+    )
 
 
 def convert(
     app_cfg: AppConfig,
 ) -> None:
     """Nb2Md. Convert notebooks to Markdown."""
-    nb_names = get_nb_names(app_cfg.nb_path)
-    nbs_number = len(nb_names)
-    if nbs_number == 0:
-        rprint("No files to convert!")
-        sys.exit()
-    rprint(f"Found {nbs_number} notebooks.")
-
     cfg = get_config(
         notebooks_path=app_cfg.nb_path,
         docs_path=app_cfg.dest_path,
         images_path=app_cfg.images_path,
     )
+    cfg.recursive = cfg.recursive or app_cfg.recursive
+    cfg.timings = cfg.timings or app_cfg.timings or app_cfg.timings_out is not None
+    cfg.memory = cfg.memory or app_cfg.memory or app_cfg.memory_budget is not None
+    if app_cfg.memory_budget is not None:
+        cfg.memory_budget = app_cfg.memory_budget
+    nb_names = get_nb_names(app_cfg.nb_path, cfg.recursive, cfg.ignore_patterns)
+    nbs_number = len(nb_names)
+    if nbs_number == 0:
+        rprint("No files to convert!")
+        sys.exit()
+    rprint(f"Found {nbs_number} notebooks.")
 
     # check logic -> do we need subdir and how to check modified Nbs
     # if convert whole directory, put result to docs subdir.
@@ -67,7 +125,12 @@ def convert(
     Path(cfg.docs_path).mkdir(parents=True, exist_ok=True)
     (Path(cfg.docs_path) / cfg.images_path).mkdir(exist_ok=True)
 
-    if not app_cfg.force:
+    if app_cfg.since is not None or app_cfg.files_from is not None:
+        nb_names = select_changed(
+            nb_names, app_cfg.nb_path, app_cfg.since, app_cfg.files_from
+        )
+        rprint(f"Changed: {len(nb_names)} notebooks.")
+    elif not app_cfg.force:
         message = "Filtering notebooks with changes... "
         nb_names = filter_changed(nb_names, cfg)
         if len(nb_names) == nbs_number:
@@ -75,18 +138,21 @@ def convert(
         rprint(message)
 
     if len(nb_names) == 0:
+        collect_garbage(Manifest.load(cfg), cfg)  # notebooks deleted
         rprint("No files with changes to convert!")
         sys.exit()
 
     if not app_cfg.silent_mode:
-        print(f"Files to convert from {nb_names[0].parent}:")
+        print(f"Files to convert from {app_cfg.nb_path}:")
         for fn in nb_names:
-            print(f"    {fn.name}")
+            print(f"    {fn.relative_to(path) if path.is_dir() else fn.name}")
         print(
             f"Destination directory: {app_cfg.dest_path},\nImage directory: {cfg.images_path}"
         )
 
-    convert2md(nb_names, cfg)
+    with profile_if(app_cfg.profile_out, app_cfg.profile_nb):
+        results = convert2md(nb_names, cfg, jobs=app_cfg.jobs)
+    report_timings(results, cfg, app_cfg.timings_out)
 
 
 def main(args: Optional[Sequence[str]] = None) -> None:
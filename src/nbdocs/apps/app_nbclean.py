@@ -5,9 +5,9 @@ from typing import Optional, Sequence
 from argparsecfg import field_argument, parse_args, ArgumentParserCfg
 from rich import print as rprint
 
-from nbdocs.clean import clean_nb_file
 from nbdocs.core import get_nb_names
 from nbdocs.cfg_tools import get_config
+from nbdocs.timings import print_memory
 
 
 parser_cfg = ArgumentParserCfg(
@@ -28,11 +28,24 @@ class AppConfig:
         action="store_false",
         help="Clean execution counts.",
     )
+    memory: bool = field_argument(
+        default=False,
+        action="store_true",
+        help="Trace memory of clean stages, print peak and retained memory.",
+    )
+    memory_budget: float = field_argument(
+        default=None,
+        flag="--memory-budget",
+        help="Memory budget for notebook, MB. Mark notebooks with bigger peak, enable memory.",
+    )
 
 
 def nbclean(app_cfg: AppConfig) -> None:
     """Clean Nb or notebooks at `nb_path` - metadata and execution counts from nbs."""
     cfg = get_config(notebooks_path=app_cfg.nb_path)
+    cfg.memory = cfg.memory or app_cfg.memory or app_cfg.memory_budget is not None
+    if app_cfg.memory_budget is not None:
+        cfg.memory_budget = app_cfg.memory_budget
 
     nb_names = get_nb_names(cfg.notebooks_path)
 
@@ -42,7 +55,13 @@ def nbclean(app_cfg: AppConfig) -> None:
 
     rprint(f"Clean: {cfg.notebooks_path}, found {num_nbs} notebooks.")
 
-    clean_nb_file(nb_names, app_cfg.clear_execution_count)
+    from nbdocs.clean import clean_nb_file  # pylint: disable=import-outside-toplevel
+
+    memory_usage = clean_nb_file(
+        nb_names, app_cfg.clear_execution_count, memory=cfg.memory
+    )
+    if cfg.memory:
+        print_memory(memory_usage, cfg.memory_budget)
 
 
 def main(args: Optional[Sequence[str]] = None) -> None:
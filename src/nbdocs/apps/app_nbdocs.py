@@ -12,9 +12,20 @@ from argparsecfg import (
 )
 from rich import print as rprint
 
-from nbdocs.convert import convert2md, filter_changed
+from nbdocs.convert import (
+    collect_garbage,
+    convert2md,
+    filter_changed,
+    gc_image_store,
+    remove_stale,
+)
+from nbdocs.changes import select_changed
 from nbdocs.core import get_nb_names
 from nbdocs.cfg_tools import get_config
+from nbdocs.profiling import profile_if
+from nbdocs.timings import report_timings
+from nbdocs.manifest import Manifest
+from nbdocs.watch import watch
 from nbdocs.default_settings import (
     NBDOCS_SETTINGS,
     MKDOCS_BASE,
@@ -34,6 +45,56 @@ class AppConfig:
         default=False,
         help="Force convert all notebooks.",
     )
+    jobs: int = field_argument(
+        "-j",
+        default=1,
+        help="Number of parallel jobs, 0 - use all cpu.",
+    )
+    recursive: bool = field_argument(
+        "-r",
+        default=False,
+        action="store_true",
+        help="Find notebooks at subdirectories, mirror tree at docs.",
+    )
+    timings: bool = field_argument(
+        default=False,
+        action="store_true",
+        help="Print time of conversion stages.",
+    )
+    timings_out: str = field_argument(
+        default=None,
+        flag="--timings-out",
+        help="Write timings to file as json lines, enable timings.",
+    )
+    profile_out: str = field_argument(
+        default=None,
+        flag="--profile-out",
+        help="Profile build with cProfile, write stats to file (.prof).",
+    )
+    profile_nb: str = field_argument(
+        default=None,
+        flag="--profile-nb",
+        help="Profile only notebooks matching glob patterns, comma separated.",
+    )
+    memory: bool = field_argument(
+        default=False,
+        action="store_true",
+        help="Trace memory of conversion stages, print peak and retained memory.",
+    )
+    memory_budget: float = field_argument(
+        default=None,
+        flag="--memory-budget",
+        help="Memory budget for notebook, MB. Mark notebooks with bigger peak, enable memory.",
+    )
+    since: str = field_argument(
+        default=None,
+        help="Convert only notebooks changed since git ref, no check for changes.",
+    )
+    files_from: str = field_argument(
+        default=None,
+        flag="--files-from",
+        help="Convert only notebooks listed at file, one per line, '-' - stdin.",
+    )
 
 
 def nbdocs(
@@ -41,13 +102,24 @@ def nbdocs(
 ) -> None:
     """NbDocs. Convert notebooks to docs. Default to .md"""
     cfg = get_config()
-    nb_names = get_nb_names(cfg.notebooks_path)
+    cfg.recursive = cfg.recursive or app_cfg.recursive
+    cfg.timings = cfg.timings or app_cfg.timings or app_cfg.timings_out is not None
+    cfg.memory = cfg.memory or app_cfg.memory or app_cfg.memory_budget is not None
+    if app_cfg.memory_budget is not None:
+        cfg.memory_budget = app_cfg.memory_budget
+    nb_names = get_nb_names(cfg.notebooks_path, cfg.recursive, cfg.ignore_patterns)
     nbs_number = len(nb_names)
     if nbs_number == 0:
+        collect_garbage(Manifest.load(cfg), cfg)  # notebooks deleted
         rprint("No files to convert!")
         sys.exit()
     rprint(f"Found {nbs_number} notebooks.")
-    if not app_cfg.force:
+    if app_cfg.since is not None or app_cfg.files_from is not None:
+        nb_names = select_changed(
+            nb_names, cfg.notebooks_path, app_cfg.since, app_cfg.files_from
+        )
+        rprint(f"Changed: {len(nb_names)} notebooks.")
+    elif not app_cfg.force:
         message = "Filtering notebooks with changes... "
         nb_names = filter_changed(nb_names, cfg)
         if len(nb_names) == nbs_number:
@@ -55,11 +127,14 @@ def nbdocs(
         rprint(message)
 
     if len(nb_names) == 0:
+        collect_garbage(Manifest.load(cfg), cfg)  # notebooks deleted
         rprint("No files to convert!")
         sys.exit()
 
     rprint(f"To convert: {len(nb_names)} notebooks.")
-    convert2md(nb_names, cfg)
+    with profile_if(app_cfg.profile_out, app_cfg.profile_nb):
+        results = convert2md(nb_names, cfg, jobs=app_cfg.jobs)
+    report_timings(results, cfg, app_cfg.timings_out)
 
 
 @dataclass
@@ -92,6 +167,74 @@ def setup(cfg: SetupCfg) -> None:
     rprint("Done.")
 
 
+@dataclass
+class WatchCfg:
+    interval: float = field_argument(
+        default=0.1,
+        help="Poll interval, seconds.",
+    )
+    debounce: float = field_argument(
+        default=0.1,
+        help="Wait for no new changes before convert, seconds.",
+    )
+
+
+def nbdocs_watch(watch_cfg: WatchCfg) -> None:
+    """Watch notebooks, convert changed."""
+    cfg = get_config()
+    watch(cfg, interval=watch_cfg.interval, debounce=watch_cfg.debounce)
+
+
+@dataclass
+class GcCfg:
+    dry_run: bool = field_argument(
+        "-n",
+        default=False,
+        flag="--dry-run",
+        action="store_true",
+        help="Only show files to remove.",
+    )
+
+
+def nbdocs_gc(gc_cfg: GcCfg) -> None:
+    """Remove files of deleted or renamed notebooks."""
+    cfg = get_config()
+    manifest = Manifest.load(cfg)
+    filenames = remove_stale(manifest, dry_run=gc_cfg.dry_run)
+    if cfg.image_store == "hash" and not gc_cfg.dry_run:
+        filenames.extend(gc_image_store(manifest, cfg))
+    for filename in filenames:
+        rprint(f"    {filename}")
+    action = "To remove" if gc_cfg.dry_run else "Removed"
+    rprint(f"{action}: {len(filenames)} files.")
+
+
+@dataclass
+class ServeCfg:
+    host: str = field_argument(
+        default="127.0.0.1",
+        help="Host to serve at.",
+    )
+    port: int = field_argument(
+        "-p",
+        default=8000,
+        help="Port to serve at.",
+    )
+    cache_size: int = field_argument(
+        default=256,
+        flag="--cache-size",
+        help="Size of rendered pages cache, MB.",
+    )
+
+
+def nbdocs_serve(serve_cfg: ServeCfg) -> None:
+    """Serve notebooks preview, render notebook on request."""
+    from nbdocs.serve import MB, serve  # pylint: disable=import-outside-toplevel
+
+    cfg = get_config()
+    serve(cfg, serve_cfg.host, serve_cfg.port, serve_cfg.cache_size * MB)
+
+
 def main(args: Optional[Sequence[str]] = None) -> None:
     parser = create_parser(parser_cfg)
     add_args_from_dc(parser, AppConfig)
@@ -101,11 +244,41 @@ def main(args: Optional[Sequence[str]] = None) -> None:
     )
     parser_init.set_defaults(command="init")
     add_args_from_dc(parser_init, SetupCfg)
+    parser_watch = subparsers.add_parser(
+        "watch",
+        help="Watch notebooks, convert on changes",
+        description="Watch notebooks, convert changed notebooks with warm converter.",
+    )
+    parser_watch.set_defaults(command="watch")
+    add_args_from_dc(parser_watch, WatchCfg)
+    parser_gc = subparsers.add_parser(
+        "gc",
+        help="Remove files of deleted notebooks",
+        description="Remove md files and images of deleted or renamed notebooks.",
+    )
+    parser_gc.set_defaults(command="gc")
+    add_args_from_dc(parser_gc, GcCfg)
+    parser_serve = subparsers.add_parser(
+        "serve",
+        help="Serve notebooks preview",
+        description="Local server, notebook rendered on first request, pages cached.",
+    )
+    parser_serve.set_defaults(command="serve")
+    add_args_from_dc(parser_serve, ServeCfg)
     parsed_args = parser.parse_args(args=args)
     if hasattr(parsed_args, "command"):
         if parsed_args.command == "init":
             setup_cfg = create_dc_obj(SetupCfg, parsed_args)
             setup(setup_cfg)
+        elif parsed_args.command == "watch":
+            watch_cfg = create_dc_obj(WatchCfg, parsed_args)
+            nbdocs_watch(watch_cfg)
+        elif parsed_args.command == "gc":
+            gc_cfg = create_dc_obj(GcCfg, parsed_args)
+            nbdocs_gc(gc_cfg)
+        elif parsed_args.command == "serve":
+            serve_cfg = create_dc_obj(ServeCfg, parsed_args)
+            nbdocs_serve(serve_cfg)
     else:
         app_cfg = create_dc_obj(AppConfig, parsed_args)
         nbdocs(app_cfg)
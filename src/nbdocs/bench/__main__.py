@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+from argparsecfg import ArgumentParserCfg, field_argument, parse_args
+
+from nbdocs.bench.corpus import CORPORA
+from nbdocs.bench.run import (
+    compare_results,
+    load_results,
+    print_comparison,
+    run_benchmarks,
+    save_results,
+)
+
+parser_cfg = ArgumentParserCfg(
+    description="NbDocs benchmarks on synthetic notebooks corpora."
+)
+
+
+@dataclass
+class BenchCfg:
+    out: str = field_argument(
+        "-o",
+        default="bench_results.json",
+        help="File to save results.",
+    )
+    corpora: str = field_argument(
+        default="",
+        help=f"Comma separated corpora names, default all: {', '.join(CORPORA)}.",
+    )
+    scale: float = field_argument(
+        default=1.0,
+        help="Scale number of notebooks and cells at corpora.",
+    )
+    repeat: int = field_argument(
+        "-r",
+        default=3,
+        help="Number of runs for each benchmark.",
+    )
+    compare: str = field_argument(
+        "-c",
+        default=None,
+        help="Results file to compare with.",
+    )
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    cfg = parse_args(BenchCfg, parser_cfg, args)
+    corpora = [name.strip() for name in cfg.corpora.split(",") if name.strip()]
+    results = run_benchmarks(corpora, cfg.scale, cfg.repeat)
+    save_results(results, Path(cfg.out))
+    print(f"Results saved to {cfg.out}")
+    if cfg.compare is not None:
+        print_comparison(compare_results(load_results(Path(cfg.compare)), results))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
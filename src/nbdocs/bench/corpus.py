@@ -0,0 +1,113 @@
+"""Synthetic notebooks corpora for benchmarks.
+Notebooks built with helpers from `nbdocs.tests.base`, content is deterministic.
+"""
+
+from __future__ import annotations
+
+import random
+from base64 import b64encode
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from nbformat import v4 as nbformat
+
+from nbdocs.core import write_nb
+from nbdocs.tests.base import (
+    create_code_cell,
+    create_markdown_cell,
+    create_nb_metadata,
+    create_test_outputs,
+)
+from nbdocs.typing import Cell, Nb, Output
+
+CELL_FLAGS = ["# hide", "# hide_input", "# hide_output", "# collapse_output"]
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Parameters of synthetic corpus."""
+
+    name: str
+    nbs: int  # number of notebooks
+    cells: int  # code cells per notebook, each followed by markdown cell
+    output_lines: int = 2  # lines of text output per code cell
+    images: int = 0  # png outputs per code cell
+    image_size: int = 1024  # bytes
+    flags: float = 0.0  # part of code cells with nbdocs flags
+
+    def scaled(self, scale: float) -> CorpusSpec:
+        """Return spec with number of notebooks and cells multiplied by scale."""
+        return replace(
+            self,
+            nbs=max(1, round(self.nbs * scale)),
+            cells=max(1, round(self.cells * scale)),
+        )
+
+
+CORPORA = {
+    spec.name: spec
+    for spec in (
+        CorpusSpec("many_small", nbs=200, cells=5),
+        CorpusSpec("few_huge", nbs=3, cells=1000),
+        CorpusSpec("image_heavy", nbs=20, cells=20, images=3, image_size=20_000),
+        CorpusSpec("output_heavy", nbs=20, cells=50, output_lines=200),
+        CorpusSpec("flag_heavy", nbs=50, cells=40, flags=1.0),
+    )
+}
+
+
+def create_outputs(spec: CorpusSpec, rnd: random.Random) -> list[Output]:
+    """Create outputs for code cell: base test outputs, text and images."""
+    outputs = create_test_outputs()
+    text = "".join(f"line {num}: {rnd.random()}\n" for num in range(spec.output_lines))
+    outputs.append(nbformat.new_output("stream", name="stdout", text=text))  # type: ignore
+    for _ in range(spec.images):
+        image = rnd.getrandbits(8 * spec.image_size).to_bytes(spec.image_size, "little")
+        data = b64encode(image).decode()
+        outputs.append(
+            nbformat.new_output("display_data", data={"image/png": data})  # type: ignore
+        )
+    return outputs
+
+
+def create_corpus_nb(spec: CorpusSpec, seed: int = 0) -> Nb:
+    """Create notebook for corpus.
+
+    Args:
+        spec (CorpusSpec): Corpus parameters.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        Nb: Notebook.
+    """
+    rnd = random.Random(seed)
+    cells: list[Cell] = []
+    for num in range(spec.cells):
+        source = f"x_{num} = {rnd.random()}\nprint(x_{num})"
+        if rnd.random() < spec.flags:
+            source = f"{rnd.choice(CELL_FLAGS)}\n{source}"
+        cells.append(create_code_cell(source, create_outputs(spec, rnd)))
+        cells.append(create_markdown_cell(f"## Cell {num}\nSome text, `x_{num}`."))
+    for num, cell in enumerate(cells):  # new cells get random id
+        if "id" in cell:
+            cell["id"] = f"cell-{num}"
+    nb = nbformat.new_notebook(cells=cells)
+    create_nb_metadata(nb, {"language_info": {"name": "python"}})  # type: ignore
+    return nb  # type: ignore
+
+
+def write_corpus(spec: CorpusSpec, path: Path) -> list[Path]:
+    """Write corpus notebooks to path.
+
+    Args:
+        spec (CorpusSpec): Corpus parameters.
+        path (Path): Directory for notebooks, created if not exists.
+
+    Returns:
+        List[Path]: Notebook filenames.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return [
+        write_nb(create_corpus_nb(spec, seed), path / f"{spec.name}_{seed}.ipynb")
+        for seed in range(spec.nbs)
+    ]
@@ -0,0 +1,61 @@
+"""Benchmark md_process_output_flag on large and whitespace-heavy outputs.
+
+Run: python -m nbdocs.bench.output_flag
+Time per MB must stay flat when size grows - processing is linear.
+"""
+
+import re
+import timeit
+from typing import Callable
+
+from nbdocs.process import (
+    OUTPUT_FLAG,
+    OUTPUT_FLAG_CLOSE,
+    OUTPUT_FLAG_COLLAPSE,
+    format_output,
+    format_output_close,
+    format_output_collapsed,
+    md_process_output_flag,
+)
+
+REGEX_MAX_WHITESPACE_SIZE = 250_000
+
+
+def md_process_output_flag_regex(md: str) -> str:
+    """Previous implementation - three regex passes."""
+    result = re.sub(r"\s*\#*output_flag_collapse\#*", format_output_collapsed, md)
+    result = re.sub(r"\s*\#*output_flag\#*", format_output, result)
+    return re.sub(rf"\#*{OUTPUT_FLAG_CLOSE}\#*", format_output_close, result)
+
+
+def create_md(size: int, whitespace: bool) -> str:
+    """Markdown with outputs of total `size` chars."""
+    output = (" " * 1000 if whitespace else "x = 1\n" * 160) + "\n"
+    block = f"\n    {OUTPUT_FLAG}{output}{OUTPUT_FLAG_CLOSE}\n"
+    block += f"\n    {OUTPUT_FLAG_COLLAPSE}{output}{OUTPUT_FLAG_CLOSE}\n"
+    return block * (size // len(block) + 1)
+
+
+def time_per_mb(func: Callable[[str], str], md: str, number: int = 3) -> float:
+    """Best time of `func` on `md`, seconds per MB."""
+    seconds = min(timeit.repeat(lambda: func(md), number=number, repeat=3))
+    return seconds / number / (len(md) / 1e6)
+
+
+def main() -> None:
+    print(f"{'kind':<12}{'size, MB':>10}{'single pass':>14}{'regex':>14}   (s/MB)")
+    for whitespace in (False, True):
+        for size in (250_000, 1_000_000, 4_000_000):
+            md = create_md(size, whitespace)
+            single_pass = time_per_mb(md_process_output_flag, md)
+            # regex quadratic at whitespace runs - too slow for large sizes.
+            regex = "-"
+            if not whitespace or size <= REGEX_MAX_WHITESPACE_SIZE:
+                assert md_process_output_flag(md) == md_process_output_flag_regex(md)
+                regex = f"{time_per_mb(md_process_output_flag_regex, md, 1):.4f}"
+            kind = "whitespace" if whitespace else "text"
+            print(f"{kind:<12}{len(md) / 1e6:>10.2f}{single_pass:>14.4f}{regex:>14}")
+
+
+if __name__ == "__main__":
+    main()
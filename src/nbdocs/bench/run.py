@@ -0,0 +1,226 @@
+"""Run benchmarks on synthetic corpora, save and compare results."""
+
+from __future__ import annotations
+
+import io
+import json
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import nbconvert
+import nbformat
+
+from nbdocs.bench.corpus import CORPORA, CorpusSpec, write_corpus
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.clean import clean_nb_file
+from nbdocs.convert import MdConverter, convert2md
+from nbdocs.core import read_nb
+from nbdocs.process import md_correct_image_link, md_process_output_flag
+from nbdocs.version import __version__
+
+RESULTS_VERSION = 1  # format of results file
+
+
+@dataclass
+class BenchResult:
+    """Timings of one benchmark on one corpus, seconds."""
+
+    corpus: str
+    bench: str
+    items: int  # processed notebooks or md strings
+    times: list[float] = field(default_factory=list)
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+
+def time_func(
+    func: Callable[[], Any],
+    repeat: int = 3,
+    setup: Callable[[], Any] | None = None,
+) -> list[float]:
+    """Return times of `repeat` runs of func. Setup, if given, run before each run, not timed.
+    Output of func suppressed."""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def bench_corpus(spec: CorpusSpec, path: Path, repeat: int = 3) -> list[BenchResult]:
+    """Run benchmarks on corpus.
+
+    Args:
+        spec (CorpusSpec): Corpus parameters.
+        path (Path): Temporary directory for corpus and results.
+        repeat (int, optional): Number of runs for each benchmark. Defaults to 3.
+
+    Returns:
+        List[BenchResult]: Results.
+    """
+    nb_names = write_corpus(spec, path / "nbs")
+    nbs = [read_nb(nb_fn) for nb_fn in nb_names]
+    md_converter = MdConverter()
+    raw_mds = [md_converter.md_exporter.from_notebook_node(nb)[0] for nb in nbs]
+    mds = [md_converter.nb2md(nb) for nb in nbs]
+    results: list[BenchResult] = []
+
+    def add(bench: str, items: int, func: Callable[[], Any], **kwargs: Any) -> None:
+        results.append(
+            BenchResult(spec.name, bench, items, time_func(func, repeat, **kwargs))
+        )
+
+    add("read_nb", len(nb_names), lambda: [read_nb(nb_fn) for nb_fn in nb_names])
+    add("nb2md", len(nbs), lambda: [md_converter.nb2md(nb) for nb in nbs])
+    add(
+        "md_process_output_flag",
+        len(raw_mds),
+        lambda: [md_process_output_flag(md) for md in raw_mds],
+    )
+
+    def correct_links() -> None:
+        for md, resources in mds:
+            for image_name in resources.get("image_names", ()):
+                md = md_correct_image_link(md, image_name, "images")
+
+    add("md_correct_image_link", len(mds), correct_links)
+    clean_path = path / "clean"
+
+    def copy_corpus() -> None:
+        shutil.rmtree(clean_path, ignore_errors=True)
+        shutil.copytree(path / "nbs", clean_path)
+
+    add(
+        "clean_nb_file",
+        len(nb_names),
+        lambda: clean_nb_file(sorted(clean_path.iterdir())),  # type: ignore
+        setup=copy_corpus,
+    )
+    cfg = NbDocsCfg(notebooks_path=str(path / "nbs"), docs_path=str(path / "docs"))
+
+    def clear_docs() -> None:
+        shutil.rmtree(cfg.docs_path, ignore_errors=True)
+
+    add(
+        "convert2md", len(nb_names), lambda: convert2md(nb_names, cfg), setup=clear_docs
+    )
+    return results
+
+
+def get_meta() -> dict[str, str]:
+    """Return versions and platform info for results."""
+    return {
+        "nbdocs": __version__,
+        "nbconvert": nbconvert.__version__,
+        "nbformat": nbformat.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run_benchmarks(
+    corpora: list[str] | None = None,
+    scale: float = 1.0,
+    repeat: int = 3,
+    verbose: bool = True,
+) -> dict[str, Any]:
+    """Run benchmarks on corpora.
+
+    Args:
+        corpora (List[str], optional): Names of corpora, see `CORPORA`. Defaults to None - all.
+        scale (float, optional): Scale number of notebooks and cells. Defaults to 1.0.
+        repeat (int, optional): Number of runs for each benchmark. Defaults to 3.
+        verbose (bool, optional): Print results. Defaults to True.
+
+    Returns:
+        Dict[str, Any]: Results, ready to save as json.
+    """
+    results: list[BenchResult] = []
+    if verbose:
+        print(f"{'corpus':<14}{'bench':<24}{'best':>10}{'median':>10}   (s)")
+    for name in corpora or list(CORPORA):
+        spec = CORPORA[name].scaled(scale)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            corpus_results = bench_corpus(spec, Path(tmp_dir), repeat)
+        if verbose:
+            for result in corpus_results:
+                print(
+                    f"{result.corpus:<14}{result.bench:<24}"
+                    f"{result.best:>10.4f}{result.median:>10.4f}"
+                )
+        results.extend(corpus_results)
+    return {
+        "version": RESULTS_VERSION,
+        "meta": get_meta(),
+        "scale": scale,
+        "results": [
+            {**asdict(result), "best": result.best, "median": result.median}
+            for result in results
+        ],
+    }
+
+
+def save_results(results: dict[str, Any], filename: Path) -> None:
+    """Save results to json file."""
+    with filename.open("w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=1)
+
+
+def load_results(filename: Path) -> dict[str, Any]:
+    """Load results from json file."""
+    with filename.open("r", encoding="utf-8") as fh:
+        return json.load(fh)  # type: ignore
+
+
+def compare_results(
+    base: dict[str, Any], new: dict[str, Any]
+) -> list[tuple[str, str, float, float, float]]:
+    """Compare best times of benchmarks present at both results.
+
+    Args:
+        base (Dict[str, Any]): Base results.
+        new (Dict[str, Any]): New results.
+
+    Returns:
+        List[Tuple[str, str, float, float, float]]: corpus, bench, base best, new best, ratio new / base.
+    """
+    base_best = {
+        (item["corpus"], item["bench"]): item["best"] for item in base["results"]
+    }
+    rows = []
+    for item in new["results"]:
+        key = (item["corpus"], item["bench"])
+        if key in base_best:
+            ratio = item["best"] / base_best[key] if base_best[key] else float("inf")
+            rows.append((*key, base_best[key], item["best"], ratio))
+    return rows
+
+
+def print_comparison(
+    rows: list[tuple[str, str, float, float, float]], threshold: float = 1.1
+) -> None:
+    """Print comparison, mark benchmarks slower more than threshold."""
+    print(f"{'corpus':<14}{'bench':<24}{'base':>10}{'new':>10}{'ratio':>8}")
+    for corpus, bench, base_best, new_best, ratio in rows:
+        mark = "  slower" if ratio > threshold else ""
+        print(
+            f"{corpus:<14}{bench:<24}{base_best:>10.4f}{new_best:>10.4f}{ratio:>8.2f}{mark}"
+        )
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from nbdocs.version import __version__
+
+
+class CellCache:
+    """Cache of rendered markdown fragments.
+    Fragments keyed by hash of cell after preprocessing,
+    on save only fragments used at last render are kept.
+    """
+
+    def __init__(self, fragments: dict[str, str] | None = None) -> None:
+        self.fragments = fragments or {}
+        self.used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        """Return fragment for key, None if not cached."""
+        fragment = self.fragments.get(key)
+        if fragment is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.used.add(key)
+        return fragment
+
+    def set(self, key: str, fragment: str) -> None:
+        """Put fragment to cache."""
+        self.fragments[key] = fragment
+        self.used.add(key)
+
+    @property
+    def changed(self) -> bool:
+        """True if fragments was added or some not used at last render."""
+        return self.misses > 0 or len(self.used) != len(self.fragments)
+
+    @classmethod
+    def load(cls, filename: Path) -> CellCache:
+        """Load cache from file, empty cache if no file, it broken or from other version."""
+        try:
+            with filename.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data["version"] == __version__:
+                return cls(data["fragments"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return cls()
+
+    def save(self, filename: Path) -> None:
+        """Save fragments used at last render to file."""
+        self.fragments = {key: self.fragments[key] for key in self.used}
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        tmp_name = filename.with_suffix(".tmp")
+        with tmp_name.open("w", encoding="utf-8") as fh:
+            json.dump({"version": __version__, "fragments": self.fragments}, fh)
+        os.replace(tmp_name, filename)
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import configparser
 from configparser import ConfigParser
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 
-from nbdocs.core import PathOrStr
+from nbdocs.typing import PathOrStr
+
+
+def str2bool(value: str) -> bool:
+    """Convert string value from config to bool."""
+    return value.strip().lower() in ("true", "yes", "on", "1")
 
 
 @dataclass
@@ -17,6 +22,36 @@ class NbDocsCfg:
     notebooks_path: str = "nbs"
     docs_path: str = "docs"
     images_path: str = "images"
+    # cache rendered cells between runs, at docs/.nbdocs/cells. Saves template render only,
+    # gain on partly changed notebooks small, first run slower - off by default.
+    cell_cache: bool = False
+    engine: str = "nbconvert"  # markdown renderer: nbconvert or native
+    recursive: bool = False  # find notebooks at subdirs, mirror tree at docs
+    ignore: str = ""  # comma separated glob patterns for notebooks and dirs to skip
+    image_store: str = "notebook"  # notebook: dir per nb, hash: content addressed
+    copy_strategy: str = "copy"  # copy images: copy, hardlink, reflink or auto
+    auto_gc: bool = False  # remove files of deleted notebooks after build
+    timings: bool = False  # record time of conversion stages
+    memory: bool = False  # trace memory of conversion stages
+    memory_budget: float = 0.0  # MB, flag notebooks with bigger peak, 0 - no budget
+
+    def __post_init__(self) -> None:
+        # values from ini config are strings, convert it to type of default value.
+        for cfg_field in fields(self):
+            value = getattr(self, cfg_field.name)
+            if not isinstance(value, str):
+                continue
+            if isinstance(cfg_field.default, bool):
+                setattr(self, cfg_field.name, str2bool(value))
+            elif isinstance(cfg_field.default, (int, float)):
+                setattr(self, cfg_field.name, type(cfg_field.default)(value))
+
+    @property
+    def ignore_patterns(self) -> list[str]:
+        """List of ignore glob patterns."""
+        return [
+            pattern.strip() for pattern in self.ignore.split(",") if pattern.strip()
+        ]
 
 
 # possible setting file names, section names to put config. If both exists first will be used.
@@ -0,0 +1,129 @@
+"""Select notebooks to convert from known changes: git diff or list of files.
+At CI changes known, no need to check notebooks against build manifest."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable
+
+from rich import print as rprint
+
+from nbdocs.typing import PathOrStr
+
+
+class GitError(Exception):
+    """Git command failed."""
+
+
+def run_git(args: list[str], cwd: PathOrStr, sep: str = "\n") -> list[str]:
+    """Run git command, return not empty items of output split by sep.
+    Use `-z` with sep `\0` for paths - no quoting of non-ascii names.
+
+    Raises:
+        GitError: If git not found or command failed.
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            encoding="utf-8",
+            errors="surrogateescape",
+            check=True,
+        )
+    except FileNotFoundError as err:
+        raise GitError("git not found") from err
+    except subprocess.CalledProcessError as err:
+        raise GitError(err.stderr.strip() or f"git {' '.join(args)} failed") from err
+    return [item for item in result.stdout.strip("\n").split(sep) if item]
+
+
+def git_changed(since: str, path: PathOrStr = ".") -> list[Path]:
+    """Return notebooks at path changed since git ref: committed, not committed and untracked.
+    Deleted notebooks not returned.
+
+    Args:
+        since (str): Git ref - commit, branch or tag, `origin/main`, `HEAD~3`.
+        path (PathOrStr, optional): Path at git repo to look for changes. Defaults to ".".
+
+    Raises:
+        GitError: If not git repo, unknown ref or git not found.
+
+    Returns:
+        List[Path]: Absolute filenames of changed notebooks.
+    """
+    path = Path(path).resolve()
+    cwd = path if path.is_dir() else path.parent
+    root = Path(run_git(["rev-parse", "--show-toplevel"], cwd)[0])
+    pathspec = ["--", str(path)]
+    changed = run_git(
+        ["diff", "-z", "--name-only", "--diff-filter=d", since, *pathspec], cwd, "\0"
+    )
+    changed += run_git(
+        ["ls-files", "-z", "--others", "--exclude-standard", "--full-name", *pathspec],
+        cwd,
+        "\0",
+    )
+    # names relative to repo root
+    return sorted({root / name for name in changed if name.endswith(".ipynb")})
+
+
+def read_files_list(source: str) -> list[Path]:
+    """Read filenames, one per line, from file or stdin if source is `-`.
+    Blank lines and lines starting with `#` skipped.
+
+    Args:
+        source (str): Filename or `-` for stdin.
+
+    Returns:
+        List[Path]: Absolute filenames.
+    """
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).read_text(encoding="utf-8").splitlines()
+    return [
+        Path(line).resolve()
+        for line in map(str.strip, lines)
+        if line and not line.startswith("#")
+    ]
+
+
+def select_nbs(nb_names: list[Path], changed: Iterable[Path]) -> list[Path]:
+    """Return notebooks from nb_names that are at changed, order of nb_names kept."""
+    changed = {fn.resolve() for fn in changed}
+    return [nb_fn for nb_fn in nb_names if nb_fn.resolve() in changed]
+
+
+def select_changed(
+    nb_names: list[Path],
+    nbs_path: PathOrStr,
+    since: str | None = None,
+    files_from: str | None = None,
+) -> list[Path]:
+    """Return notebooks changed since git ref or listed at files_from.
+
+    Args:
+        nb_names (List[Path]): Notebooks to select from.
+        nbs_path (PathOrStr): Notebooks path, to look for changes with git.
+        since (str, optional): Git ref. Defaults to None.
+        files_from (str, optional): File with list of filenames, `-` for stdin. Defaults to None.
+
+    Raises:
+        sys.exit: If git command failed.
+
+    Returns:
+        List[Path]: Selected notebooks.
+    """
+    changed: list[Path] = []
+    if since is not None:
+        try:
+            changed.extend(git_changed(since, nbs_path))
+        except GitError as err:
+            rprint(f"Git error: {err}")
+            sys.exit(1)
+    if files_from is not None:
+        changed.extend(read_files_list(files_from))
+    return select_nbs(nb_names, changed)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import nbformat
 from nbconvert.exporters.exporter import ResourcesDict
 from nbconvert.preprocessors.base import Preprocessor
@@ -7,6 +9,7 @@ from nbconvert.preprocessors.clearmetadata import ClearMetadataPreprocessor
 from rich.progress import track
 
 from nbdocs.core import PathOrStr, read_nb, write_nb
+from nbdocs.timings import create_timer
 from nbdocs.typing import Cell, CellAndResources, Nb, NbAndResources, TPreprocessor
 
 
@@ -128,20 +131,34 @@ def clean_nb_file(
     fn: PathOrStr | list[PathOrStr],
     clear_execution_count: bool = True,
     as_version: nbformat.Sentinel = nbformat.NO_CONVERT,
-) -> None:
+    memory: bool = False,
+) -> dict[Path, dict[str, tuple[int, int]]]:
     """Clean metadata and execution count from notebook.
 
     Args:
         fn (Union[str, PosixPath]): Notebook filename or list of names.
         as_version (int, optional): Nbformat version. Defaults to 4.
         clear_execution_count (bool, optional): Clean execution count. Defaults to True.
+        memory (bool, optional): Trace memory of stages. Defaults to False.
+
+    Returns:
+        Dict[Path, Dict[str, Tuple[int, int]]]: Memory peak and retained bytes
+            by stages for notebooks, empty if memory not traced.
     """
     cleaner = MetadataCleaner()
     if not isinstance(fn, list):
         fn = [fn]
+    memory_usage = {}
     for fn_item in track(fn, transient=True):
-        nb = read_nb(fn_item, as_version)
-        nb, resources = cleaner(nb, clear_execution_count=clear_execution_count)
-        if resources["changed"]:
-            write_nb(nb, fn_item, as_version)
-            print(f"done: {fn_item}")
+        with create_timer(memory=memory) as timer:
+            with timer.stage("read_nb"):
+                nb = read_nb(fn_item, as_version)
+            with timer.stage("clean"):
+                nb, resources = cleaner(nb, clear_execution_count=clear_execution_count)
+            if resources["changed"]:
+                with timer.stage("write"):
+                    write_nb(nb, fn_item, as_version)
+                print(f"done: {fn_item}")
+        if timer.memory:
+            memory_usage[Path(fn_item)] = timer.memory
+    return memory_usage
@@ -1,123 +1,635 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
-import nbconvert
-from nbconvert.exporters.exporter import ResourcesDict
 from rich.progress import track
 
-from nbdocs.core import read_nb
+from nbdocs.cache import CellCache
+from nbdocs.core import (
+    CopyStats,
+    bytes_hash,
+    file_hash,
+    get_md_name,
+    read_nb,
+    reads_nb,
+    write_if_changed,
+)
+from nbdocs.manifest import CELLS_CACHE_DIR, NBDOCS_DIR, Manifest
 from nbdocs.process import (
-    HideFlagsPreprocessor,
-    MarkOutputPreprocessor,
-    RemoveEmptyCellPreprocessor,
+    IMAGE_STORE_DIR,
+    IMAGE_STORES,
+    HashedFilesWriter,
+    OutputFilesWriter,
     copy_images,
-    md_correct_image_link,
-    md_find_image_names,
-    md_process_output_flag,
+    md_correct_image_links,
+    store_images,
 )
 from nbdocs.cfg_tools import NbDocsCfg
-from nbdocs.typing import Nb, TPreprocessor
+from nbdocs.profiling import get_profiler
+from nbdocs.timings import NullTimer, create_timer
+from nbdocs.typing import Nb, PathOrStr
+
+if TYPE_CHECKING:  # pragma: no cover
+    from nbdocs.exporter import MdConverter
+
+
+def __getattr__(name: str) -> object:
+    # MdConverter imported on access - nbconvert is slow to import.
+    if name == "MdConverter":
+        from nbdocs.exporter import (  # pylint: disable=import-outside-toplevel
+            MdConverter,
+        )
+
+        return MdConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def create_md_converter(engine: str = "nbconvert") -> MdConverter:
+    """Create markdown converter for engine.
+
+    Args:
+        engine (str, optional): "nbconvert" or "native". Defaults to "nbconvert".
+
+    Raises:
+        ValueError: If unknown engine.
+
+    Returns:
+        MdConverter: Markdown converter.
+    """
+    # pylint: disable=import-outside-toplevel
+    if engine == "nbconvert":
+        from nbdocs.exporter import MdConverter
+
+        return MdConverter()
+    if engine == "native":
+        from nbdocs.render import NativeMdConverter
+
+        return NativeMdConverter()  # type: ignore
+    raise ValueError(f"Unknown engine: {engine}, expected 'nbconvert' or 'native'.")
+
+
+@dataclass
+class NbConvertResult:
+    """Result of converting one notebook."""
+
+    nb_fn: Path
+    md_fn: Path | None = None
+    images: list[Path] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    nb_hash: str = ""
+    nb_stat: os.stat_result | None = None
+    written: int = 0  # artifacts written
+    unchanged: int = 0  # artifacts with same content, not rewritten
+    copy_stats: CopyStats = field(default_factory=CopyStats)  # copied images
+    timings: dict[str, float] = field(default_factory=dict)  # stage: seconds
+    memory: dict[str, tuple[int, int]] = field(default_factory=dict)  # peak, retained
+    skipped: bool = False  # not changed, not converted
+    error: BaseException | None = None  # conversion failed
+
+
+def get_cell_cache_name(nb_fn: Path, cfg: NbDocsCfg) -> Path:
+    """Return filename for rendered cells cache of notebook."""
+    cache_dir = Path(cfg.docs_path) / NBDOCS_DIR / CELLS_CACHE_DIR
+    return cache_dir / get_md_name(nb_fn, cfg.notebooks_path).with_suffix(".json")
+
+
+def get_image_store_path(cfg: NbDocsCfg) -> Path:
+    """Return path of content addressed images store."""
+    return Path(cfg.docs_path) / cfg.images_path / IMAGE_STORE_DIR
+
+
+def get_outputs_writer(nb_fn: Path, cfg: NbDocsCfg, md_path: Path) -> OutputFilesWriter:
+    """Return writer for output images, by `cfg.image_store`.
+
+    Raises:
+        ValueError: If unknown image store.
+    """
+    if cfg.image_store == "notebook":
+        return OutputFilesWriter(md_path / cfg.images_path / f"{nb_fn.stem}_files")
+    if cfg.image_store == "hash":
+        return HashedFilesWriter(get_image_store_path(cfg))
+    raise ValueError(
+        f"Unknown image_store: {cfg.image_store}, expected one of {IMAGE_STORES}."
+    )
+
+
+def get_image_link(filename: Path, md_path: Path) -> str:
+    """Return link to image file from markdown at `md_path`."""
+    return Path(os.path.relpath(filename, md_path)).as_posix()
+
+
+def process_md_images(
+    md: str,
+    image_names: set[str],
+    outputs: dict[str, Path],
+    cfg: NbDocsCfg,
+    result: NbConvertResult,
+) -> str:
+    """Correct image links at markdown, copy images linked at notebook.
+
+    Args:
+        md (str): Markdown.
+        image_names (Set[str]): Image names at markdown.
+        outputs (Dict[str, Path]): Output images, name: written filename.
+        cfg (NbDocsCfg): NbDocsCfg
+        result (NbConvertResult): Result, copied images and warnings added.
+
+    Returns:
+        str: Markdown with corrected links.
+    """
+    md_path = result.md_fn.parent  # type: ignore
+    image_links = {name: get_image_link(fn, md_path) for name, fn in outputs.items()}
+    image_names = image_names.difference(outputs)
+    copy_args = (cfg.copy_strategy, result.copy_stats)
+    if cfg.image_store == "hash":
+        stored, left = store_images(
+            image_names, result.nb_fn.parent, get_image_store_path(cfg), *copy_args
+        )
+        image_links.update(
+            (name, get_image_link(fn, md_path)) for name, fn in stored.items()
+        )
+        result.images.extend(stored.values())
+    else:
+        images_path = md_path / cfg.images_path
+        done, left = copy_images(
+            image_names, result.nb_fn.parent, images_path, *copy_args  # type: ignore
+        )
+        result.images.extend(images_path / Path(name).name for name in done)
+    result.unchanged += result.copy_stats.skipped
+    if left:
+        result.warnings.append(f"Not fixed image names in nb: {result.nb_fn}:")
+        result.warnings.extend(f"   {image_name}" for image_name in left)
+    return md_correct_image_links(md, image_links)
+
+
+def nb2md_file(
+    nb_fn: Path, cfg: NbDocsCfg, md_converter: MdConverter
+) -> NbConvertResult:
+    """Convert one notebook to markdown, write md file and images.
+
+    Args:
+        nb_fn (Path): Nb filename.
+        cfg (NbDocsCfg): NbDocsCfg
+        md_converter (MdConverter): Converter to use.
+
+    Returns:
+        NbConvertResult: Result with md filename and warnings.
+    """
+    with create_timer(cfg.timings, cfg.memory) as timer:
+        result = _nb2md_file(nb_fn, cfg, md_converter, timer)
+    result.timings = timer.stages
+    result.memory = timer.memory
+    return result
+
+
+def _nb2md_file(
+    nb_fn: Path, cfg: NbDocsCfg, md_converter: MdConverter, timer: NullTimer
+) -> NbConvertResult:
+    """Convert one notebook to markdown, record stages at timer."""
+    with timer.stage("hash"):
+        result = NbConvertResult(nb_fn, nb_stat=nb_fn.stat(), nb_hash=file_hash(nb_fn))
+    with timer.stage("read_nb"):  # parse and validate
+        nb = read_nb(nb_fn)
+    result.md_fn = Path(cfg.docs_path) / get_md_name(nb_fn, cfg.notebooks_path)
+    md_path = result.md_fn.parent  # images links relative to md file
+    # output images written to dest as extracted
+    outputs = get_outputs_writer(nb_fn, cfg, md_path)
+    resources = {"filename": nb_fn, "outputs": outputs}
+    cell_cache = None
+    if cfg.cell_cache:
+        cell_cache_name = get_cell_cache_name(nb_fn, cfg)
+        with timer.stage("cell_cache"):
+            cell_cache = CellCache.load(cell_cache_name)
+    md, resources = md_converter.nb2md(nb, resources, cell_cache, timer)
+    if cell_cache is not None and cell_cache.changed:
+        with timer.stage("cell_cache"):
+            cell_cache.save(cell_cache_name)
+    result.images.extend(outputs.values())
+
+    if image_names := resources.get("image_names"):
+        with timer.stage("images"):
+            md = process_md_images(md, image_names, outputs, cfg, result)
+
+    with timer.stage("write"):
+        md_path.mkdir(parents=True, exist_ok=True)
+        if not write_if_changed(result.md_fn, md.encode("utf-8")):
+            result.unchanged += 1
+    result.unchanged += outputs.unchanged
+    result.written = len(result.images) + 1 - result.unchanged
+    return result
 
 
-class MdConverter:
-    """MdConverter constructor."""
+@dataclass
+class MdResult:
+    """Result of in memory conversion, nothing written to disk."""
 
-    def __init__(self) -> None:
-        self.md_exporter: TPreprocessor = nbconvert.MarkdownExporter()
-        self.md_exporter.register_preprocessor(
-            RemoveEmptyCellPreprocessor, enabled=True
+    md: str
+    images: dict[str, bytes] = field(default_factory=dict)  # path relative to md
+    warnings: list[str] = field(default_factory=list)
+
+
+def get_image_path(name: str, data: bytes, cfg: NbDocsCfg, images_dir: str) -> str:
+    """Return path of image relative to md file, by `cfg.image_store`,
+    same layout as images written by `nb2md_file` for md at docs root.
+
+    Args:
+        name (str): Image name, output name or link at markdown.
+        data (bytes): Image content.
+        cfg (NbDocsCfg): NbDocsCfg
+        images_dir (str): Dir for images at `cfg.images_path`, used with notebook store.
+
+    Returns:
+        str: Posix path.
+    """
+    if cfg.image_store == "hash":
+        return (
+            f"{cfg.images_path}/{IMAGE_STORE_DIR}/{bytes_hash(data)}{Path(name).suffix}"
         )
-        self.md_exporter.register_preprocessor(HideFlagsPreprocessor, enabled=True)
-        self.md_exporter.register_preprocessor(MarkOutputPreprocessor, enabled=True)
-
-    def nb2md(
-        self, nb: Nb, resources: ResourcesDict | None = None
-    ) -> tuple[str, ResourcesDict]:
-        """Base convert Nb to Markdown"""
-        md, result_resources = self.md_exporter.from_notebook_node(nb, resources)
-        md = md_process_output_flag(md)
-        if image_names := md_find_image_names(md):
-            result_resources["image_names"] = image_names
-        return md, result_resources
-
-    def __call__(
-        self, nb: Nb, resources: ResourcesDict | None = None
-    ) -> tuple[str, ResourcesDict]:
-        """MdConverter call - export given Nb to Md.
-
-        Args:
-            nb (Notebook): Nb to convert.
-
-        Returns:
-            Tuple[str, ResourcesDict]: Md, resources
-        """
-        return self.nb2md(nb, resources)
-
-
-def convert2md(filenames: Path | list[Path], cfg: NbDocsCfg) -> None:
+    return (Path(cfg.images_path) / images_dir / Path(name).name).as_posix()
+
+
+def nb2md_memory(
+    nb: Nb | bytes | str,
+    cfg: NbDocsCfg | None = None,
+    name: str = "notebook",
+    source_path: PathOrStr | None = None,
+    md_converter: MdConverter | None = None,
+) -> MdResult:
+    """Convert notebook to markdown in memory: return markdown with corrected
+    image links and images content. Nothing written to disk.
+
+    Args:
+        nb (Union[Nb, bytes, str]): Notebook or notebook content.
+        cfg (NbDocsCfg, optional): Config, `image_store` and `images_path` used.
+            Defaults to None - default config.
+        name (str, optional): Notebook name, output images put to `<name>_files`.
+            Defaults to "notebook".
+        source_path (PathOrStr, optional): Directory to read images linked at
+            markdown cells. Defaults to None - links not changed.
+        md_converter (MdConverter, optional): Converter to use, keep it for many calls.
+            If None - new one created. Defaults to None.
+
+    Returns:
+        MdResult: Markdown, images: path relative to md - content.
+    """
+    cfg = cfg or NbDocsCfg()
+    if isinstance(nb, (bytes, str)):
+        nb = reads_nb(nb)
+    md_converter = md_converter or create_md_converter(cfg.engine)
+    md, resources = md_converter.nb2md(nb, {"outputs": {}})
+    result = MdResult(md)
+    image_links: dict[str, str] = {}
+    for image_name, data in resources["outputs"].items():
+        image_links[image_name] = get_image_path(image_name, data, cfg, f"{name}_files")
+        result.images[image_links[image_name]] = data
+    left = set(resources.get("image_names", ())).difference(image_links)
+    if source_path is not None:  # same as `process_md_images`
+        for image_name in sorted(left):
+            image_fn = Path(source_path) / image_name
+            if image_fn.is_file():
+                left.discard(image_name)
+                data = image_fn.read_bytes()
+                image_path = get_image_path(image_name, data, cfg, "")
+                result.images[image_path] = data
+                if cfg.image_store == "hash":  # links to copied images not changed
+                    image_links[image_name] = image_path
+    if left:
+        result.warnings.append(f"Not fixed image names in nb: {name}:")
+        result.warnings.extend(f"   {image_name}" for image_name in sorted(left))
+    result.md = md_correct_image_links(md, image_links)
+    return result
+
+
+# Converter at worker process, created once per worker by `_init_worker`.
+_worker_md_converter: MdConverter | None = None
+
+
+def _init_worker(engine: str = "nbconvert") -> None:
+    """Create warm MdConverter at worker process."""
+    global _worker_md_converter  # pylint: disable=global-statement
+    _worker_md_converter = create_md_converter(engine)
+
+
+def _worker_nb2md_file(nb_fn: Path, cfg: NbDocsCfg) -> NbConvertResult:
+    """Convert notebook at worker process."""
+    if _worker_md_converter is None:  # pragma: no cover
+        _init_worker(cfg.engine)
+    return nb2md_file(nb_fn, cfg, _worker_md_converter)  # type: ignore
+
+
+def get_jobs_number(jobs: int | None, nbs_number: int) -> int:
+    """Return number of worker processes to use.
+    If `jobs` is None or less than 1 - use number of cpu.
+    Not more than number of notebooks.
+    """
+    if jobs is None or jobs < 1:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, nbs_number))
+
+
+def iter_serial(
+    filenames: list[Path],
+    cfg: NbDocsCfg,
+    md_converter: MdConverter,
+) -> Iterator[NbConvertResult]:
+    """Convert notebooks one by one at current process, yield results.
+    Failed notebooks yielded with `error`.
+
+    Args:
+        filenames (List[Path]): List of Nb filenames
+        cfg (NbDocsCfg): NbDocsCfg
+        md_converter (MdConverter): Converter to use.
+
+    Yields:
+        Iterator[NbConvertResult]: Results, at filenames order.
+    """
+    profiler = get_profiler()
+    convert_nb = (
+        nb2md_file if profiler is None else partial(profiler.convert, nb2md_file)
+    )
+    for nb_fn in filenames:
+        try:
+            result = convert_nb(nb_fn, cfg, md_converter)
+        except Exception as exc:  # pylint: disable=broad-except
+            result = NbConvertResult(nb_fn, error=exc)
+        yield result
+
+
+def iter_parallel(
+    filenames: list[Path],
+    cfg: NbDocsCfg,
+    jobs: int,
+) -> Iterator[NbConvertResult]:
+    """Convert notebooks at process pool, each worker keep warm MdConverter.
+    Results yielded as completed, failed notebooks yielded with `error`.
+
+    Args:
+        filenames (List[Path]): List of Nb filenames
+        cfg (NbDocsCfg): NbDocsCfg
+        jobs (int): Number of worker processes.
+
+    Yields:
+        Iterator[NbConvertResult]: Results, at order of completion.
+    """
+    with ProcessPoolExecutor(
+        jobs, initializer=_init_worker, initargs=(cfg.engine,)
+    ) as executor:
+        futures = {
+            executor.submit(_worker_nb2md_file, nb_fn, cfg): nb_fn
+            for nb_fn in filenames
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                result = NbConvertResult(futures[future], error=exc)
+            yield result
+
+
+def convert_iter(
+    filenames: Path | list[Path],
+    cfg: NbDocsCfg,
+    jobs: int | None = 1,
+    md_converter: MdConverter | None = None,
+    force: bool = True,
+) -> Iterator[NbConvertResult]:
+    """Convert notebooks to markdown, yield result for each notebook as soon as it done.
+    Nothing printed. Build manifest updated for converted notebooks and saved when
+    generator finished or closed.
+
+    Args:
+        filenames (List[Path]): List of Nb filenames
+        cfg (NbDocsCfg): NbDocsCfg
+        jobs (int, optional): Number of worker processes.
+            If None or 0 - use number of cpu. Defaults to 1.
+        md_converter (MdConverter, optional): Converter to use at serial mode.
+            If None - new one created. Defaults to None.
+        force (bool, optional): Convert all notebooks. If False - notebooks without
+            changes yielded first with `skipped`. Defaults to True.
+
+    Yields:
+        Iterator[NbConvertResult]: Results, failed notebooks with `error`.
+
+    Example:
+        >>> for result in convert_iter(nb_names, cfg, jobs=4):  # doctest: +SKIP
+        ...     if result.error is None and not result.skipped:
+        ...         upload(result.md_fn, result.images)
+    """
+    if not isinstance(filenames, list):
+        filenames = [filenames]
+    if not force:
+        changed = filter_changed(filenames, cfg)
+        changed_set = set(changed)
+        for nb_fn in filenames:
+            if nb_fn not in changed_set:
+                yield NbConvertResult(nb_fn, skipped=True)
+        filenames = changed
+    Path(cfg.docs_path).mkdir(exist_ok=True, parents=True)
+    if get_profiler() is not None:  # profile at current process
+        jobs = 1
+    jobs = get_jobs_number(jobs, len(filenames))
+    if jobs == 1:
+        md_converter = md_converter or create_md_converter(cfg.engine)
+        results = iter_serial(filenames, cfg, md_converter)
+    else:
+        results = iter_parallel(filenames, cfg, jobs)
+    manifest = Manifest.load(cfg)
+    try:
+        for result in results:
+            if result.error is None:
+                update_manifest(manifest, result)
+            yield result
+    finally:
+        manifest.save()
+
+
+def convert2md(
+    filenames: Path | list[Path],
+    cfg: NbDocsCfg,
+    jobs: int | None = 1,
+    md_converter: MdConverter | None = None,
+) -> list[NbConvertResult]:
     """Convert notebooks to markdown.
+    Print warnings and counters, remove files not used after build.
 
     Args:
         filenames (List[Path]): List of Nb filenames
         cfg (NbDocsCfg): NbDocsCfg
+        jobs (int, optional): Number of worker processes.
+            If None or 0 - use number of cpu. Defaults to 1.
+        md_converter (MdConverter, optional): Converter to use at serial mode.
+            If None - new one created. Defaults to None.
+
+    Returns:
+        List[NbConvertResult]: Results of converted notebooks, at filenames order.
     """
     if not isinstance(filenames, list):
         filenames = [filenames]
-    docs_path = Path(cfg.docs_path)
-    docs_path.mkdir(exist_ok=True, parents=True)
-    md_convertor = MdConverter()
-    for nb_fn in track(filenames):
-        nb = read_nb(nb_fn)
-        resources = ResourcesDict(filename=nb_fn)
-        md, resources = md_convertor.nb2md(nb, resources)
-
-        if image_names := resources["image_names"]:
-            # dest_images = Path(cfg.docs_path) / cfg.images_path / f"{nb_fn.stem}_files"
-            dest_images = f"{cfg.images_path}/{nb_fn.stem}_files"
-            (docs_path / dest_images).mkdir(exist_ok=True, parents=True)
-
-            if len(resources["outputs"]) > 0:  # process outputs images
-                for image_name, image_data in resources["outputs"].items():
-                    md = md_correct_image_link(md, image_name, dest_images)
-                    with open(docs_path / dest_images / image_name, "wb") as fh:
-                        fh.write(image_data)
-                    image_names.discard(image_name)
-
-            # for image_name in image_names:  # process images at cells source
-            #     md = md_correct_image_link(md, image_name, f"../{cfg.notebooks_path}")
-            _done, left = copy_images(
-                image_names, nb_fn.parent, docs_path / cfg.images_path
-            )
-            # for image_name in done:
-            #     md = md_correct_image_link(md, image_name, cfg.images_path)
-            if left:
-                print(f"Not fixed image names in nb: {nb_fn}:")
-                for image_name in left:
-                    print(f"   {image_name}")
-
-        with open(
-            Path(cfg.docs_path) / nb_fn.with_suffix(".md").name, "w", encoding="utf-8"
-        ) as fh:
-            fh.write(md)
-
-
-def nb_newer(nb_name: Path, docs_path: Path) -> bool:
+    results = {
+        result.nb_fn: result
+        for result in track(
+            convert_iter(filenames, cfg, jobs, md_converter), total=len(filenames)
+        )
+    }
+    ordered = [results[nb_fn] for nb_fn in filenames if nb_fn in results]
+    errors = [result for result in ordered if result.error is not None]
+    ordered = [result for result in ordered if result.error is None]
+    report_results(ordered)
+    # Failed notebook may have written new artifacts not recorded at manifest,
+    # gc could remove files they use - skipped until build without errors.
+    if not errors:
+        collect_garbage(Manifest.load(cfg), cfg)
+
+    if errors:
+        for result in errors:
+            print(f"Error converting nb: {result.nb_fn}: {result.error!r}")
+        raise errors[0].error  # type: ignore
+    return ordered
+
+
+def report_results(results: list[NbConvertResult]) -> None:
+    """Print warnings and counters of written and copied files."""
+    written = unchanged = 0
+    copy_stats = CopyStats()
+    for result in results:
+        for line in result.warnings:
+            print(line)
+        written += result.written
+        unchanged += result.unchanged
+        copy_stats.update(result.copy_stats)
+    print(f"Artifacts written: {written}, unchanged: {unchanged}.")
+    if copy_stats.bytes_avoided:
+        print(
+            f"Images copy avoided: {copy_stats.bytes_avoided} bytes"
+            f" ({copy_stats.skipped} same, {copy_stats.linked} linked)."
+        )
+
+
+def collect_garbage(manifest: Manifest, cfg: NbDocsCfg) -> None:
+    """Remove files not used after build: with `auto_gc` - artifacts of
+    deleted notebooks, with hash image store - unused images.
+    Called by `convert2md` after build without errors and by apps when nothing to convert."""
+    if cfg.auto_gc:
+        if removed := remove_stale(manifest):
+            print(f"Removed {len(removed)} files of deleted notebooks.")
+    if cfg.image_store == "hash":
+        if removed := gc_image_store(manifest, cfg):
+            print(f"Removed {len(removed)} unused images from store.")
+
+
+def remove_empty_dirs(filenames: list[Path], root: Path) -> None:
+    """Remove empty parent dirs of filenames, up to root."""
+    root = root.absolute()
+    for filename in filenames:
+        path = filename.parent.absolute()
+        while path != root and root in path.parents:
+            try:
+                path.rmdir()
+            except OSError:  # not empty or not exists
+                break
+            path = path.parent
+
+
+def remove_stale(manifest: Manifest, dry_run: bool = False) -> list[Path]:
+    """Remove artifacts of notebooks deleted or renamed since conversion.
+    Notebooks and artifacts listed at build manifest, so no conversion or
+    docs scan needed. Artifacts shared with existing notebooks kept.
+
+    Args:
+        manifest (Manifest): Build manifest, stale entries removed and manifest saved.
+        dry_run (bool, optional): Only return files to remove. Defaults to False.
+
+    Returns:
+        List[Path]: Removed files.
+    """
+    stale_keys = manifest.stale_keys()
+    cells_cache_path = manifest.docs_path / NBDOCS_DIR / CELLS_CACHE_DIR
+    filenames = [
+        manifest.docs_path / name
+        for name in sorted(manifest.orphan_artifacts(stale_keys))
+    ]
+    filenames.extend(
+        cells_cache_path / Path(key).with_suffix(".json") for key in stale_keys
+    )
+    filenames = [filename for filename in filenames if filename.exists()]
+    if not dry_run:
+        for filename in filenames:
+            filename.unlink()
+        remove_empty_dirs(filenames, manifest.docs_path)
+        manifest.remove(stale_keys)
+        if manifest.changed:
+            manifest.save()
+    return filenames
+
+
+def gc_image_store(manifest: Manifest, cfg: NbDocsCfg) -> list[Path]:
+    """Remove images from content addressed store not referenced at manifest.
+
+    Args:
+        manifest (Manifest): Build manifest with artifacts of all notebooks.
+        cfg (NbDocsCfg): NbDocsCfg
+
+    Returns:
+        List[Path]: Removed files.
+    """
+    store_path = get_image_store_path(cfg)
+    referenced = manifest.artifacts()
+    removed: list[Path] = []
+    try:
+        entries = os.scandir(store_path)
+    except OSError:
+        return removed
+    with entries:
+        for entry in entries:
+            filename = store_path / entry.name
+            if entry.is_file() and manifest.relative(filename) not in referenced:
+                filename.unlink()
+                removed.append(filename)
+    return removed
+
+
+def update_manifest(manifest: Manifest, result: NbConvertResult) -> None:
+    """Record converted notebook and its artifacts at build manifest."""
+    if result.md_fn is not None and result.nb_stat is not None:
+        manifest.update(
+            manifest.relative(result.md_fn),
+            result.nb_fn,
+            result.nb_hash,
+            result.nb_stat,
+            [result.md_fn, *result.images],
+        )
+
+
+def nb_newer(nb_name: Path, docs_path: Path, nbs_path: PathOrStr | None = None) -> bool:
     """return True if nb_name is newer than docs_path."""
-    md_name = (docs_path / nb_name.name).with_suffix(".md")
+    md_name = docs_path / get_md_name(nb_name, nbs_path)
     return not md_name.exists() or nb_name.stat().st_mtime > md_name.stat().st_mtime
 
 
 def filter_changed(nb_names: list[Path], cfg: NbDocsCfg) -> list[Path]:
-    """Filter list of Nb to changed only (compare modification date with dest name).
+    """Filter list of Nb to changed only.
+    Compare content hash of notebooks and config with records at build manifest.
 
     Args:
         nb_names (List[Path]): List of Nb filenames.
-        dest (Path, optional): Destination folder for md files.
-            If not given default from settings. Defaults to None.
+        cfg (NbDocsCfg): NbDocsCfg, manifest loaded from `cfg.docs_path`.
 
     Returns:
-        List[Path]: List of Nb filename with newer modification time.
+        List[Path]: List of Nb filename with changes.
     """
-    docs_path = Path(cfg.docs_path)
-    return [nb_name for nb_name in nb_names if nb_newer(nb_name, docs_path)]
+    manifest = Manifest.load(cfg)
+    changed = [
+        nb_name
+        for nb_name in nb_names
+        if manifest.is_changed(
+            get_md_name(nb_name, cfg.notebooks_path).as_posix(), nb_name
+        )
+    ]
+    if manifest.changed:  # stat updated for notebooks with same content
+        manifest.save()
+    return changed
@@ -1,43 +1,83 @@
 from __future__ import annotations
 
+import errno
+import json
+import os
+import re
+import shutil
 import sys
+from dataclasses import dataclass
+from fnmatch import translate
+from hashlib import blake2b
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+from uuid import uuid4
 
-import nbformat
 from rich import print as rprint
 
 from nbdocs.typing import Nb, PathOrStr
 
+if TYPE_CHECKING:  # pragma: no cover
+    from nbformat import Sentinel
 
-def read_nb(fn: PathOrStr, as_version: nbformat.Sentinel = nbformat.NO_CONVERT) -> Nb:
+
+def read_nb(fn: PathOrStr, as_version: int | Sentinel | None = None) -> Nb:
     """Read notebook from filename.
 
     Args:
         fn (Union[str, PosixPath): Notebook filename.
-        as_version (int, optional): Version of notebook. Defaults to None, convert from 4.
+        as_version (int, optional): Version of notebook. Defaults to None - no convert.
 
     Returns:
         Notebook: Jupyter Notebook]
     """
+    import nbformat  # pylint: disable=import-outside-toplevel
+
+    if as_version is None:
+        as_version = nbformat.NO_CONVERT
     with Path(fn).open("r", encoding="utf-8") as fh:
         nb: Nb = nbformat.read(fh, as_version=as_version)  # type: ignore
     return nb
 
 
+def reads_nb(data: bytes | str, as_version: int | Sentinel | None = None) -> Nb:
+    """Read notebook from string or bytes.
+
+    Args:
+        data (Union[bytes, str]): Notebook content, json.
+        as_version (int, optional): Version of notebook. Defaults to None - no convert.
+
+    Returns:
+        Notebook: Jupyter Notebook
+    """
+    import nbformat  # pylint: disable=import-outside-toplevel
+
+    if as_version is None:
+        as_version = nbformat.NO_CONVERT
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    nb: Nb = nbformat.reads(data, as_version=as_version)  # type: ignore
+    return nb
+
+
 def write_nb(
     nb: Nb,
     fn: PathOrStr,
-    as_version: nbformat.Sentinel = nbformat.NO_CONVERT,
+    as_version: int | Sentinel | None = None,
 ) -> Path:
     """Write notebook to file
 
     Args:
         nb (Notebook): Notebook to write
         fn (Union[str, PosixPath]): filename to write
-        as_version (_type_, optional): Nbformat version. Defaults to nbformat.NO_CONVERT.
+        as_version (_type_, optional): Nbformat version. Defaults to None - no convert.
     Returns:
         Path: Filename of writed Nb.
     """
+    import nbformat  # pylint: disable=import-outside-toplevel
+
+    if as_version is None:
+        as_version = nbformat.NO_CONVERT
     filename = Path(fn)
     if filename.suffix != ".ipynb":
         filename = filename.with_suffix(".ipynb")
@@ -46,11 +86,63 @@ def write_nb(
     return filename
 
 
-def get_nb_names(nb_path: PathOrStr | None = None) -> list[Path]:
+def get_ignore_re(ignore: Sequence[str]) -> re.Pattern[str] | None:
+    """Compile ignore glob patterns to one regex. None if no patterns."""
+    if not ignore:
+        return None
+    return re.compile("|".join(translate(pattern) for pattern in ignore))
+
+
+def iter_nb_entries(
+    path: Path,
+    recursive: bool = False,
+    ignore: Sequence[str] = (),
+) -> Iterator[tuple[Path, os.DirEntry[str]]]:
+    """Walk `path` with `os.scandir`, yield notebook filenames and dir entries.
+    Hidden directories (`.ipynb_checkpoints`, `.git`) skipped.
+    Ignore patterns matched with name and path relative to `path`.
+
+    Args:
+        path (Path): Path to scan.
+        recursive (bool, optional): Scan subdirectories. Defaults to False.
+        ignore (Sequence[str], optional): Glob patterns to skip files and dirs. Defaults to ().
+
+    Yields:
+        Iterator[Tuple[Path, os.DirEntry]]: Notebook filename, dir entry.
+    """
+    re_ignore = get_ignore_re(ignore)
+    dirs = [(path, "")]
+    while dirs:
+        dir_path, rel_dir = dirs.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel_name = f"{rel_dir}{entry.name}"
+                if re_ignore is not None and (
+                    re_ignore.match(entry.name) or re_ignore.match(rel_name)
+                ):
+                    continue
+                if entry.is_dir():
+                    if recursive and not entry.name.startswith("."):
+                        dirs.append((dir_path / entry.name, f"{rel_name}/"))
+                elif entry.name.endswith(".ipynb"):
+                    yield dir_path / entry.name, entry
+
+
+def get_nb_names(
+    nb_path: PathOrStr | None = None,
+    recursive: bool = False,
+    ignore: Sequence[str] = (),
+) -> list[Path]:
     """Return list of notebooks from `path`. If no `path` return notebooks from current folder.
 
     Args:
         nb_path (Union[Path, str, None]): Path for nb or folder with notebooks.
+        recursive (bool, optional): Find notebooks at subdirectories. Defaults to False.
+        ignore (Sequence[str], optional): Glob patterns to skip files and dirs. Defaults to ().
 
     Raises:
         sys.exit: If filename or dir not exists or not nb file.
@@ -65,10 +157,240 @@ def get_nb_names(nb_path: PathOrStr | None = None) -> list[Path]:
         sys.exit()
 
     if path.is_dir():
-        return list(path.glob("*.ipynb"))
+        return sorted(nb_fn for nb_fn, _ in iter_nb_entries(path, recursive, ignore))
 
     if path.suffix != ".ipynb":
         rprint(f"Nb extension must be .ipynb, but got: {path.suffix}")
         sys.exit()
 
     return [path]
+
+
+def get_md_name(nb_fn: Path, nbs_path: PathOrStr | None = None) -> Path:
+    """Return markdown filename for notebook, relative to docs path.
+    If notebook at `nbs_path` tree, md name mirror it path at the tree.
+
+    Args:
+        nb_fn (Path): Notebook filename.
+        nbs_path (Union[Path, str, None], optional): Root of notebooks tree. Defaults to None.
+
+    Returns:
+        Path: Md filename.
+    """
+    if nbs_path is not None and Path(nbs_path).is_dir():
+        try:
+            return nb_fn.relative_to(nbs_path).with_suffix(".md")
+        except ValueError:  # not at nbs_path
+            pass
+    return Path(nb_fn.with_suffix(".md").name)
+
+
+def file_hash(fn: PathOrStr, chunk_size: int = 1 << 20) -> str:
+    """Return content hash of file.
+
+    Args:
+        fn (Union[str, PosixPath]): Filename.
+        chunk_size (int, optional): Size of chunk to read. Defaults to 1Mb.
+
+    Returns:
+        str: Hex digest.
+    """
+    hasher = blake2b(digest_size=16)
+    with Path(fn).open("rb") as fh:
+        while chunk := fh.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def bytes_hash(data: bytes) -> str:
+    """Return content hash of data, same as `file_hash` for file with this data.
+
+    Returns:
+        str: Hex digest.
+    """
+    return blake2b(data, digest_size=16).hexdigest()
+
+
+def hash_json(*items: Any) -> str:
+    """Return hash of items, serialized to json.
+
+    Returns:
+        str: Hex digest.
+    """
+    return blake2b(
+        json.dumps(items, sort_keys=True, default=str).encode(), digest_size=16
+    ).hexdigest()
+
+
+class FileHashes:
+    """Content hashes of files, hash recalculated only if file stat changed."""
+
+    def __init__(self) -> None:
+        self._hashes: dict[Path, tuple[tuple[int, int], str]] = {}  # fn: stat, hash
+
+    def hash(self, fn: Path) -> str:
+        """Return content hash of file, same as `file_hash`."""
+        stat = fn.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if fn not in self._hashes or self._hashes[fn][0] != key:
+            self._hashes[fn] = (key, file_hash(fn))
+        return self._hashes[fn][1]
+
+
+def write_if_changed(fn: Path, data: bytes) -> bool:
+    """Write data to file if file not exists or content differs.
+    Compare size first, content read only if size same. Unchanged file keep mtime.
+
+    Args:
+        fn (Path): Filename.
+        data (bytes): Content to write.
+
+    Returns:
+        bool: True if file written.
+    """
+    try:
+        same_size = fn.stat().st_size == len(data)
+    except OSError:  # no file
+        same_size = False
+    if same_size and fn.read_bytes() == data:
+        return False
+    with fn.open("wb") as fh:
+        fh.write(data)
+    return True
+
+
+COPY_STRATEGIES = ("copy", "hardlink", "reflink", "auto")
+FICLONE = 0x40049409  # linux ioctl, copy on write clone at btrfs, xfs
+
+
+@dataclass
+class CopyStats:
+    """Counters for copied files."""
+
+    copied: int = 0  # data copied
+    linked: int = 0  # hardlink or reflink, no data copied
+    skipped: int = 0  # destination same as source
+    bytes_avoided: int = 0  # size of linked and skipped files
+
+    def update(self, other: CopyStats) -> None:
+        """Add counters from other stats."""
+        self.copied += other.copied
+        self.linked += other.linked
+        self.skipped += other.skipped
+        self.bytes_avoided += other.bytes_avoided
+
+
+def reflink(source: Path, dest: Path) -> None:
+    """Clone file, data blocks shared until changed.
+
+    Raises:
+        OSError: If not supported by os or filesystem.
+    """
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink supported only at linux")
+    import fcntl  # pylint: disable=import-outside-toplevel
+
+    with source.open("rb") as src, dest.open("wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    stat = source.stat()
+    os.utime(dest, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def copy_file(source: Path, dest: Path, strategy: str = "copy") -> str:
+    """Copy file with strategy: `copy`, `hardlink`, `reflink` or `auto` -
+    try reflink, then hardlink, then copy. Copy keeps modification time.
+    Result at temporary file replace dest, so dest not broken if link fail.
+    Temporary file unique for call - parallel writers to same dest do not clash.
+
+    Args:
+        source (Path): Source filename.
+        dest (Path): Destination filename.
+        strategy (str, optional): Copy strategy. Defaults to "copy".
+
+    Raises:
+        ValueError: If unknown strategy.
+        OSError: If link not possible, except `auto` strategy.
+
+    Returns:
+        str: Used method: `copy`, `hardlink` or `reflink`.
+    """
+    if strategy not in COPY_STRATEGIES:
+        raise ValueError(
+            f"Unknown copy strategy: {strategy}, expected one of {COPY_STRATEGIES}."
+        )
+    methods = ("reflink", "hardlink", "copy") if strategy == "auto" else (strategy,)
+    tmp_name = dest.with_name(f".{dest.name}.{os.getpid()}.{uuid4().hex[:8]}.tmp")
+    for method in methods:
+        try:
+            if method == "reflink":
+                reflink(source, tmp_name)
+            elif method == "hardlink":
+                tmp_name.unlink(missing_ok=True)
+                os.link(source, tmp_name)
+            else:
+                shutil.copy2(source, tmp_name)
+            os.replace(tmp_name, dest)
+            return method
+        except OSError:
+            tmp_name.unlink(missing_ok=True)
+            if method == methods[-1]:
+                raise
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def is_same_file(
+    source: Path, dest: Path, src_stat: os.stat_result, dest_stat: os.stat_result
+) -> bool:
+    """Check if dest same as source: same inode, size and mtime, or size and hash."""
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+    if (src_stat.st_dev, src_stat.st_ino) == (dest_stat.st_dev, dest_stat.st_ino):
+        return True
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    return file_hash(source) == file_hash(dest)
+
+
+def copy_if_changed(
+    source: Path,
+    dest: Path,
+    strategy: str = "copy",
+    stats: CopyStats | None = None,
+) -> bool:
+    """Copy file if dest not exists or differs. Dest is same if it is same file,
+    has same size and modification time or same size and hash.
+
+    Args:
+        source (Path): Source filename.
+        dest (Path): Destination filename.
+        strategy (str, optional): Copy strategy, see `copy_file`. Defaults to "copy".
+        stats (CopyStats, optional): If given, counters updated. Defaults to None.
+
+    Returns:
+        bool: True if file copied.
+    """
+    if stats is None:
+        stats = CopyStats()
+    src_stat = source.stat()
+    try:
+        dest_stat = dest.stat()
+    except OSError:  # no dest file
+        dest_stat = None
+    if dest_stat is not None and is_same_file(source, dest, src_stat, dest_stat):
+        stats.skipped += 1
+        stats.bytes_avoided += src_stat.st_size
+        return False
+    try:
+        method = copy_file(source, dest, strategy)
+    except OSError:  # dest written by other process at same time
+        if not dest.exists() or not is_same_file(source, dest, src_stat, dest.stat()):
+            raise
+        stats.skipped += 1
+        stats.bytes_avoided += src_stat.st_size
+        return False
+    if method == "copy":
+        stats.copied += 1
+    else:
+        stats.linked += 1
+        stats.bytes_avoided += src_stat.st_size
+    return True
@@ -4,6 +4,16 @@ NBDOCS_SETTINGS = """[nbdocs]
 docs_path = docs
 notebooks_path = nbs
 images_path = images
+# cell_cache = true
+# engine = native
+# recursive = true
+# ignore = drafts, *_tmp.ipynb
+# image_store = hash
+# copy_strategy = auto
+# auto_gc = true
+# timings = true
+# memory = true
+# memory_budget = 500
 """
 
 
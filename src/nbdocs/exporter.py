@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import Any
+
+import nbconvert
+from nbconvert.exporters.exporter import ResourcesDict
+from nbformat import NotebookNode
+
+from nbdocs.cache import CellCache
+from nbdocs.core import hash_json
+from nbdocs.preprocessors import CellFlagsPreprocessor
+from nbdocs.process import md_find_image_names, md_process_output_flag
+from nbdocs.timings import NULL_TIMER, NullTimer
+from nbdocs.typing import Nb, NbAndResources
+
+
+class CachedCellTemplate:
+    """Template wrapper - render notebook cell by cell, reuse fragments from cache.
+    Template body renders cells one after another, so joined fragments same as
+    full render.
+    Cells keyed after preprocessing, so nbconvert validation and preprocessors run
+    for every notebook, cache saves template render only: at bench corpora warm run
+    1-13% faster, cold run 5-14% slower than without cache.
+    Unchanged notebooks skipped before conversion by build manifest.
+    """
+
+    def __init__(self, template: Any, cell_cache: CellCache) -> None:
+        self.template = template
+        self.cell_cache = cell_cache
+
+    def render(self, nb: Nb, resources: ResourcesDict) -> str:
+        """Render notebook, only cells not in cache go through template."""
+        nb_key = hash_json(
+            nb.metadata,
+            resources.get("global_content_filter"),
+            nbconvert.__version__,
+        )
+        fragments = []
+        for cell in nb.cells:
+            key = hash_json(nb_key, cell)
+            fragment = self.cell_cache.get(key)
+            if fragment is None:
+                fragment = self.template.render(
+                    nb=NotebookNode({**nb, "cells": [cell]}),
+                    resources=resources,
+                )
+                self.cell_cache.set(key, fragment)
+            fragments.append(fragment)
+        return "".join(fragments)
+
+
+class TimedTemplate:
+    """Template wrapper - record render time at timer."""
+
+    def __init__(self, template: Any, timer: NullTimer) -> None:
+        self.template = template
+        self.timer = timer
+
+    def render(self, **kwargs: Any) -> str:
+        with self.timer.stage("render"):
+            return self.template.render(**kwargs)  # type: ignore
+
+
+class TimedPreprocessor:
+    """Preprocessor wrapper - record preprocessor time at timer."""
+
+    def __init__(self, preprocessor: Any, timer: NullTimer) -> None:
+        self.preprocessor = preprocessor
+        self.timer = timer
+        self.name = f"preprocess/{type(preprocessor).__name__}"
+
+    def __call__(self, nb: Nb, resources: ResourcesDict) -> NbAndResources:
+        with self.timer.stage(self.name):
+            return self.preprocessor(nb, resources)  # type: ignore
+
+
+class NbDocsMarkdownExporter(nbconvert.MarkdownExporter):
+    """MarkdownExporter, use cache for rendered cells if `cell_cache` set,
+    record time of preprocessors and render if `timer` enabled."""
+
+    cell_cache: CellCache | None = None
+    timer: NullTimer = NULL_TIMER
+
+    @property
+    def template(self) -> Any:
+        template = super().template
+        if self.cell_cache is not None:
+            template = CachedCellTemplate(template, self.cell_cache)
+        if self.timer.enabled:
+            template = TimedTemplate(template, self.timer)
+        return template
+
+    def _preprocess(self, nb: Nb, resources: ResourcesDict) -> NbAndResources:
+        if not self.timer.enabled:
+            return super()._preprocess(nb, resources)  # type: ignore
+        preprocessors = self._preprocessors
+        # disabled preprocessors not called - no rows for it at report
+        self._preprocessors = [
+            TimedPreprocessor(preprocessor, self.timer)
+            for preprocessor in preprocessors
+            if getattr(preprocessor, "enabled", True)
+        ]
+        try:
+            return super()._preprocess(nb, resources)  # type: ignore
+        finally:
+            self._preprocessors = preprocessors
+
+
+class MdConverter:
+    """MdConverter constructor."""
+
+    def __init__(self) -> None:
+        self.md_exporter = NbDocsMarkdownExporter()
+        self.md_exporter.register_preprocessor(CellFlagsPreprocessor, enabled=True)
+
+    def nb2md(
+        self,
+        nb: Nb,
+        resources: ResourcesDict | None = None,
+        cell_cache: CellCache | None = None,
+        timer: NullTimer = NULL_TIMER,
+    ) -> tuple[str, ResourcesDict]:
+        """Base convert Nb to Markdown.
+        If `cell_cache` given, only cells not in cache rendered by template.
+        If `timer` given, time of stages recorded."""
+        self.md_exporter.cell_cache = cell_cache
+        self.md_exporter.timer = timer
+        try:
+            with timer.stage("export"):
+                md, result_resources = self.md_exporter.from_notebook_node(
+                    nb, resources
+                )
+        finally:
+            self.md_exporter.cell_cache = None
+            self.md_exporter.timer = NULL_TIMER
+        with timer.stage("output_flag"):
+            md = md_process_output_flag(md)
+        if image_names := md_find_image_names(md):
+            result_resources["image_names"] = image_names
+        return md, result_resources
+
+    def __call__(
+        self, nb: Nb, resources: ResourcesDict | None = None
+    ) -> tuple[str, ResourcesDict]:
+        """MdConverter call - export given Nb to Md.
+
+        Args:
+            nb (Notebook): Nb to convert.
+
+        Returns:
+            Tuple[str, ResourcesDict]: Md, resources
+        """
+        return self.nb2md(nb, resources)
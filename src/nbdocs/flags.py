@@ -0,0 +1,219 @@
+"""Cell flags registry.
+Flag is comment at code cell: starts with #, at start of the line,
+no more symbols at this line except whitespaces: `# hide`.
+All registered flags compiled into one regex, flags of cell found in one pass.
+
+Example:
+    >>> from nbdocs.flags import register_flag
+    >>> def skip_in_docs(cell, context):
+    ...     cell.metadata["skip_in_docs"] = True
+    >>> flag = register_flag("skip_in_docs", skip_in_docs)
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Collection
+
+from nbdocs.typing import CodeCell
+
+
+def generate_flags_string(flags: list[str]) -> str:
+    """Generate re pattern from list of flags, add flags with '-' instead of '_'.
+
+    Args:
+        flags (List[str]): List of flags.
+
+    Returns:
+        str: flags, separated by '|'
+    """
+    result_flags = flags.copy()
+    for item in flags:
+        if "_" in item:
+            result_flags.append(item.replace("_", "-"))
+    return "|".join(result_flags)
+
+
+def get_flags_re(flags: list[str]) -> re.Pattern[str]:
+    """Create Regex pattern from list of flags.
+
+    Args:
+        flags (List[str]): List of flags.
+
+    Returns:
+        re.Pattern: Regex pattern.
+    """
+    flag_string = generate_flags_string(flags)
+    pattern = rf"^\s*\#\s*({flag_string})\s*$"
+    return re.compile(pattern, re.M)
+
+
+@dataclass
+class FlagContext:
+    """Flags found at cell and processing state, passed to flag handlers."""
+
+    flags: set[str]
+    collapse: bool = False  # collapse output
+    stop: bool = False  # set by handler - skip handlers of other flags
+
+
+FlagHandler = Callable[[CodeCell, FlagContext], None]
+
+
+@dataclass
+class Flag:
+    """Registered flag.
+
+    Args:
+        name (str): Flag name, same flag with '-' instead of '_' matched too.
+        handler (FlagHandler, optional): Called with cell and context if flag at cell.
+        priority (int): Handlers called by priority, lower first.
+        remove_line (bool): Remove line with flag from cell source.
+    """
+
+    name: str
+    handler: FlagHandler | None = None
+    priority: int = 100
+    remove_line: bool = True
+
+    def __post_init__(self) -> None:
+        self.re_flag = get_flags_re([re.escape(self.name)])
+
+
+def flag_name(name: str) -> str:
+    """Return flag name as stored at registry: '-' replaced with '_'."""
+    return name.replace("-", "_")
+
+
+class FlagRegistry:
+    """Registered flags, compiled into one regex.
+    Flag names stored with '_', `tab-group` and `tab_group` - same flag."""
+
+    def __init__(self) -> None:
+        self.flags: dict[str, Flag] = {}
+        self._re_flags: re.Pattern[str] | None = None
+
+    def register(
+        self,
+        name: str,
+        handler: FlagHandler | None = None,
+        priority: int = 100,
+        remove_line: bool = True,
+    ) -> Flag:
+        """Register flag, replace flag with same name."""
+        name = flag_name(name)
+        flag = Flag(name, handler, priority, remove_line)
+        self.flags[name] = flag
+        self._re_flags = None
+        return flag
+
+    def unregister(self, name: str) -> None:
+        """Remove flag from registry."""
+        del self.flags[flag_name(name)]
+        self._re_flags = None
+
+    def __contains__(self, name: str) -> bool:
+        return flag_name(name) in self.flags
+
+    @property
+    def re_flags(self) -> re.Pattern[str]:
+        """Regex for all registered flags, compiled on first use after change."""
+        if self._re_flags is None:
+            names = sorted(self.flags, key=len, reverse=True)
+            self._re_flags = get_flags_re([re.escape(name) for name in names])
+        return self._re_flags
+
+    def find(self, source: str) -> set[str]:
+        """Return flags at source, flags with '-' returned with '_'."""
+        if "#" not in source or not self.flags:  # fast path - no comments, no flags.
+            return set()
+        return {flag_name(match.group(1)) for match in self.re_flags.finditer(source)}
+
+    def process(
+        self, cell: CodeCell, names: Collection[str] | None = None
+    ) -> FlagContext:
+        """Find flags at cell, call handlers by priority, remove flag lines from source.
+        Flag lines removed only for found flags.
+
+        Args:
+            cell (CodeCell): Code cell, changed in place.
+            names (Collection[str], optional): Process only these flags, other flags
+                left at source. Defaults to None - all registered flags.
+
+        Returns:
+            FlagContext: Found flags and state after handlers.
+        """
+        context = FlagContext(self.find(cell.source))
+        if names is not None:
+            context.flags &= {flag_name(name) for name in names}
+        if not context.flags:
+            return context
+        flags = sorted(
+            (self.flags[name] for name in context.flags),
+            key=lambda flag: flag.priority,
+        )
+        for flag in flags:
+            if flag.handler is not None:
+                flag.handler(cell, context)
+            if context.stop:
+                break
+        for flag in flags:  # one by one, same result as separate regex for flag
+            if flag.remove_line and cell.source:
+                cell.source = flag.re_flag.sub("", cell.source)
+        return context
+
+
+def hide_cell(cell: CodeCell, context: FlagContext) -> None:
+    """`hide` - remove cell."""
+    cell.metadata["transient"] = {"remove_source": True}
+    cell.source = ""
+    cell.outputs = []
+    context.stop = True
+
+
+def hide_input(cell: CodeCell, context: FlagContext) -> None:
+    """`hide_input` - remove code from cell, keep outputs."""
+    cell.metadata["transient"] = {"remove_source": True}
+    cell.source = ""
+    context.stop = True
+
+
+def hide_output(cell: CodeCell, _context: FlagContext) -> None:
+    """`hide_output` - remove outputs from cell."""
+    cell.outputs = []
+    cell.execution_count = None
+
+
+def collapse_output(_cell: CodeCell, context: FlagContext) -> None:
+    """`collapse_output` - render output collapsed."""
+    context.collapse = True
+
+
+flag_registry = FlagRegistry()
+flag_registry.register("hide", hide_cell, priority=0)
+flag_registry.register("hide_input", hide_input, priority=10)
+flag_registry.register("hide_output", hide_output, priority=20)
+flag_registry.register("collapse_output", collapse_output, priority=30)
+
+
+def register_flag(
+    name: str,
+    handler: FlagHandler | None = None,
+    priority: int = 100,
+    remove_line: bool = True,
+) -> Flag:
+    """Register flag at default registry.
+
+    Args:
+        name (str): Flag name, same flag with '-' instead of '_' matched too.
+        handler (FlagHandler, optional): Called with cell and FlagContext if flag at cell.
+            Defaults to None.
+        priority (int, optional): Handlers called by priority, lower first,
+            builtin flags use 0-30. Defaults to 100.
+        remove_line (bool, optional): Remove line with flag from cell source. Defaults to True.
+
+    Returns:
+        Flag: Registered flag.
+    """
+    return flag_registry.register(name, handler, priority, remove_line)
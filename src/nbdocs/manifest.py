@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.core import file_hash, hash_json
+from nbdocs.version import __version__
+
+NBDOCS_DIR = ".nbdocs"  # service dir at docs_path
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 2  # 2 - notebook path relative to docs_path
+CELLS_CACHE_DIR = "cells"  # rendered cells cache, at NBDOCS_DIR
+# config settings that do not change conversion result
+CFG_NOT_AFFECT_OUTPUT = (
+    "cfg_path",
+    "cell_cache",
+    "copy_strategy",
+    "auto_gc",
+    "timings",
+    "memory",
+    "memory_budget",
+)
+
+
+def get_cfg_hash(cfg: NbDocsCfg) -> str:
+    """Return hash of config settings that affect conversion result."""
+    settings = asdict(cfg)
+    for name in CFG_NOT_AFFECT_OUTPUT:
+        settings.pop(name, None)
+    return hash_json(settings, __version__)
+
+
+@dataclass
+class ManifestEntry:
+    """Manifest record for one notebook."""
+
+    nb: str  # notebook filename, relative to docs_path
+    hash: str  # notebook content hash
+    size: int
+    mtime_ns: int
+    cfg_hash: str  # hash of config and nbdocs version
+    artifacts: list[str] = field(default_factory=list)  # relative to docs_path
+
+
+class Manifest:
+    """Build manifest, stored at `docs_path/.nbdocs/manifest.json`.
+    Keep content hash of notebooks, config hash and produced artifacts,
+    so changes detected without modification time.
+    Entries keyed by md filename relative to docs_path.
+    """
+
+    def __init__(self, cfg: NbDocsCfg) -> None:
+        self.docs_path = Path(cfg.docs_path)
+        self.filename = self.docs_path / NBDOCS_DIR / MANIFEST_NAME
+        self.cfg_hash = get_cfg_hash(cfg)
+        self.entries: dict[str, ManifestEntry] = {}
+        self.changed = False
+
+    @classmethod
+    def load(cls, cfg: NbDocsCfg) -> Manifest:
+        """Load manifest from docs_path. Return empty manifest if no manifest or it broken."""
+        manifest = cls(cfg)
+        try:
+            with manifest.filename.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("format") != MANIFEST_FORMAT:  # old format - rebuild
+                return manifest
+            manifest.entries = {
+                key: ManifestEntry(**entry) for key, entry in data["notebooks"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            manifest.entries = {}
+        return manifest
+
+    def save(self) -> None:
+        """Write manifest to docs_path."""
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": __version__,
+            "format": MANIFEST_FORMAT,
+            "notebooks": {
+                key: asdict(entry) for key, entry in sorted(self.entries.items())
+            },
+        }
+        tmp_name = self.filename.with_suffix(".tmp")
+        with tmp_name.open("w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=1)
+        os.replace(tmp_name, self.filename)
+        self.changed = False
+
+    def is_changed(self, key: str, nb_fn: Path) -> bool:
+        """Check if notebook need to be converted.
+        Stat of notebook checked first, if it differ - compare content hash.
+        If content same, stat at entry updated.
+
+        Args:
+            key (str): Manifest key - md filename relative to docs_path.
+            nb_fn (Path): Notebook filename.
+
+        Returns:
+            bool: True if notebook or config changed or artifacts missing.
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry.cfg_hash != self.cfg_hash:
+            return True
+        if not all((self.docs_path / name).exists() for name in entry.artifacts):
+            return True
+        stat = nb_fn.stat()
+        if stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns:
+            return False
+        if stat.st_size != entry.size or file_hash(nb_fn) != entry.hash:
+            return True
+        entry.mtime_ns = stat.st_mtime_ns
+        self.changed = True
+        return False
+
+    def update(
+        self,
+        key: str,
+        nb_fn: Path,
+        nb_hash: str,
+        stat: os.stat_result,
+        artifacts: list[Path],
+    ) -> None:
+        """Add or replace entry for converted notebook.
+
+        Args:
+            key (str): Manifest key - md filename relative to docs_path.
+            nb_fn (Path): Notebook filename.
+            nb_hash (str): Content hash of notebook at conversion time.
+            stat (os.stat_result): Stat of notebook at conversion time.
+            artifacts (List[Path]): Files created from notebook.
+        """
+        self.entries[key] = ManifestEntry(
+            nb=self.nb_relative(nb_fn),
+            hash=nb_hash,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            cfg_hash=self.cfg_hash,
+            artifacts=sorted({self.relative(artifact) for artifact in artifacts}),
+        )
+        self.changed = True
+
+    def artifacts(self) -> set[str]:
+        """Return artifacts of all notebooks, relative to docs_path."""
+        return {name for entry in self.entries.values() for name in entry.artifacts}
+
+    def stale_keys(self) -> list[str]:
+        """Return keys of entries for notebooks that not exist - deleted or renamed."""
+        return [
+            key
+            for key, entry in self.entries.items()
+            if not (self.docs_path / entry.nb).is_file()
+        ]
+
+    def orphan_artifacts(self, keys: list[str]) -> set[str]:
+        """Return artifacts of entries with given keys, not used by other entries."""
+        used = {
+            name
+            for key, entry in self.entries.items()
+            if key not in keys
+            for name in entry.artifacts
+        }
+        return {
+            name for key in keys for name in self.entries[key].artifacts
+        }.difference(used)
+
+    def remove(self, keys: list[str]) -> None:
+        """Remove entries with given keys."""
+        for key in keys:
+            del self.entries[key]
+            self.changed = True
+
+    def nb_relative(self, nb_fn: Path) -> str:
+        """Return notebook filename relative to docs_path as posix string,
+        same for any current dir and relative or absolute notebook path."""
+        try:
+            return Path(
+                os.path.relpath(nb_fn.resolve(), self.docs_path.resolve())
+            ).as_posix()
+        except ValueError:  # other drive at windows
+            return nb_fn.resolve().as_posix()
+
+    def relative(self, filename: Path) -> str:
+        """Return filename relative to docs_path as posix string."""
+        try:
+            return filename.relative_to(self.docs_path).as_posix()
+        except ValueError:
+            return filename.as_posix()
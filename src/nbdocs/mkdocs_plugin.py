@@ -0,0 +1,96 @@
+"""MkDocs plugin: convert notebooks at `mkdocs build` and `mkdocs serve`,
+no md files written to docs dir.
+Converted notebooks kept at persistent cache, only changed notebooks converted again.
+
+Use at `mkdocs.yaml`:
+
+    plugins:
+      - search
+      - nbdocs:
+          notebooks_path: nbs
+          recursive: true
+
+Settings not given at plugin config read from `nbdocs.ini`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from mkdocs.config import config_options
+from mkdocs.exceptions import PluginError
+from mkdocs.plugins import BasePlugin
+from mkdocs.structure.files import File, Files
+
+from nbdocs.cfg_tools import NbDocsCfg, get_config
+from nbdocs.core import get_nb_names
+from nbdocs.page_cache import PageCache
+
+
+class NbDocsPlugin(BasePlugin):  # type: ignore
+    """Add converted notebooks to MkDocs files."""
+
+    # notebooks_path "" - from nbdocs.ini
+    config_scheme = (
+        ("notebooks_path", config_options.Type(str, default="")),
+        ("recursive", config_options.Type(bool, default=False)),
+        ("cache_dir", config_options.Type(str, default=".cache/nbdocs")),
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cfg: NbDocsCfg | None = None
+        self.page_cache: PageCache | None = None
+
+    def on_config(self, config: Any) -> Any:
+        """Read nbdocs config, create cache. Config path - dir of mkdocs config."""
+        project_dir = Path(config["config_file_path"] or ".").parent
+        cfg = get_config(project_dir)
+        if self.config["notebooks_path"]:
+            cfg.notebooks_path = self.config["notebooks_path"]
+        cfg.notebooks_path = str(project_dir / cfg.notebooks_path)
+        cfg.recursive = cfg.recursive or self.config["recursive"]
+        cache_dir = project_dir / self.config["cache_dir"]
+        # keep cache between rebuilds at `mkdocs serve` if config same
+        if self.page_cache is None or self.cfg != cfg:
+            self.page_cache = PageCache(cfg, cache_dir)
+        self.cfg = cfg
+        return config
+
+    def on_files(self, files: Files, config: Any) -> Files:
+        """Convert changed notebooks, add md files and images to MkDocs files.
+        Notebook replaces md file with same name at docs dir.
+
+        Raises:
+            PluginError: If notebooks path not exists.
+        """
+        assert self.cfg is not None and self.page_cache is not None
+        if not Path(self.cfg.notebooks_path).exists():
+            raise PluginError(f"nbdocs: {self.cfg.notebooks_path} not exists!")
+        nb_names = get_nb_names(
+            self.cfg.notebooks_path, self.cfg.recursive, self.cfg.ignore_patterns
+        )
+        entries = set()
+        for nb_fn in nb_names:
+            entry_dir, filenames = self.page_cache.get(nb_fn)
+            entries.add(entry_dir)
+            for filename in filenames:
+                if (file := files.get_file_from_path(filename)) is not None:
+                    files.remove(file)
+                files.append(
+                    File(
+                        filename,
+                        str(entry_dir),
+                        config["site_dir"],
+                        config["use_directory_urls"],
+                    )
+                )
+        self.page_cache.prune(entries)
+        return files
+
+    def on_serve(self, server: Any, config: Any, builder: Any) -> Any:
+        """Watch notebooks at `mkdocs serve`, rebuild on changes."""
+        if self.cfg is not None:
+            server.watch(self.cfg.notebooks_path)
+        return server
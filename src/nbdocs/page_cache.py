@@ -0,0 +1,95 @@
+"""Persistent cache of rendered notebooks, used by MkDocs plugin.
+Entry per notebook content and config: markdown and images at same layout as at docs.
+"""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.convert import create_md_converter, nb2md_memory
+from nbdocs.core import FileHashes, get_md_name, hash_json
+from nbdocs.manifest import get_cfg_hash
+
+
+class PageCache:
+    """Rendered notebooks at cache dir, entry dir named by hash of notebook content,
+    config and md name. Entry has md file and images, paths relative to entry dir same as at docs.
+    Notebook rendered only if no entry for it.
+
+    Args:
+        cfg (NbDocsCfg): NbDocsCfg.
+        cache_dir (Path): Cache directory.
+    """
+
+    def __init__(self, cfg: NbDocsCfg, cache_dir: Path) -> None:
+        self.cfg = cfg
+        self.cache_dir = cache_dir
+        self.cfg_hash = get_cfg_hash(cfg)
+        self.renders = 0
+        self._md_converter: Any = None
+        self._hashes = FileHashes()
+
+    def entry_name(self, nb_fn: Path) -> str:
+        """Return entry name for notebook: hash of content, config and md name.
+        Content hash recalculated only if stat changed."""
+        md_name = get_md_name(nb_fn, self.cfg.notebooks_path).as_posix()
+        return hash_json(self._hashes.hash(nb_fn), self.cfg_hash, md_name)
+
+    def get(self, nb_fn: Path) -> tuple[Path, list[str]]:
+        """Return entry dir for notebook and files at it: md file first, then images.
+        Notebook rendered if no entry.
+
+        Args:
+            nb_fn (Path): Notebook filename.
+
+        Returns:
+            Tuple[Path, List[str]]: Entry dir, posix paths relative to entry dir.
+        """
+        entry_dir = self.cache_dir / self.entry_name(nb_fn)
+        md_name = get_md_name(nb_fn, self.cfg.notebooks_path)
+        if not (entry_dir / md_name).exists():
+            self.render(nb_fn, entry_dir, md_name)
+        images = sorted(
+            fn.relative_to(entry_dir).as_posix()
+            for fn in entry_dir.rglob("*")
+            if fn.is_file() and fn.suffix != ".md"
+        )
+        return entry_dir, [md_name.as_posix(), *images]
+
+    def render(self, nb_fn: Path, entry_dir: Path, md_name: Path) -> None:
+        """Render notebook, write md and images to entry dir.
+        Files written to temporary dir, moved to entry dir when done."""
+        if self._md_converter is None:
+            self._md_converter = create_md_converter(self.cfg.engine)
+        result = nb2md_memory(
+            nb_fn.read_bytes(),
+            self.cfg,
+            nb_fn.stem,
+            source_path=nb_fn.parent,
+            md_converter=self._md_converter,
+        )
+        self.renders += 1
+        tmp_dir = entry_dir.with_name(f"{entry_dir.name}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        md_fn = tmp_dir / md_name
+        md_fn.parent.mkdir(parents=True)
+        md_fn.write_text(result.md, encoding="utf-8")
+        for image_path, data in result.images.items():
+            image_fn = md_fn.parent / image_path
+            image_fn.parent.mkdir(parents=True, exist_ok=True)
+            image_fn.write_bytes(data)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        tmp_dir.rename(entry_dir)
+
+    def prune(self, keep: set[Path]) -> list[Path]:
+        """Remove entries not in keep. Return removed entries."""
+        removed = []
+        if self.cache_dir.exists():
+            for entry_dir in self.cache_dir.iterdir():
+                if entry_dir.is_dir() and entry_dir not in keep:
+                    shutil.rmtree(entry_dir)
+                    removed.append(entry_dir)
+        return removed
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from nbconvert.exporters.exporter import ResourcesDict
+from nbconvert.preprocessors.base import Preprocessor
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.process import (
+    cell_mark_empty,
+    cell_md_correct_image_link,
+    cell_process_flags,
+    cell_process_hide_flags,
+    mark_output,
+)
+from nbdocs.typing import Cell, CellAndResources, CodeCell, Nb, NbAndResources
+
+
+class CorrectMdImageLinkPreprocessor(Preprocessor):
+    """
+    Change image links and copy image at markdown cells at given notebook.
+    """
+
+    def __init__(self, cfg: NbDocsCfg, **kw):
+        super().__init__(**kw)
+        self.cfg = cfg
+
+    def preprocess_cell(
+        self, cell: Cell, resources: ResourcesDict, index: int
+    ) -> CellAndResources:
+        """
+        Apply a transformation on each cell. See base.py for details.
+        """
+        if cell.cell_type == "markdown":
+            nb_fn: Path = resources.get("filename")
+            cell_md_correct_image_link(cell, nb_fn, self.cfg)  # type: ignore
+        return cell, resources
+
+
+class CellFlagsPreprocessor(Preprocessor):
+    """
+    Process code cells in one pass: remove empty cells, process hide flags, mark outputs.
+    """
+
+    def preprocess(self, nb: Nb, resources: ResourcesDict) -> NbAndResources:
+        """
+        Process code cells, cells changed in place.
+        """
+        for cell in nb.cells:
+            if cell.cell_type == "code":
+                cell_process_flags(cell)  # type: ignore
+        return nb, resources
+
+    def preprocess_cell(
+        self,
+        cell: CodeCell,
+        resources: ResourcesDict,
+        index: int,
+    ) -> CellAndResources:
+        """
+        Apply a transformation on each cell. See base.py for details.
+        """
+        if cell.cell_type == "code":
+            cell_process_flags(cell)
+        return cell, resources
+
+
+# Preprocessors for one step of CellFlagsPreprocessor, MdConverter use CellFlagsPreprocessor.
+# Same steps as `cell_process_flags`, flags from `nbdocs.flags.flag_registry`.
+class HideFlagsPreprocessor(Preprocessor):
+    """
+    Process Hide flags - remove cells, code or output marked by hide flags.
+    Flags added by `register_flag` processed here too, output flags left for MarkOutputPreprocessor.
+    """
+
+    def preprocess_cell(
+        self,
+        cell: CodeCell,
+        resources: ResourcesDict,
+        index: int,
+    ) -> CellAndResources:
+        """
+        Apply a transformation on each cell. See base.py for details.
+        """
+        if cell.cell_type == "code":
+            cell_process_hide_flags(cell)
+        return cell, resources
+
+
+class RemoveEmptyCellPreprocessor(Preprocessor):
+    """
+    Remove Empty Cell - remove cells with no code.
+    """
+
+    def preprocess_cell(
+        self,
+        cell: Cell,
+        resources: ResourcesDict,
+        index: int,
+    ) -> CellAndResources:
+        """
+        Apply a transformation on each cell. See base.py for details.
+        """
+        if cell.cell_type == "code":
+            cell_mark_empty(cell)  # type: ignore
+        return cell, resources
+
+
+class MarkOutputPreprocessor(Preprocessor):
+    """
+    Mark outputs at code cells.
+    """
+
+    def preprocess_cell(
+        self,
+        cell: CodeCell,
+        resources: ResourcesDict,
+        index: int,
+    ) -> CellAndResources:
+        """
+        Apply a transformation on each cell. See base.py for details.
+        """
+        if cell.cell_type == "code":
+            mark_output(cell)
+
+        return cell, resources
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import re
-import shutil
 import sys
 from pathlib import Path
 
-from nbconvert.exporters.exporter import ResourcesDict
-from nbconvert.preprocessors.base import Preprocessor
-
 from nbdocs.cfg_tools import NbDocsCfg
-from nbdocs.typing import CellAndResources, CodeCell, MarkdownCell, Nb, Cell
+from nbdocs.flags import flag_registry
+from nbdocs.core import (
+    CopyStats,
+    bytes_hash,
+    copy_if_changed,
+    file_hash,
+    write_if_changed,
+)
+from nbdocs.typing import CodeCell, MarkdownCell, Nb, Cell
 
 
 if sys.version_info.minor < 9:  # pragma: no cover
@@ -30,47 +34,12 @@ HIDE_FLAGS = HIDE + HIDE_INPUT + HIDE_OUTPUT
 FLAGS: list[str] = [] + HIDE_FLAGS  # here will be more flags.
 
 COLLAPSE_OUTPUT = "collapse_output"
-
-
-def generate_flags_string(flags: list[str]) -> str:
-    """Generate re pattern from list of flags, add flags with '-' instead of '_'.
-
-    Args:
-        flags (List[str]): List of flags.
-
-    Returns:
-        str: flags, separated by '|'
-    """
-    result_flags = flags.copy()
-    for item in flags:
-        if "_" in item:
-            result_flags.append(item.replace("_", "-"))
-    return "|".join(result_flags)
-
-
-def get_flags_re(flags: list[str]) -> rePattern:
-    """Create Regex pattern from list of flags.
-
-    Args:
-        flags (List[str]): List of flags.
-
-    Returns:
-        re.Pattern: Regex pattern.
-    """
-    flag_string = generate_flags_string(flags)
-    pattern = rf"^\s*\#\s*({flag_string})\s*$"
-    return re.compile(pattern, re.M)
-
-
-re_flags = get_flags_re(FLAGS)
-re_hide = get_flags_re(HIDE)
-re_hide_input = get_flags_re(HIDE_INPUT)
-re_hide_output = get_flags_re(HIDE_OUTPUT)
-re_collapse = get_flags_re([COLLAPSE_OUTPUT])
+OUTPUT_FLAGS = [COLLAPSE_OUTPUT]  # processed with outputs, not flags of cell
 
 
 def cell_check_flags(cell: Cell) -> bool:
-    """Check if cell has nbdocs flags.
+    """Check if cell has nbdocs flags: hide flags and flags added by `register_flag`.
+    Output flags (`collapse_output`) not counted.
 
     Args:
         cell (Cell): Cell to check.
@@ -80,10 +49,15 @@ def cell_check_flags(cell: Cell) -> bool:
     """
     result = False
     if cell.cell_type == "code":
-        result = re_flags.search(cell.source) is not None
+        result = bool(flag_registry.find(cell.source).difference(OUTPUT_FLAGS))
     return result
 
 
+# Image link: lazy alt text - more than one link at line found separately,
+# path can have spaces, be at `<...>` and have parentheses one level deep: `pic(1).png`.
+IMAGE_LINK_PATH = r"(?:[^()<>\n]|\([^()<>\n]*\))+?"
+
+
 def get_image_link_re(image_name: str = "") -> rePattern:
     """Return regex pattern for image link with given name. If no name - any image link.
 
@@ -93,9 +67,11 @@ def get_image_link_re(image_name: str = "") -> rePattern:
     Returns:
         re.Pattern: Regex pattern for image link.
     """
-    if image_name == "":
-        image_name = ".*"
-    return re.compile(rf"(\!\[.*\])(\s*\(\s*)(?P<path>{image_name})(\s*\))", re.M)
+    path = re.escape(image_name) if image_name else IMAGE_LINK_PATH
+    return re.compile(rf"(\!\[[^\n]*?\])(\s*\(\s*<?)(?P<path>{path})(>?\s*\))", re.M)
+
+
+re_image_link = get_image_link_re()
 
 
 def md_find_image_names(md: str) -> set[str]:
@@ -107,16 +83,40 @@ def md_find_image_names(md: str) -> set[str]:
     Returns:
         Set[str]: Set of image names
     """
-    re_link = get_image_link_re()
     return set(
         path
-        for match in re_link.finditer(md)
+        for match in re_image_link.finditer(md)
         if "http" not in (path := match.group("path"))
     )
 
 
+def md_correct_image_links(md: str, image_links: dict[str, str]) -> str:
+    """Change image links at markdown text in one pass.
+
+    Args:
+        md (str): Markdown text to process.
+        image_links (Dict[str, str]): Image name (link at text) to new link.
+
+    Returns:
+        str: Text with changed links.
+    """
+    if not image_links:
+        return md
+
+    def replace_link(match: re.Match[str]) -> str:
+        new_link = image_links.get(match.group("path"))
+        if new_link is None:
+            return match.group(0)
+        if match.group(2).endswith("<") and match.group(4).startswith(">"):
+            new_link = f"<{new_link}>"
+        return f"{match.group(1)}({new_link})"
+
+    return re_image_link.sub(replace_link, md)
+
+
 def md_correct_image_link(md: str, image_name: str, image_path: str) -> str:
     """Change image link at markdown text from local source to image_path.
+    For many images use `md_correct_image_links`.
 
     Args:
         md (str): Markdown text to process.
@@ -126,22 +126,25 @@ def md_correct_image_link(md: str, image_name: str, image_path: str) -> str:
     Returns:
         str: Text with changed links.
     """
-    return re.sub(
-        rf"(\!\[.*\])(\s*\(\s*){image_name}(\s*\))",
-        rf"\1({image_path}/{image_name})",
-        md,
-    )
+    return md_correct_image_links(md, {image_name: f"{image_path}/{image_name}"})
 
 
 def copy_images(
-    image_names: list[str], source: Path, dest: Path
+    image_names: list[str],
+    source: Path,
+    dest: Path,
+    strategy: str = "copy",
+    stats: CopyStats | None = None,
 ) -> tuple[list[str], set[str]]:
     """Copy images from source to dest. Return list of copied and list of left.
+    Images same as at dest not copied.
 
     Args:
         image_names (List): List of names
         source (Path): PAth of source dir (parent)
         dest (Path): Destination path
+        strategy (str, optional): Copy strategy: copy, hardlink, reflink or auto. Defaults to "copy".
+        stats (CopyStats, optional): If given, copy counters updated. Defaults to None.
 
     Returns:
         Tuple[List[str], List[str]]: _description_
@@ -156,12 +159,96 @@ def copy_images(
     if len(files_to_copy) > 0:
         dest.mkdir(exist_ok=True, parents=True)
         for fn in files_to_copy:
-            shutil.copy(source / fn, dest / fn.name)
+            copy_if_changed(source / fn, dest / fn.name, strategy, stats)
             done.append(str(fn))
     set_image_names.difference_update(done)
     return done, set_image_names
 
 
+class OutputFilesWriter(dict):  # type: ignore
+    """Dict for `resources["outputs"]` - write output to file as it set,
+    keep only filename. So extracted images do not stay in memory.
+    File with same content not rewritten, count at `unchanged`.
+
+    Args:
+        dest (Path): Directory for output files, created at first write.
+    """
+
+    def __init__(self, dest: Path) -> None:
+        super().__init__()
+        self.dest = dest
+        self.unchanged = 0
+
+    def __setitem__(self, name: str, data: bytes) -> None:
+        self.dest.mkdir(exist_ok=True, parents=True)
+        filename = self.dest / name
+        if not write_if_changed(filename, data):
+            self.unchanged += 1
+        super().__setitem__(name, filename)
+
+    def __deepcopy__(self, memo: dict[int, object]) -> OutputFilesWriter:
+        # resources copied by exporter, writer must be shared.
+        return self
+
+
+IMAGE_STORES = ("notebook", "hash")  # per notebook dirs or content addressed store
+IMAGE_STORE_DIR = "store"  # content addressed store dir at images_path
+
+
+class HashedFilesWriter(OutputFilesWriter):
+    """OutputFilesWriter for content addressed store - file named by hash of content,
+    so same image from any notebook stored once.
+
+    Args:
+        dest (Path): Store directory, created at first write.
+    """
+
+    def __setitem__(self, name: str, data: bytes) -> None:
+        self.dest.mkdir(exist_ok=True, parents=True)
+        filename = self.dest / f"{bytes_hash(data)}{Path(name).suffix}"
+        if filename.exists():  # name is hash, so content same
+            self.unchanged += 1
+        else:
+            write_if_changed(filename, data)
+        dict.__setitem__(self, name, filename)
+
+
+def store_images(
+    image_names: set[str],
+    source: Path,
+    store: Path,
+    strategy: str = "copy",
+    stats: CopyStats | None = None,
+) -> tuple[dict[str, Path], set[str]]:
+    """Copy images from source to content addressed store.
+
+    Args:
+        image_names (Set[str]): Image names (links at markdown).
+        source (Path): Path of source dir (parent)
+        store (Path): Store directory.
+        strategy (str, optional): Copy strategy: copy, hardlink, reflink or auto. Defaults to "copy".
+        stats (CopyStats, optional): If given, copy counters updated. Defaults to None.
+
+    Returns:
+        Tuple[Dict[str, Path], Set[str]]: Image name: stored filename, names of not found images.
+    """
+    if stats is None:
+        stats = CopyStats()
+    stored: dict[str, Path] = {}
+    for image_name in image_names:
+        image_fn = source / image_name
+        if not image_fn.is_file():
+            continue
+        store.mkdir(exist_ok=True, parents=True)
+        stored[image_name] = store / f"{file_hash(image_fn)}{image_fn.suffix}"
+        if stored[image_name].exists():  # name is hash, so content same
+            stats.skipped += 1
+            stats.bytes_avoided += image_fn.stat().st_size
+        else:
+            copy_if_changed(image_fn, stored[image_name], strategy, stats)
+    return stored, set(image_names).difference(stored)
+
+
 # check relative link (../../), ? can we correct links after converting
 def cell_md_correct_image_link(cell: MarkdownCell, nb_fn: Path, cfg: NbDocsCfg) -> None:
     """Change image links at given markdown cell and copy linked image to image path at dest.
@@ -170,24 +257,19 @@ def cell_md_correct_image_link(cell: MarkdownCell, nb_fn: Path, cfg: NbDocsCfg)
         cell (Cell): Markdown cell to process.
     """
     image_names = md_find_image_names(cell.source)
+    dest_images = f"{cfg.images_path}/{nb_fn.stem}_files"  # path for images
+    dest_path = Path(cfg.docs_path) / dest_images
+    image_links: dict[str, str] = {}
     for image_name in image_names:
         image_fn = nb_fn.parent / image_name  # check relative path in link
         if image_fn.exists():
-            # path for images
-            dest_images = f"{cfg.images_path}/{nb_fn.stem}_files"
-            (dest_path := Path(cfg.docs_path) / dest_images).mkdir(
-                exist_ok=True, parents=True
-            )
-            # change link
-            re_path = get_image_link_re(image_name)
-            cell.source = re_path.sub(
-                rf"\1({dest_images}/{image_fn.name})", cell.source
-            )
+            dest_path.mkdir(exist_ok=True, parents=True)
+            image_links[image_name] = f"{dest_images}/{image_fn.name}"
             # copy source
-            copy_name = dest_path / image_fn.name
-            shutil.copy(image_fn, copy_name)
+            copy_if_changed(image_fn, dest_path / image_fn.name, cfg.copy_strategy)
         else:
             print(f"Image source not exists! filename: {image_fn}")
+    cell.source = md_correct_image_links(cell.source, image_links)
 
 
 def correct_markdown_image_link(nb: Nb, nb_fn: Path, cfg: NbDocsCfg):
@@ -204,83 +286,16 @@ def correct_markdown_image_link(nb: Nb, nb_fn: Path, cfg: NbDocsCfg):
             cell_md_correct_image_link(cell, nb_fn, cfg)
 
 
-class CorrectMdImageLinkPreprocessor(Preprocessor):
-    """
-    Change image links and copy image at markdown cells at given notebook.
-    """
-
-    def __init__(self, cfg: NbDocsCfg, **kw):
-        super().__init__(**kw)
-        self.cfg = cfg
-
-    def preprocess_cell(
-        self, cell: Cell, resources: ResourcesDict, index: int
-    ) -> CellAndResources:
-        """
-        Apply a transformation on each cell. See base.py for details.
-        """
-        if cell.cell_type == "markdown":
-            nb_fn: Path = resources.get("filename")
-            cell_md_correct_image_link(cell, nb_fn, self.cfg)  # type: ignore
-        return cell, resources
-
-
 def cell_process_hide_flags(cell: CodeCell) -> None:
-    """Process cell - remove input, output or both from markdown cell.
+    """Process flags at cell, except output flags: remove input, output or both
+    for hide flags, call handlers of flags added by `register_flag`.
+    Output flags left for `mark_output`.
 
     Args:
-        cell (Cell): Notebook markdown cell
-    """
-    if re_hide.search(cell.source):
-        cell.metadata["transient"] = {"remove_source": True}
-        cell.source = ""
-        cell.outputs = []
-    elif re_hide_input.search(cell.source):
-        cell.metadata["transient"] = {"remove_source": True}
-        cell.source = ""
-    elif re_hide_output.search(cell.source):
-        cell.outputs = []
-        cell.execution_count = None
-        cell.source = re_hide_output.sub(r"", cell.source)
-
-
-class HideFlagsPreprocessor(Preprocessor):
-    """
-    Process Hide flags - remove cells, code or output marked by HIDE_FLAGS.
-    """
-
-    def preprocess_cell(
-        self,
-        cell: CodeCell,
-        resources: ResourcesDict,
-        index: int,
-    ) -> CellAndResources:
-        """
-        Apply a transformation on each cell. See base.py for details.
-        """
-        if cell.cell_type == "code":
-            cell_process_hide_flags(cell)
-        return cell, resources
-
-
-class RemoveEmptyCellPreprocessor(Preprocessor):
+        cell (Cell): Notebook code cell
     """
-    Remove Empty Cell - remove cells with no code.
-    """
-
-    def preprocess_cell(
-        self,
-        cell: Cell,
-        resources: ResourcesDict,
-        index: int,
-    ) -> CellAndResources:
-        """
-        Apply a transformation on each cell. See base.py for details.
-        """
-        if cell.cell_type == "code":
-            if cell.source == "":
-                cell.metadata["transient"] = {"remove_source": True}
-        return cell, resources
+    names = [name for name in flag_registry.flags if name not in OUTPUT_FLAGS]
+    flag_registry.process(cell, names)
 
 
 def nb_process_hide_flags(nb: Nb) -> None:
@@ -317,12 +332,8 @@ def process_cell_collapse_output(cell: CodeCell) -> str:
     Returns:
         str: flag: OUTPUT_FLAG or OUTPUT_FLAG_COLLAPSE
     """
-    result = OUTPUT_FLAG
-    if re_collapse.search(cell.source) is not None:
-        result = OUTPUT_FLAG_COLLAPSE
-        cell.source = re_collapse.sub("", cell.source)
-
-    return result
+    context = flag_registry.process(cell, OUTPUT_FLAGS)
+    return OUTPUT_FLAG_COLLAPSE if context.collapse else OUTPUT_FLAG
 
 
 def mark_output(cell: CodeCell) -> None:
@@ -331,7 +342,16 @@ def mark_output(cell: CodeCell) -> None:
     Args:
         cell (CodeCell): CodeCell with outputs.
     """
-    output_flag = process_cell_collapse_output(cell)
+    mark_outputs(cell, process_cell_collapse_output(cell))
+
+
+def mark_outputs(cell: CodeCell, output_flag: str) -> None:
+    """Mark text at cell outputs by given flag.
+
+    Args:
+        cell (CodeCell): CodeCell with outputs.
+        output_flag (str): OUTPUT_FLAG or OUTPUT_FLAG_COLLAPSE.
+    """
     for output in cell.outputs:
         # if output.get("name", None) == "stdout":  # output_type - "stream" process stderr!
         if output.output_type == "stream":  # output_type - "stream"
@@ -344,6 +364,42 @@ def mark_output(cell: CodeCell) -> None:
                 )
 
 
+def get_cell_flags(source: str) -> set[str]:
+    """Return nbdocs flags at cell source, flags with '-' returned with '_'.
+    Flags from `nbdocs.flags.flag_registry`, found in one pass.
+
+    Args:
+        source (str): Cell source.
+
+    Returns:
+        Set[str]: Flags.
+    """
+    return flag_registry.find(source)
+
+
+def cell_mark_empty(cell: CodeCell) -> None:
+    """Mark cell with no code - source not rendered.
+
+    Args:
+        cell (CodeCell): Code cell to process.
+    """
+    if cell.source == "":
+        cell.metadata["transient"] = {"remove_source": True}
+
+
+def cell_process_flags(cell: CodeCell) -> None:
+    """Process code cell in one pass: mark empty cell, process flags
+    registered at `nbdocs.flags.flag_registry` and mark outputs.
+    Same result as `cell_mark_empty`, `cell_process_hide_flags` and `mark_output` one by one.
+
+    Args:
+        cell (CodeCell): Code cell to process.
+    """
+    cell_mark_empty(cell)
+    context = flag_registry.process(cell)
+    mark_outputs(cell, OUTPUT_FLAG_COLLAPSE if context.collapse else OUTPUT_FLAG)
+
+
 def nb_mark_output(nb: Nb):
     """Mark cells with output.
     Better use Preprocessor version
@@ -356,28 +412,16 @@ def nb_mark_output(nb: Nb):
             mark_output(cell)
 
 
-class MarkOutputPreprocessor(Preprocessor):
-    """
-    Mark outputs at code cells.
-    """
-
-    def preprocess_cell(
-        self,
-        cell: CodeCell,
-        resources: ResourcesDict,
-        index: int,
-    ) -> CellAndResources:
-        """
-        Apply a transformation on each cell. See base.py for details.
-        """
-        if cell.cell_type == "code":
-            mark_output(cell)
-
-        return cell, resources
+# Output flags and close flag, leading `#` and whitespaces processed at
+# `md_process_output_flag`, so no backtracking at long whitespace runs.
+re_output_flag = re.compile(
+    r"output_(?:flag(?P<collapse>_collapse)?|(?P<close>close))\#*"
+)
+OUTPUT_FLAG_CLOSE_HASHES = 3  # close flag must be surrounded by `###`
 
 
 def md_process_output_flag(md: str) -> str:
-    """Reformat marked output.
+    """Reformat marked output. Single pass over markdown string.
 
     Args:
         md (str): Markdown string
@@ -385,8 +429,44 @@ def md_process_output_flag(md: str) -> str:
     Returns:
         str: Markdown string.
     """
-    result = re.sub(r"\s*\#*output_flag_collapse\#*", format_output_collapsed, md)
-    result = re.sub(r"\s*\#*output_flag\#*", format_output, result)
-    if OUTPUT_FLAG_CLOSE:
-        result = re.sub(rf"\#*{OUTPUT_FLAG_CLOSE}\#*", format_output_close, result)
-    return result
+    result: list[str] = []
+    pos = 0
+    for match in re_output_flag.finditer(md):
+        start = match.start()
+        while start > pos and md[start - 1] == "#":
+            start -= 1
+        if match.group("close") is not None:
+            hashes_before = match.start() - start
+            hashes_after = match.end() - match.start() - len("output_close")
+            if min(hashes_before, hashes_after) < OUTPUT_FLAG_CLOSE_HASHES:
+                continue
+            result.append(md[pos:start])
+            result.append(format_output_close)
+        else:
+            result.append(md[pos:start].rstrip())
+            collapse = match.group("collapse") is not None
+            result.append(format_output_collapsed if collapse else format_output)
+        pos = match.end()
+    result.append(md[pos:])
+    return "".join(result)
+
+
+# Preprocessors moved to `nbdocs.preprocessors`, imported on access - nbconvert is slow to import.
+PREPROCESSORS = (
+    "CorrectMdImageLinkPreprocessor",
+    "HideFlagsPreprocessor",
+    "MarkOutputPreprocessor",
+    "RemoveEmptyCellPreprocessor",
+)
+
+
+def __getattr__(name: str) -> object:
+    if name in PREPROCESSORS:
+        from nbdocs import preprocessors  # pylint: disable=import-outside-toplevel
+
+        return getattr(preprocessors, name)
+    if name == "generate_flags_string":  # moved to `nbdocs.flags`
+        from nbdocs import flags  # pylint: disable=import-outside-toplevel
+
+        return flags.generate_flags_string
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,110 @@
+"""Profile build with cProfile, save stats to `.prof` file.
+Each notebook converted at own frame, named `nb:<notebook>`, so notebook boundaries
+visible at profile viewers (snakeviz, pstats)."""
+
+from __future__ import annotations
+
+import cProfile
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from types import FunctionType
+from typing import Any, Callable, ContextManager, Iterator, Sequence, TypeVar
+
+from nbdocs.core import get_ignore_re
+from nbdocs.typing import PathOrStr
+
+T = TypeVar("T")
+
+# Profiler of current build, set by `profile_build`.
+_active_profiler: BuildProfiler | None = None
+
+
+def _nb_frame(func: Callable[..., T], *args: Any) -> T:
+    return func(*args)
+
+
+def named_frame(name: str) -> Callable[..., Any]:
+    """Return copy of `_nb_frame` with code named `name`.
+    Call `named_frame(name)(func, *args)` run func at frame with this name."""
+    code = _nb_frame.__code__.replace(co_name=name)
+    return FunctionType(code, _nb_frame.__globals__, name)
+
+
+class BuildProfiler:
+    """cProfile profiler for notebooks conversion.
+
+    Args:
+        notebooks (Sequence[str], optional): Glob patterns of notebooks to profile,
+            matched with name and path. Defaults to None - profile whole run.
+    """
+
+    def __init__(self, notebooks: Sequence[str] | None = None) -> None:
+        self.profiler = cProfile.Profile()
+        self.re_notebooks = get_ignore_re(notebooks or ())
+
+    def chosen(self, nb_fn: Path) -> bool:
+        """Is notebook profiled separately."""
+        if self.re_notebooks is None:
+            return False
+        names = (nb_fn.name, nb_fn.as_posix())
+        return any(self.re_notebooks.match(name) for name in names)
+
+    def convert(self, func: Callable[..., T], nb_fn: Path, *args: Any) -> T:
+        """Run `func(nb_fn, *args)` at frame named by notebook.
+        If notebooks chosen, profile only chosen ones."""
+        frame = named_frame(f"nb:{nb_fn.as_posix()}")
+        if not self.chosen(nb_fn):
+            return frame(func, nb_fn, *args)  # type: ignore
+        self.profiler.enable()
+        try:
+            return frame(func, nb_fn, *args)  # type: ignore
+        finally:
+            self.profiler.disable()
+
+
+def get_profiler() -> BuildProfiler | None:
+    """Return profiler of current build, None if not profiling."""
+    return _active_profiler
+
+
+@contextmanager
+def profile_build(
+    filename: PathOrStr,
+    notebooks: Sequence[str] | None = None,
+) -> Iterator[BuildProfiler]:
+    """Profile conversion, write stats to `filename` at exit.
+    Notebooks converted at one process while profiling.
+
+    Args:
+        filename (PathOrStr): File for stats, `.prof`.
+        notebooks (Sequence[str], optional): Glob patterns of notebooks to profile.
+            Defaults to None - profile whole run.
+
+    Example:
+        >>> with profile_build("build.prof"):  # doctest: +SKIP
+        ...     convert2md(nb_names, cfg)
+    """
+    global _active_profiler  # pylint: disable=global-statement
+    profiler = BuildProfiler(notebooks)
+    _active_profiler = profiler
+    if profiler.re_notebooks is None:
+        profiler.profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.profiler.disable()
+        _active_profiler = None
+        profiler.profiler.dump_stats(str(filename))
+
+
+def profile_if(
+    filename: PathOrStr | None, notebooks: str | None = None
+) -> ContextManager[BuildProfiler | None]:
+    """Return `profile_build` context if filename given, else null context.
+    Notebooks - comma separated glob patterns, as at app options."""
+    if filename is None:
+        return nullcontext()
+    patterns = None
+    if notebooks:
+        patterns = [pattern.strip() for pattern in notebooks.split(",")]
+    return profile_build(filename, patterns)
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import os
+import re
+from binascii import a2b_base64
+from typing import Any
+from urllib.parse import quote
+
+from nbformat import NotebookNode
+
+from nbdocs.cache import CellCache
+from nbdocs.process import (
+    cell_process_flags,
+    md_find_image_names,
+    md_process_output_flag,
+)
+from nbdocs.timings import NULL_TIMER, NullTimer
+from nbdocs.typing import Cell, CodeCell, Nb, Output
+
+# Same as nbconvert MarkdownExporter display_data_priority.
+DISPLAY_DATA_PRIORITY = [
+    "text/html",
+    "text/markdown",
+    "image/svg+xml",
+    "text/latex",
+    "image/png",
+    "image/jpeg",
+    "text/plain",
+]
+# Types extracted to files by nbconvert ExtractOutputPreprocessor.
+EXTRACT_OUTPUT_TYPES = {"image/png", "image/jpeg", "image/svg+xml", "application/pdf"}
+IMAGE_TYPES = {"image/png": (".png", "png"), "image/jpeg": (".jpg", "jpeg")}
+NATIVE_DATA_TYPES = {"text/plain", *IMAGE_TYPES}
+re_cell_magic = re.compile(r"^\s*%%")
+
+
+def get_data_type(data: dict[str, Any]) -> str | None:
+    """Return data type to render - first from priority list."""
+    for data_type in DISPLAY_DATA_PRIORITY:
+        if data_type in data:
+            return data_type
+    return None
+
+
+def output_supported(output: Output) -> bool:
+    """Check if output can be rendered by native renderer."""
+    if output["output_type"] == "stream":
+        return True
+    if output["output_type"] not in ("execute_result", "display_data"):
+        return False
+    data = output.get("data", {})
+    if "filename" in output.get("metadata", {}):  # named output file
+        return False
+    if not EXTRACT_OUTPUT_TYPES.intersection(data).issubset(IMAGE_TYPES):
+        return False
+    return get_data_type(data) in NATIVE_DATA_TYPES
+
+
+def cell_supported(cell: Cell) -> bool:
+    """Check if cell can be rendered by native renderer."""
+    if cell.cell_type == "markdown":
+        return not cell.get("attachments")
+    if cell.cell_type != "code":
+        return False
+    if re_cell_magic.match(cell.source) or "magics_language" in cell.metadata:
+        return False
+    return all(output_supported(output) for output in cell.outputs)
+
+
+def nb_supported(nb: Nb) -> bool:
+    """Check if all cells at notebook can be rendered by native renderer."""
+    return all(cell_supported(cell) for cell in nb.cells)
+
+
+def indent(text: str, nspaces: int = 4) -> str:
+    """Indent text, same as nbconvert `indent` filter."""
+    ind = " " * nspaces
+    result = ind + text.replace("\n", "\n" + ind)
+    if result.endswith(os.linesep + ind):
+        return result[: -len(ind)]
+    return result
+
+
+def copy_code_cell(cell: CodeCell) -> CodeCell:
+    """Copy code cell for processing flags - cell, metadata, outputs and output data.
+    Output data values are not copied."""
+    outputs = [NotebookNode(output) for output in cell.outputs]
+    for output in outputs:
+        if "data" in output:
+            output["data"] = NotebookNode(output["data"])
+    return NotebookNode(  # type: ignore
+        {**cell, "metadata": NotebookNode(cell.metadata), "outputs": outputs}
+    )
+
+
+def extract_outputs(
+    cell: CodeCell,
+    cell_index: int,
+    resources: dict[str, Any],
+) -> dict[int, str]:
+    """Extract images from cell outputs to resources["outputs"],
+    names same as nbconvert ExtractOutputPreprocessor.
+
+    Returns:
+        Dict[int, str]: output index: filename of rendered image.
+    """
+    unique_key = resources.get("unique_key", "output")
+    filenames: dict[int, str] = {}
+    for index, output in enumerate(cell.outputs):
+        data = output.get("data", {})
+        for mime_type, (extension, _) in IMAGE_TYPES.items():
+            if mime_type in data:
+                filename = f"{unique_key}_{cell_index}_{index}{extension}"
+                resources["outputs"][filename] = a2b_base64(data[mime_type])
+                if get_data_type(data) == mime_type:
+                    filenames[index] = filename
+    return filenames
+
+
+def render_output(output: Output, image_filename: str | None) -> str:
+    """Render cell output, same as nbconvert markdown template."""
+    if output["output_type"] == "stream":
+        return f"\n{indent(output['text'])}\n"
+    data_type = get_data_type(output["data"])
+    if data_type == "text/plain":
+        result = f"\n{indent(output['data']['text/plain'])}\n"
+    else:
+        alt = IMAGE_TYPES[data_type][1]  # type: ignore
+        result = f"\n    \n![{alt}]({quote(image_filename)})\n    \n"  # type: ignore
+    if output["output_type"] == "execute_result":
+        return f"\n\n\n{result}\n\n"
+    return f"\n{result}\n"
+
+
+def render_code_cell(
+    cell: CodeCell, language: str, image_filenames: dict[int, str]
+) -> str:
+    """Render code cell, same as nbconvert markdown template."""
+    result = ""
+    if not cell.metadata.get("transient", {}).get("remove_source", False):
+        result = f"\n\n```{language}\n{cell.source}\n```\n"
+    for index, output in enumerate(cell.outputs):
+        result += render_output(output, image_filenames.get(index))
+    return result
+
+
+def render_nb(nb: Nb, resources: dict[str, Any]) -> str:
+    """Render notebook to markdown.
+    Process cells same way as nbconvert MarkdownExporter with nbdocs preprocessors:
+    extract outputs, remove empty cells, process hide flags and mark outputs.
+
+    Args:
+        nb (Nb): Notebook, cells must be supported by native renderer.
+        resources (Dict[str, Any]): Resources, extracted images put to resources["outputs"].
+
+    Returns:
+        str: Markdown, output flags not processed.
+    """
+    language_info = nb.metadata.get("language_info", {})
+    language = str(language_info["name"]) if "name" in language_info else ""
+    fragments = []
+    for cell_index, cell in enumerate(nb.cells):
+        if cell.cell_type == "markdown":
+            fragments.append(f"\n{cell.source}\n")
+            continue
+        cell = copy_code_cell(cell)  # type: ignore
+        image_filenames = extract_outputs(cell, cell_index, resources)
+        cell_process_flags(cell)
+        fragments.append(render_code_cell(cell, language, image_filenames))
+    return "".join(fragments).lstrip("\r\n")
+
+
+class NativeMdConverter:
+    """Markdown converter, render notebook straight from cell list, without nbconvert.
+    Result same as MdConverter for supported subset: markdown and code cells,
+    stream, text/plain, png and jpeg outputs.
+    Other notebooks converted by MdConverter, it created at first use.
+    """
+
+    def __init__(self) -> None:
+        self._fallback: Any = None
+
+    @property
+    def fallback(self) -> Any:
+        """MdConverter for notebooks not supported by native renderer."""
+        if self._fallback is None:
+            from nbdocs.exporter import (  # pylint: disable=import-outside-toplevel
+                MdConverter,
+            )
+
+            self._fallback = MdConverter()
+        return self._fallback
+
+    def nb2md(
+        self,
+        nb: Nb,
+        resources: dict[str, Any] | None = None,
+        cell_cache: CellCache | None = None,
+        timer: NullTimer = NULL_TIMER,
+    ) -> tuple[str, dict[str, Any]]:
+        """Convert Nb to Markdown. Fall back to MdConverter if nb not supported."""
+        if not nb_supported(nb):
+            return self.fallback.nb2md(nb, resources, cell_cache, timer)
+        if resources is None:
+            resources = {}
+        if not isinstance(resources.get("outputs"), dict):
+            resources["outputs"] = {}
+        resources["output_extension"] = ".md"
+        with timer.stage("render"):
+            md = render_nb(nb, resources)
+        with timer.stage("output_flag"):
+            md = md_process_output_flag(md)
+        if image_names := md_find_image_names(md):
+            resources["image_names"] = image_names
+        return md, resources
+
+    def __call__(
+        self, nb: Nb, resources: dict[str, Any] | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        """Convert Nb to Markdown."""
+        return self.nb2md(nb, resources)
@@ -0,0 +1,271 @@
+"""Local preview server: notebooks rendered on request, pages kept at LRU cache.
+Page for notebook at `/<md name>`, same path as md file at docs.
+"""
+
+from __future__ import annotations
+
+import html
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from mimetypes import guess_type
+from pathlib import Path, PurePosixPath
+from typing import Any
+from urllib.parse import quote, unquote, urlsplit
+
+from rich import print as rprint
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.convert import create_md_converter, nb2md_memory
+from nbdocs.core import FileHashes, get_md_name, get_nb_names
+
+MB = 1024 * 1024
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+class LRUCache:
+    """Cache with size limit, least recently used items removed first.
+
+    Args:
+        max_size (int): Max total size of items, bytes.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self._items: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._items
+
+    def get(self, key: Any) -> Any:
+        """Return value for key, None if not in cache."""
+        if key not in self._items:
+            return None
+        self._items.move_to_end(key)
+        return self._items[key][0]
+
+    def put(self, key: Any, value: Any, size: int) -> None:
+        """Put value to cache, remove least recently used items over size limit.
+        Last put item kept even if bigger than limit."""
+        self.pop(key)
+        self._items[key] = (value, size)
+        self.size += size
+        while self.size > self.max_size and len(self._items) > 1:
+            _, (_, item_size) = self._items.popitem(last=False)
+            self.size -= item_size
+
+    def pop(self, key: Any) -> None:
+        """Remove key from cache."""
+        if key in self._items:
+            self.size -= self._items.pop(key)[1]
+
+
+@dataclass
+class Page:
+    """Rendered notebook."""
+
+    md: str
+    html: str
+    images: dict[str, bytes] = field(default_factory=dict)  # path relative to md
+
+    @property
+    def size(self) -> int:
+        return len(self.md) + len(self.html) + sum(map(len, self.images.values()))
+
+
+def md2html(md: str, title: str) -> str:
+    """Render markdown to html page. Use `markdown` package if installed (comes with mkdocs),
+    else page with markdown source."""
+    try:
+        import markdown  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        body = f"<pre>{html.escape(md)}</pre>"
+    else:
+        body = markdown.markdown(md, extensions=["fenced_code", "tables"])
+    return PAGE_TEMPLATE.format(title=html.escape(title), body=body)
+
+
+class NbPreview:
+    """Render notebooks on request, keep pages at LRU cache with key - notebook content hash.
+    Changed notebook rendered again on next request.
+
+    Args:
+        cfg (NbDocsCfg): NbDocsCfg.
+        cache_size (int, optional): Cache size, bytes. Defaults to 256 MB.
+    """
+
+    def __init__(self, cfg: NbDocsCfg, cache_size: int = 256 * MB) -> None:
+        self.cfg = cfg
+        self.nbs_path = Path(cfg.notebooks_path)
+        self.cache = LRUCache(cache_size)
+        self.renders = 0
+        self._lock = threading.Lock()
+        self._md_converter: Any = None
+        self._pages: dict[str, Path] = {}  # page path: notebook
+        self._hashes = FileHashes()
+        self._page_keys: dict[str, tuple[str, str]] = {}  # page path: cache key
+        self._images: dict[str, tuple[str, str]] = {}  # image path: page path, name
+
+    def scan(self) -> dict[str, Path]:
+        """Find notebooks, return page paths and notebooks."""
+        nb_names = get_nb_names(
+            self.nbs_path, self.cfg.recursive, self.cfg.ignore_patterns
+        )
+        self._pages = {
+            get_md_name(nb_fn, self.nbs_path).as_posix(): nb_fn for nb_fn in nb_names
+        }
+        return self._pages
+
+    def get_nb(self, page_path: str) -> Path | None:
+        """Return notebook for page path, rescan notebooks if not found."""
+        if page_path not in self._pages or not self._pages[page_path].exists():
+            self.scan()
+        return self._pages.get(page_path)
+
+    def nb_hash(self, nb_fn: Path) -> str:
+        """Return content hash of notebook, hash recalculated only if stat changed."""
+        return self._hashes.hash(nb_fn)
+
+    def page(self, page_path: str) -> Page | None:
+        """Return page for page path, render notebook if not at cache.
+        None if no notebook for page path."""
+        with self._lock:
+            nb_fn = self.get_nb(page_path)
+            if nb_fn is None:
+                return None
+            key = (page_path, self.nb_hash(nb_fn))
+            page = self.cache.get(key)
+            if page is None:
+                if (old_key := self._page_keys.get(page_path)) is not None:
+                    self.cache.pop(old_key)  # notebook changed
+                page = self.render(nb_fn, page_path)
+                self.cache.put(key, page, page.size)
+                self._page_keys[page_path] = key
+                parent = PurePosixPath(page_path).parent
+                for image_name in page.images:
+                    self._images[(parent / image_name).as_posix()] = (
+                        page_path,
+                        image_name,
+                    )
+            return page  # type: ignore
+
+    def render(self, nb_fn: Path, page_path: str) -> Page:
+        """Render notebook to page."""
+        if self._md_converter is None:
+            self._md_converter = create_md_converter(self.cfg.engine)
+        result = nb2md_memory(
+            nb_fn.read_bytes(),
+            self.cfg,
+            nb_fn.stem,
+            source_path=nb_fn.parent,
+            md_converter=self._md_converter,
+        )
+        self.renders += 1
+        return Page(result.md, md2html(result.md, page_path), result.images)
+
+    def image(self, path: str) -> bytes | None:
+        """Return image for path: from rendered page or notebooks dir."""
+        if path in self._images:
+            page_path, image_name = self._images[path]
+            page = self.page(page_path)  # rendered again if removed from cache
+            if page is not None and image_name in page.images:
+                return page.images[image_name]
+        return self.static(path)
+
+    def static(self, path: str) -> bytes | None:
+        """Return file from notebooks dir, None if not exists or out of dir."""
+        root = self.nbs_path.resolve()
+        filename = (root / path).resolve()
+        if root not in filename.parents or not filename.is_file():
+            return None
+        return filename.read_bytes()
+
+    def index(self) -> str:
+        """Html page with links to notebooks."""
+        links = "\n".join(
+            f'<li><a href="/{quote(page_path)}">{html.escape(page_path)}</a></li>'
+            for page_path in sorted(self.scan())
+        )
+        return PAGE_TEMPLATE.format(
+            title="NbDocs preview", body=f"<ul>\n{links}\n</ul>"
+        )
+
+
+class PreviewHandler(BaseHTTPRequestHandler):
+    """Request handler for NbPreview, `preview` set at subclass by `create_server`."""
+
+    preview: NbPreview
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        path = unquote(urlsplit(self.path).path).lstrip("/")
+        if path in ("", "index.html"):
+            self.send(self.preview.index().encode("utf-8"), "text/html")
+            return
+        if path.endswith(".md"):
+            page = self.preview.page(path)
+            if page is not None:
+                self.send(page.html.encode("utf-8"), "text/html")
+                return
+        elif (data := self.preview.image(path)) is not None:
+            self.send(data, guess_type(path)[0] or "application/octet-stream")
+            return
+        self.send_error(404, f"Not found: {path}")
+
+    def send(self, data: bytes, content_type: str) -> None:
+        """Send response with data."""
+        self.send_response(200)
+        if content_type.startswith("text/"):
+            content_type += "; charset=utf-8"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def create_server(
+    preview: NbPreview, host: str = "127.0.0.1", port: int = 8000
+) -> ThreadingHTTPServer:
+    """Create http server for preview, port 0 - any free port."""
+    handler = type("Handler", (PreviewHandler,), {"preview": preview})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(
+    cfg: NbDocsCfg,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    cache_size: int = 256 * MB,
+) -> None:
+    """Serve notebooks preview, notebooks rendered on request.
+
+    Args:
+        cfg (NbDocsCfg): NbDocsCfg
+        host (str, optional): Host. Defaults to "127.0.0.1".
+        port (int, optional): Port. Defaults to 8000.
+        cache_size (int, optional): Rendered pages cache size, bytes. Defaults to 256 MB.
+    """
+    server = create_server(NbPreview(cfg, cache_size), host, port)
+    rprint(f"Serving {cfg.notebooks_path} at http://{host}:{server.server_port}/")
+    rprint("Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        rprint("Stop serving.")
+    finally:
+        server.server_close()
@@ -4,6 +4,7 @@ from pathlib import Path, PosixPath
 
 from nbformat import v4 as nbformat
 
+from nbdocs.core import write_nb
 from nbdocs.typing import Nb, Cell, CodeCell, MarkdownCell, Metadata, Output
 
 
@@ -145,3 +146,30 @@ def create_tmp_image_file(image_name: PosixPath | Path) -> None:
     """
     with open(image_name, "wb") as fh:
         fh.write(b"X===")
+
+
+def create_nbs(nbs_path: Path, number: int, md_image: bool = False) -> list[Path]:
+    """Create test notebooks `nb_<num>` with code `code_<num>` at `nbs_path/sub`.
+
+    Args:
+        nbs_path (Path): Notebooks path.
+        number (int): Number of notebooks.
+        md_image (bool, optional): Add markdown cell with link to image `img/dog.png`,
+            image created. Defaults to False.
+
+    Returns:
+        List[Path]: Notebooks filenames.
+    """
+    (nbs_path / "sub").mkdir(parents=True)
+    md_source = None
+    if md_image:
+        (nbs_path / "sub" / "img").mkdir()
+        (nbs_path / "sub" / "img" / "dog.png").write_bytes(b"dog")
+        md_source = "![dog](img/dog.png)"
+    return [
+        write_nb(
+            create_test_nb(code_source=f"code_{num}", md_source=md_source),
+            nbs_path / "sub" / f"nb_{num}.ipynb",
+        )
+        for num in range(number)
+    ]
@@ -0,0 +1,235 @@
+"""Timings and memory of conversion stages, enabled by `--timings`, `--memory`."""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, ContextManager, Iterator
+
+from nbdocs.typing import PathOrStr
+
+if TYPE_CHECKING:  # pragma: no cover
+    from nbdocs.cfg_tools import NbDocsCfg
+    from nbdocs.convert import NbConvertResult
+
+_NULL_STAGE = nullcontext()
+# Python 3.8 has no reset_peak - peak of stage can not be separated from
+# previous stages, only `total` memory recorded.
+STAGE_MEMORY = hasattr(tracemalloc, "reset_peak")
+MB = 1024 * 1024
+
+
+class NullTimer:
+    """Stage timer that records nothing, used when timings disabled."""
+
+    enabled = False
+
+    def __init__(self) -> None:
+        self.stages: dict[str, float] = {}
+        self.memory: dict[str, tuple[int, int]] = {}
+
+    def __enter__(self) -> NullTimer:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def stage(  # pylint: disable=unused-argument
+        self, name: str
+    ) -> ContextManager[None]:
+        """Context manager for stage - no op."""
+        return _NULL_STAGE
+
+
+class StageTimer(NullTimer):
+    """Record wall time of conversion stages, seconds.
+    Stage started inside other stage named with parent prefix: `export/render`.
+    If `memory` - trace memory with tracemalloc, record peak and retained bytes
+    of stages, `total` for whole block of timer context.
+    At Python 3.8 (no `tracemalloc.reset_peak`) only `total` recorded.
+    """
+
+    enabled = True
+
+    def __init__(self, memory: bool = False) -> None:
+        super().__init__()
+        self.prefix = ""
+        self.trace_memory = memory
+        self.stage_memory = memory and STAGE_MEMORY
+        self._memory_stack: list[list[int]] = []  # [current at start, peak]
+        self._tracemalloc_started = False
+
+    def __enter__(self) -> StageTimer:
+        if self.trace_memory:
+            self._tracemalloc_started = not tracemalloc.is_tracing()
+            if self._tracemalloc_started:
+                tracemalloc.start()
+            self._memory_enter()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        if self.trace_memory:
+            self._memory_exit("total")
+            if self._tracemalloc_started:
+                tracemalloc.stop()
+
+    def _update_peaks(self, peak: int) -> None:
+        for item in self._memory_stack:
+            item[1] = max(item[1], peak)
+
+    def _memory_enter(self) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self._update_peaks(peak)
+        if self.stage_memory:
+            tracemalloc.reset_peak()
+        self._memory_stack.append([current, current])
+
+    def _memory_exit(self, name: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self._update_peaks(peak)
+        start, stage_peak = self._memory_stack.pop()
+        prev_peak, prev_retained = self.memory.get(name, (0, 0))
+        self.memory[name] = (
+            max(prev_peak, stage_peak - start),
+            prev_retained + current - start,
+        )
+        if self.stage_memory:
+            tracemalloc.reset_peak()
+
+    @contextmanager  # type: ignore
+    def stage(self, name: str) -> Iterator[None]:
+        """Context manager, add time of block to stage `name`."""
+        parent_prefix = self.prefix
+        full_name = f"{parent_prefix}{name}"
+        self.prefix = f"{full_name}/"
+        if self.stage_memory:
+            self._memory_enter()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[full_name] = (
+                self.stages.get(full_name, 0.0) + time.perf_counter() - start
+            )
+            if self.stage_memory:
+                self._memory_exit(full_name)
+            self.prefix = parent_prefix
+
+
+def create_timer(timings: bool = False, memory: bool = False) -> NullTimer:
+    """Return StageTimer if timings or memory enabled, else shared NullTimer."""
+    if timings or memory:
+        return StageTimer(memory=memory)
+    return NULL_TIMER
+
+
+NULL_TIMER = NullTimer()
+
+
+def stages_total(stages: dict[str, float]) -> float:
+    """Return sum of top level stages."""
+    return sum(value for name, value in stages.items() if "/" not in name)
+
+
+def print_timings(results: list[NbConvertResult], top: int = 5) -> None:
+    """Print slowest notebooks and stages, summed for all notebooks.
+
+    Args:
+        results (List[NbConvertResult]): Conversion results with timings.
+        top (int, optional): Number of slowest notebooks to print. Defaults to 5.
+    """
+    results = [result for result in results if result.timings]
+    if not results:
+        return
+    print(f"Slowest notebooks, of {len(results)}:")
+    for result in sorted(results, key=lambda res: -stages_total(res.timings))[:top]:
+        print(f"{stages_total(result.timings):>10.4f}  {result.nb_fn}")
+    stages: dict[str, float] = {}
+    for result in results:
+        for name, value in result.timings.items():
+            stages[name] = stages.get(name, 0.0) + value
+    print("Stages, all notebooks:")
+    for name, value in sorted(stages.items(), key=lambda item: -item[1]):
+        print(f"{value:>10.4f}  {name}")
+
+
+def write_timings(results: list[NbConvertResult], filename: Path) -> None:
+    """Write timings to file as json lines, one line per notebook.
+
+    Args:
+        results (List[NbConvertResult]): Conversion results with timings.
+        filename (Path): File to write.
+    """
+    with filename.open("w", encoding="utf-8") as fh:
+        for result in results:
+            if result.timings:
+                line = {
+                    "nb": result.nb_fn.as_posix(),
+                    "total": stages_total(result.timings),
+                    "stages": result.timings,
+                }
+                if result.memory:
+                    line["memory"] = result.memory
+                fh.write(json.dumps(line) + "\n")
+
+
+def report_timings(
+    results: list[NbConvertResult],
+    cfg: NbDocsCfg,
+    filename: PathOrStr | None = None,
+) -> None:
+    """Print timings and memory of stages if enabled at cfg,
+    write it to file if filename given."""
+    if cfg.timings:
+        print_timings(results)
+    if cfg.memory:
+        usage = {result.nb_fn: result.memory for result in results}
+        print_memory(usage, cfg.memory_budget)
+    if filename is not None:
+        write_timings(results, Path(filename))
+
+
+def print_memory(
+    usage: dict[Path, dict[str, tuple[int, int]]],
+    budget: float = 0,
+    top: int = 5,
+) -> list[Path]:
+    """Print notebooks with biggest memory peak and peak of stages.
+    Notebooks with peak over budget marked.
+
+    Args:
+        usage (Dict[Path, Dict[str, Tuple[int, int]]]): Notebook: stage: (peak, retained) bytes.
+        budget (float, optional): Memory budget for notebook, MB. Defaults to 0 - no budget.
+        top (int, optional): Number of notebooks to print. Defaults to 5.
+
+    Returns:
+        List[Path]: Notebooks over budget.
+    """
+    usage = {nb_fn: memory for nb_fn, memory in usage.items() if memory}
+    if not usage:
+        return []
+    over_budget = [
+        nb_fn
+        for nb_fn, memory in usage.items()
+        if budget and memory["total"][0] > budget * MB
+    ]
+    print(f"Memory peak / retained, MB, of {len(usage)} notebooks:")
+    by_peak = sorted(usage, key=lambda nb_fn: -usage[nb_fn]["total"][0])
+    for nb_fn in by_peak[:top] + [
+        nb_fn for nb_fn in over_budget if nb_fn not in by_peak[:top]
+    ]:
+        peak, retained = usage[nb_fn]["total"]
+        mark = f"  over budget {budget} MB" if nb_fn in over_budget else ""
+        print(f"{peak / MB:>10.2f}{retained / MB:>10.2f}  {nb_fn}{mark}")
+    stages: dict[str, int] = {}
+    for memory in usage.values():
+        for name, (peak, _) in memory.items():
+            stages[name] = max(stages.get(name, 0), peak)
+    stages.pop("total")
+    print("Stages, max peak, MB:")
+    for name, peak in sorted(stages.items(), key=lambda item: -item[1]):
+        print(f"{peak / MB:>10.2f}  {name}")
+    return over_budget
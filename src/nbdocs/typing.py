@@ -1,5 +1,6 @@
 from pathlib import Path, PosixPath
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     List,
@@ -11,7 +12,10 @@ from typing import (
     runtime_checkable,
 )
 
-from nbconvert.exporters.exporter import ResourcesDict
+if TYPE_CHECKING:  # pragma: no cover
+    from nbconvert.exporters.exporter import ResourcesDict
+else:  # nbconvert is slow to import, not needed at runtime here.
+    ResourcesDict = Dict[str, Any]
 
 PathOrStr = TypeVar("PathOrStr", Path, PosixPath, str)
 
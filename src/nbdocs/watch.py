@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+from rich import print as rprint
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.convert import convert2md, create_md_converter, filter_changed
+from nbdocs.core import iter_nb_entries
+
+if TYPE_CHECKING:  # pragma: no cover
+    from nbdocs.exporter import MdConverter
+
+NbStat = Tuple[int, int]  # size, mtime_ns
+
+
+def scan_nb_stats(
+    path: Path, recursive: bool = False, ignore: Sequence[str] = ()
+) -> dict[Path, NbStat]:
+    """Return size and modification time of notebooks at `path`.
+
+    Args:
+        path (Path): Path with notebooks.
+        recursive (bool, optional): Scan subdirectories. Defaults to False.
+        ignore (Sequence[str], optional): Glob patterns to skip files and dirs. Defaults to ().
+
+    Returns:
+        Dict[Path, Tuple[int, int]]: Notebook filename: (size, mtime_ns).
+    """
+    stats: dict[Path, NbStat] = {}
+    for nb_fn, entry in iter_nb_entries(path, recursive, ignore):
+        stat = entry.stat()
+        stats[nb_fn] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+class NbWatcher:
+    """Watch notebooks at path for changes by polling stat of files.
+
+    Args:
+        path (Path): Path with notebooks.
+        recursive (bool, optional): Watch subdirectories. Defaults to False.
+        ignore (Sequence[str], optional): Glob patterns to skip files and dirs. Defaults to ().
+    """
+
+    def __init__(
+        self, path: Path, recursive: bool = False, ignore: Sequence[str] = ()
+    ) -> None:
+        self.path = path
+        self.recursive = recursive
+        self.ignore = ignore
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict[Path, NbStat]:
+        """Return stats of watched notebooks."""
+        return scan_nb_stats(self.path, self.recursive, self.ignore)
+
+    def poll(self) -> list[Path]:
+        """Return notebooks added or changed since last poll."""
+        snapshot = self.scan()
+        changed = [
+            nb_fn
+            for nb_fn, stat in snapshot.items()
+            if self.snapshot.get(nb_fn) != stat
+        ]
+        self.snapshot = snapshot
+        return sorted(changed)
+
+    def wait_changes(self, interval: float = 0.1, debounce: float = 0.1) -> list[Path]:
+        """Wait for changes. When got changes, wait until no new changes for `debounce`
+        seconds, so burst of saves give one result.
+
+        Args:
+            interval (float, optional): Poll interval, seconds. Defaults to 0.1.
+            debounce (float, optional): Quiet time after last change, seconds. Defaults to 0.1.
+
+        Returns:
+            List[Path]: Changed notebooks.
+        """
+        while not (changed := set(self.poll())):
+            time.sleep(interval)
+        while True:
+            time.sleep(debounce)
+            if not (new_changes := self.poll()):
+                return sorted(changed)
+            changed.update(new_changes)
+
+
+def convert_round(
+    nb_names: list[Path], cfg: NbDocsCfg, md_converter: MdConverter
+) -> bool:
+    """Convert notebooks, print error instead of raise - watcher keeps running.
+    Return True if converted without errors."""
+    try:
+        convert2md(nb_names, cfg, md_converter=md_converter)
+    except Exception as err:  # pylint: disable=broad-except
+        rprint(f"Error converting: {type(err).__name__}: {err}")
+        return False
+    return True
+
+
+def watch(
+    cfg: NbDocsCfg,
+    interval: float = 0.1,
+    debounce: float = 0.1,
+    max_rounds: int | None = None,
+) -> None:
+    """Watch notebooks at `cfg.notebooks_path`, convert changed with warm converter.
+
+    Args:
+        cfg (NbDocsCfg): NbDocsCfg
+        interval (float, optional): Poll interval, seconds. Defaults to 0.1.
+        debounce (float, optional): Quiet time after last change, seconds. Defaults to 0.1.
+        max_rounds (int, optional): Stop after number of conversions. Defaults to None.
+    """
+    nbs_path = Path(cfg.notebooks_path)
+    md_converter = create_md_converter(cfg.engine)
+    watcher = NbWatcher(nbs_path, cfg.recursive, cfg.ignore_patterns)
+    if nb_names := filter_changed(sorted(watcher.snapshot), cfg):
+        rprint(f"To convert: {len(nb_names)} notebooks.")
+        convert_round(nb_names, cfg, md_converter)
+    rprint(f"Watching {nbs_path}, press Ctrl+C to stop.")
+    rounds = 0
+    try:
+        while max_rounds is None or rounds < max_rounds:
+            nb_names = watcher.wait_changes(interval, debounce)
+            start = time.perf_counter()
+            if convert_round(nb_names, cfg, md_converter):
+                rprint(
+                    f"Converted: {', '.join(nb_fn.name for nb_fn in nb_names)}"
+                    f" in {time.perf_counter() - start:.3f}s."
+                )
+            rounds += 1
+    except KeyboardInterrupt:
+        rprint("Stop watching.")
@@ -1,9 +1,12 @@
 from pathlib import Path
-from pytest import CaptureFixture
+from pytest import CaptureFixture, MonkeyPatch
 
 from nbdocs.apps.app_nbclean import main as app_nbclean
 
 from nbdocs.apps.app_nb2md import main as app_nb2md
+from nbdocs.apps.app_nbdocs import main as app_nbdocs
+from nbdocs.core import write_nb
+from nbdocs.tests.base import create_test_nb
 
 
 def test_app_nbclean_def(capsys: CaptureFixture[str]):
@@ -118,3 +121,47 @@ def test_app_nb2md(tmp_path: Path, capsys: CaptureFixture[str]):
     assert "No files with changes to convert!" in out
     err_out = captured.err
     assert err_out == ""
+
+
+def test_app_nbdocs_gc(
+    tmp_path: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+):
+    """test nbdocs gc"""
+    monkeypatch.chdir(tmp_path)
+    Path("nbs").mkdir()
+    write_nb(create_test_nb(code_source="code"), Path("nbs/nb.ipynb"))
+    app_nbdocs([])
+    assert Path("docs/nb.md").exists()
+    Path("nbs/nb.ipynb").unlink()
+    capsys.readouterr()
+    app_nbdocs(["gc", "-n"])
+    out = capsys.readouterr().out
+    assert "docs/nb.md" in out
+    assert "To remove: 2 files." in out
+    assert Path("docs/nb.md").exists()
+    app_nbdocs(["gc"])
+    assert "Removed: 2 files." in capsys.readouterr().out
+    assert not Path("docs/nb.md").exists()
+
+
+def test_app_nbdocs_auto_gc(
+    tmp_path: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+):
+    """auto_gc - files of deleted notebook removed when nothing to convert"""
+    monkeypatch.chdir(tmp_path)
+    Path("nbdocs.ini").write_text("[nbdocs]\nauto_gc = true\n", encoding="utf-8")
+    Path("nbs").mkdir()
+    for name in ("nb_1", "nb_2"):
+        write_nb(create_test_nb(code_source="code"), Path(f"nbs/{name}.ipynb"))
+    app_nbdocs([])
+    Path("nbs/nb_2.ipynb").unlink()
+    capsys.readouterr()
+    try:
+        app_nbdocs([])
+    except SystemExit as e:
+        assert e.code is None
+    out = capsys.readouterr().out
+    assert "Removed 2 files of deleted notebooks." in out
+    assert "No files to convert!" in out
+    assert not Path("docs/nb_2.md").exists()
+    assert Path("docs/nb_1.md").exists()
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from nbdocs.bench.corpus import CORPORA, CorpusSpec, create_corpus_nb, write_corpus
+from nbdocs.bench.run import (
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from nbdocs.core import read_nb
+
+
+def test_corpus(tmp_path: Path):
+    """synthetic corpus"""
+    spec = CorpusSpec("test", nbs=2, cells=3, images=2, flags=1.0)
+    nb = create_corpus_nb(spec)
+    assert len(nb.cells) == 6
+    assert nb == create_corpus_nb(spec)  # deterministic
+    assert nb != create_corpus_nb(spec, seed=1)
+    code_cells = [cell for cell in nb.cells if cell.cell_type == "code"]
+    assert all(cell.source.startswith("# ") for cell in code_cells)
+    outputs = code_cells[0].outputs
+    images = [output for output in outputs if "image/png" in output.get("data", {})]
+    assert len(images) == 3  # test output and 2 images
+    nb_names = write_corpus(spec, tmp_path)
+    assert len(nb_names) == 2
+    assert read_nb(nb_names[0]) == nb
+    spec = CORPORA["few_huge"].scaled(0.01)
+    assert (spec.nbs, spec.cells) == (1, 10)
+
+
+def test_run_benchmarks(tmp_path: Path):
+    """run, save, load, compare results"""
+    results = run_benchmarks(["many_small"], scale=0.01, repeat=2, verbose=False)
+    assert results["meta"]["nbdocs"]
+    benches = {item["bench"] for item in results["results"]}
+    assert benches == {
+        "read_nb",
+        "nb2md",
+        "md_process_output_flag",
+        "md_correct_image_link",
+        "clean_nb_file",
+        "convert2md",
+    }
+    assert all(len(item["times"]) == 2 for item in results["results"])
+    filename = tmp_path / "results.json"
+    save_results(results, filename)
+    loaded = load_results(filename)
+    assert loaded == results
+    rows = compare_results(loaded, results)
+    assert len(rows) == 6
+    assert all(ratio == 1 for *_, ratio in rows)
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from nbdocs.cache import CellCache
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.convert import MdConverter, convert2md, get_cell_cache_name
+from nbdocs.core import read_nb, write_nb
+
+from nbdocs.tests.base import create_code_cell, create_test_nb, create_test_outputs
+
+
+def test_cell_cache_render():
+    """Render with cell cache same as full render, changed cell rendered only"""
+    md_converter = MdConverter()
+    for nb_name in Path("tests/test_nbs").glob("*.ipynb"):
+        nb = read_nb(nb_name)
+        md_expected, _ = md_converter.nb2md(nb)
+        cell_cache = CellCache()
+        md, _ = md_converter.nb2md(nb, cell_cache=cell_cache)
+        assert md == md_expected
+        assert cell_cache.hits == 0
+        # all cells from cache
+        cell_cache = CellCache(cell_cache.fragments)
+        md, _ = md_converter.nb2md(nb, cell_cache=cell_cache)
+        assert md == md_expected
+        assert cell_cache.misses == 0
+        assert not cell_cache.changed
+
+    nb = create_test_nb(code_source="code", md_source="md")
+    nb.cells.append(
+        create_code_cell("# collapse_output\ncode_2", create_test_outputs())
+    )
+    cell_cache = CellCache()
+    md_converter.nb2md(nb, cell_cache=cell_cache)
+    nb.cells[1].source = "md changed"
+    cell_cache = CellCache(cell_cache.fragments)
+    md, _ = md_converter.nb2md(nb, cell_cache=cell_cache)
+    assert md == md_converter.nb2md(nb)[0]
+    assert cell_cache.hits == 2
+    assert cell_cache.misses == 1
+    assert "md changed" in md
+
+
+def test_cell_cache_file(tmp_path: Path):
+    """Cache saved at docs_path, only used fragments kept"""
+    cfg = NbDocsCfg(docs_path=str(tmp_path / "docs"), cell_cache=True)
+    nb = create_test_nb(code_source="code", md_source="md")
+    nb_name = write_nb(nb, tmp_path / "nb.ipynb")
+    convert2md(nb_name, cfg)
+    cache_name = get_cell_cache_name(nb_name, cfg)
+    assert cache_name.exists()
+    cell_cache = CellCache.load(cache_name)
+    assert len(cell_cache.fragments) == 2
+    md_expected = (tmp_path / "docs" / "nb.md").read_text(encoding="utf-8")
+
+    nb.cells[1].source = "md changed"
+    write_nb(nb, nb_name)
+    convert2md(nb_name, cfg)
+    assert len(CellCache.load(cache_name).fragments) == 2
+    md = (tmp_path / "docs" / "nb.md").read_text(encoding="utf-8")
+    assert md == md_expected.replace("md", "md changed")
+
+    cfg = NbDocsCfg(docs_path=str(tmp_path / "no_cache"))  # off by default
+    assert cfg.cell_cache is False
+    convert2md(nb_name, cfg)
+    assert not get_cell_cache_name(nb_name, cfg).exists()
+
+    cache_name.write_text("broken", encoding="utf-8")
+    assert CellCache.load(cache_name).fragments == {}
@@ -0,0 +1,80 @@
+import io
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+from nbdocs.changes import GitError, git_changed, read_files_list, select_changed
+from nbdocs.core import write_nb
+from nbdocs.tests.base import create_test_nb
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@test", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_git_changed(tmp_path: Path):
+    """changed, added and untracked notebooks since ref, deleted skipped"""
+    tmp_path = tmp_path.resolve()
+    nbs_path = tmp_path / "nbs"
+    (nbs_path / "sub").mkdir(parents=True)
+    nb_names = [
+        write_nb(
+            create_test_nb(code_source=f"code_{num}"), nbs_path / f"nb_{num}.ipynb"
+        )
+        for num in range(3)
+    ]
+    nb_names.append(write_nb(create_test_nb(), nbs_path / "étude.ipynb"))
+    (tmp_path / "other.ipynb").write_text("{}")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    git(tmp_path, "tag", "base")
+    assert not git_changed("base", nbs_path)
+
+    write_nb(create_test_nb(code_source="changed"), nb_names[1])
+    nb_names[2].unlink()
+    git(tmp_path, "commit", "-q", "-am", "change")
+    write_nb(create_test_nb(code_source="changed"), nb_names[0])  # not committed
+    write_nb(create_test_nb(code_source="changed"), nb_names[3])  # non-ascii name
+    new_nb = write_nb(create_test_nb(), nbs_path / "sub" / "new.ipynb")  # untracked
+    (tmp_path / "other.ipynb").write_text("{ }")  # out of nbs path
+    assert git_changed("base", nbs_path) == sorted(
+        [nb_names[0], nb_names[1], nb_names[3], new_nb]
+    )
+    assert git_changed("HEAD", nbs_path) == sorted([nb_names[0], nb_names[3], new_nb])
+
+    with pytest.raises(GitError):
+        git_changed("not_a_ref", nbs_path)
+
+
+def test_read_files_list(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """filenames from file or stdin, comments and blank lines skipped"""
+    files_list = tmp_path / "files.txt"
+    files_list.write_text("# changed\nnbs/nb_1.ipynb\n\n  nbs/nb_2.ipynb \n")
+    monkeypatch.chdir(tmp_path)
+    expected = [tmp_path / "nbs/nb_1.ipynb", tmp_path / "nbs/nb_2.ipynb"]
+    assert read_files_list(str(files_list)) == expected
+    monkeypatch.setattr("sys.stdin", io.StringIO(files_list.read_text()))
+    assert read_files_list("-") == expected
+
+
+def test_select_changed(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """only listed notebooks from found ones, order kept"""
+    nb_names = [Path(f"nbs/nb_{num}.ipynb") for num in range(3)]
+    monkeypatch.chdir(tmp_path)
+    files_list = tmp_path / "files.txt"
+    files_list.write_text(
+        "nbs/nb_2.ipynb\nnbs/nb_0.ipynb\nnbs/removed.ipynb\nREADME.md\n"
+    )
+    selected = select_changed(nb_names, "nbs", files_from=str(files_list))
+    assert selected == [nb_names[0], nb_names[2]]
+    assert not select_changed(nb_names, "nbs")
@@ -1,9 +1,21 @@
 from pathlib import Path
 
+from nbformat.v4 import new_output
+
+from nbconvert.exporters.exporter import ResourcesDict
+import pytest
 from pytest import CaptureFixture
 from nbdocs.core import get_nb_names, read_nb, write_nb
-from nbdocs.convert import MdConverter, convert2md, filter_changed
+from nbdocs.convert import (
+    MdConverter,
+    convert2md,
+    convert_iter,
+    filter_changed,
+    get_jobs_number,
+    nb2md_memory,
+)
 from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.process import OutputFilesWriter
 
 from nbdocs.tests.base import create_nb, create_test_nb, create_tmp_image_file
 
@@ -66,6 +78,92 @@ def test_convert2md(tmp_path: Path, capsys: CaptureFixture[str]):
     assert "wrong_name.png" in captured.out
 
 
+def test_convert2md_recursive(tmp_path: Path):
+    """test convert2md - nested notebooks, same names, mirrored docs tree"""
+    nbs_path = tmp_path / "nbs"
+    cfg = NbDocsCfg(notebooks_path=str(nbs_path), docs_path=str(tmp_path / "docs"))
+    for sub in ("", "a", "a/b"):
+        (nbs_path / sub).mkdir(parents=True, exist_ok=True)
+        write_nb(create_test_nb(code_source=f"code_{sub}"), nbs_path / sub / "nb.ipynb")
+    nb_names = get_nb_names(nbs_path, recursive=True)
+    assert len(nb_names) == 3
+    convert2md(nb_names, cfg)
+    docs_path = Path(cfg.docs_path)
+    for sub in ("", "a", "a/b"):
+        md = (docs_path / sub / "nb.md").read_text(encoding="utf-8")
+        assert f"code_{sub}" in md
+        assert "![png](images/nb_files/output_0_2.png)" in md
+        assert (docs_path / sub / "images/nb_files/output_0_2.png").exists()
+    assert not filter_changed(nb_names, cfg)
+
+
+def test_convert2md_unchanged(tmp_path: Path, capsys: CaptureFixture[str]):
+    """test convert2md - same artifacts not rewritten"""
+    cfg = NbDocsCfg(docs_path=str(tmp_path / "docs"))
+    image_name = "t_1.png"
+    create_tmp_image_file(tmp_path / image_name)
+    nb_fn = tmp_path / "nb.ipynb"
+    write_nb(create_test_nb(code_source="code", md_source=f"![]({image_name})"), nb_fn)
+    convert2md(nb_fn, cfg)
+    assert "Artifacts written: 3, unchanged: 0." in capsys.readouterr().out
+    docs_path = Path(cfg.docs_path)
+    artifacts = [
+        docs_path / "nb.md",
+        docs_path / "images/nb_files/output_0_2.png",
+        docs_path / "images" / image_name,
+    ]
+    mtimes = [fn.stat().st_mtime_ns for fn in artifacts]
+    convert2md(nb_fn, cfg)
+    captured = capsys.readouterr().out
+    assert "Artifacts written: 0, unchanged: 3." in captured
+    assert "Images copy avoided: 4 bytes (1 same, 0 linked)." in captured
+    assert [fn.stat().st_mtime_ns for fn in artifacts] == mtimes
+    write_nb(
+        create_test_nb(code_source="new code", md_source=f"![]({image_name})"), nb_fn
+    )
+    convert2md(nb_fn, cfg)
+    assert "Artifacts written: 1, unchanged: 2." in capsys.readouterr().out
+
+
+def test_convert2md_image_store(tmp_path: Path, capsys: CaptureFixture[str]):
+    """test convert2md - images at content addressed store, unused removed"""
+    nbs_path = tmp_path / "nbs"
+    cfg = NbDocsCfg(
+        notebooks_path=str(nbs_path),
+        docs_path=str(tmp_path / "docs"),
+        image_store="hash",
+    )
+    store_path = Path(cfg.docs_path) / "images" / "store"
+    (nbs_path / "sub").mkdir(parents=True)
+    create_tmp_image_file(nbs_path / "logo.png")
+    create_tmp_image_file(nbs_path / "sub" / "logo.png")
+    nb_1, nb_2 = nbs_path / "nb_1.ipynb", nbs_path / "sub" / "nb_2.ipynb"
+    for nb_fn in (nb_1, nb_2):
+        write_nb(
+            create_test_nb(code_source="code", md_source="![logo](logo.png)"), nb_fn
+        )
+    nb_names = get_nb_names(nbs_path, recursive=True)
+    convert2md(nb_names, cfg)
+    blobs = sorted(store_path.iterdir())
+    assert len(blobs) == 2  # same output and logo at both notebooks
+    md = (Path(cfg.docs_path) / "nb_1.md").read_text(encoding="utf-8")
+    for blob in blobs:
+        assert f"(images/store/{blob.name})" in md
+    md = (Path(cfg.docs_path) / "sub" / "nb_2.md").read_text(encoding="utf-8")
+    for blob in blobs:
+        assert f"(../images/store/{blob.name})" in md
+    # changed output at one nb - old blob still used by other
+    outputs = [new_output("display_data", data={"image/png": "Zg=="})]
+    write_nb(create_nb(code_source="code", code_outputs=outputs), nb_1)
+    convert2md(nb_1, cfg)
+    assert len(list(store_path.iterdir())) == 3
+    assert "Removed" not in capsys.readouterr().out
+    write_nb(create_nb(code_source="code", code_outputs=outputs), nb_2)
+    convert2md(nb_2, cfg)
+    assert "Removed 2 unused images from store." in capsys.readouterr().out
+    assert len(list(store_path.iterdir())) == 1
+
+
 def test_filter_not_changed(tmp_path: Path):
     """test filter_not_changed"""
     cfg = NbDocsCfg()
@@ -107,3 +205,122 @@ def test_filter_not_changed(tmp_path: Path):
     changed_nbs = filter_changed(nb_names, cfg)
     assert len(changed_nbs) == 2  # changed + new
     assert new_nb_name in [nb.name for nb in changed_nbs]
+
+
+def test_convert2md_jobs(tmp_path: Path):
+    """test convert2md with process pool - same result as serial"""
+    nb_names = []
+    for num in range(3):
+        nb = create_test_nb(code_source=f"test_code_{num}", md_source=f"md_{num}")
+        nb_names.append(write_nb(nb, tmp_path / f"nb_{num}.ipynb"))
+    cfg_serial = NbDocsCfg(docs_path=str(tmp_path / "serial"))
+    convert2md(nb_names, cfg_serial)
+    cfg_parallel = NbDocsCfg(docs_path=str(tmp_path / "parallel"))
+    convert2md(nb_names, cfg_parallel, jobs=2)
+    for nb_name in nb_names:
+        md_name = nb_name.with_suffix(".md").name
+        md_serial = (tmp_path / "serial" / md_name).read_text(encoding="utf-8")
+        md_parallel = (tmp_path / "parallel" / md_name).read_text(encoding="utf-8")
+        assert md_serial == md_parallel
+        image_name = Path("images") / f"{nb_name.stem}_files" / "output_0_2.png"
+        assert (tmp_path / "parallel" / image_name).exists()
+
+
+def test_convert2md_jobs_shared_image(tmp_path: Path):
+    """parallel notebooks copy same image to hash store - no errors"""
+    (tmp_path / "dog.png").write_bytes(b"dog" * 1_000_000)
+    nb_names = [
+        write_nb(create_nb(md_source="![dog](dog.png)"), tmp_path / f"nb_{num}.ipynb")
+        for num in range(8)
+    ]
+    cfg = NbDocsCfg(docs_path=str(tmp_path / "docs"), image_store="hash")
+    results = convert2md(nb_names, cfg, jobs=4)
+    assert len(results) == 8
+    stored = list((tmp_path / "docs" / "images" / "store").iterdir())
+    assert len(stored) == 1
+    assert stored[0].read_bytes() == b"dog" * 1_000_000
+
+
+def test_convert_iter(tmp_path: Path, capsys: CaptureFixture[str]):
+    """test convert_iter - result per notebook, skipped, errors"""
+    nbs_path = tmp_path / "nbs"
+    nbs_path.mkdir()
+    nb_names = [
+        write_nb(
+            create_test_nb(code_source=f"test_code_{num}"), nbs_path / f"nb_{num}.ipynb"
+        )
+        for num in range(2)
+    ]
+    cfg = NbDocsCfg(notebooks_path=str(nbs_path), docs_path=str(tmp_path / "docs"))
+    results = convert_iter(nb_names, cfg)
+    result = next(results)  # first result before second notebook converted
+    assert result.nb_fn == nb_names[0]
+    assert result.md_fn.exists()  # type: ignore
+    assert result.images[0].exists()
+    assert not (tmp_path / "docs" / "nb_1.md").exists()
+    assert [result.nb_fn for result in results] == [nb_names[1]]
+    assert capsys.readouterr().out == ""
+    # not changed - skipped, broken notebook - error
+    (nbs_path / "nb_2.ipynb").write_text("not a notebook", encoding="utf-8")
+    nb_names.append(nbs_path / "nb_2.ipynb")
+    for jobs in (1, 2):
+        results = list(convert_iter(nb_names, cfg, jobs=jobs, force=False))
+        assert [result.skipped for result in results] == [True, True, False]
+        assert results[2].error is not None
+    with pytest.raises(Exception):
+        convert2md(nb_names, cfg)
+
+
+def test_nb2md_memory(tmp_path: Path):
+    """test nb2md_memory - same markdown and images as nb2md_file, no writes"""
+    nbs_path = tmp_path / "nbs"
+    (nbs_path / "img").mkdir(parents=True)
+    (nbs_path / "img" / "dog.png").write_bytes(b"dog")
+    nb = create_test_nb(code_source="test_code", md_source="![dog](img/dog.png)")
+    nb_fn = write_nb(nb, nbs_path / "nb_1.ipynb")
+    files = sorted(tmp_path.rglob("*"))
+    for image_store in ("notebook", "hash"):
+        cfg = NbDocsCfg(
+            notebooks_path=str(nbs_path),
+            docs_path=str(tmp_path / image_store),
+            image_store=image_store,
+        )
+        result = nb2md_memory(nb_fn.read_bytes(), cfg, "nb_1", source_path=nbs_path)
+        assert sorted(tmp_path.rglob("*")) == files
+        assert not result.warnings
+        convert2md(nb_fn, cfg)
+        docs_path = tmp_path / image_store
+        assert result.md == (docs_path / "nb_1.md").read_text(encoding="utf-8")
+        assert len(result.images) == 2
+        for image_path, data in result.images.items():
+            assert (docs_path / image_path).read_bytes() == data
+        files = sorted(tmp_path.rglob("*"))
+    # Nb, no source path - image not found
+    result = nb2md_memory(nb)
+    assert result.images == {"images/notebook_files/output_0_2.png": b"g"}
+    assert "![png](images/notebook_files/output_0_2.png)" in result.md
+    assert result.warnings == [
+        "Not fixed image names in nb: notebook:",
+        "   img/dog.png",
+    ]
+
+
+def test_get_jobs_number():
+    """test get_jobs_number"""
+    assert get_jobs_number(1, 10) == 1
+    assert get_jobs_number(4, 2) == 2
+    assert get_jobs_number(None, 1) == 1
+    assert get_jobs_number(0, 1000) >= 1
+
+
+def test_MdConverter_outputs_writer(tmp_path: Path):
+    """output images written to file as extracted, only filenames at resources"""
+    md_converter = MdConverter()
+    nb = create_test_nb(code_source="test_code")
+    dest = tmp_path / "images"
+    resources = ResourcesDict(outputs=OutputFilesWriter(dest))
+    md, resources = md_converter.nb2md(nb, resources)
+    assert "![png](output_0_2.png)" in md
+    assert resources["outputs"] == {"output_0_2.png": dest / "output_0_2.png"}
+    with open(dest / "output_0_2.png", "rb") as fh:
+        assert fh.read() == b"g"
@@ -1,8 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from nbdocs.core import get_nb_names, read_nb, write_nb
+from nbdocs.core import (
+    CopyStats,
+    copy_file,
+    copy_if_changed,
+    get_md_name,
+    get_nb_names,
+    read_nb,
+    write_if_changed,
+    write_nb,
+)
 from nbdocs.cfg_tools import get_config
 from nbdocs.typing import Nb
 
@@ -74,3 +84,110 @@ def test_get_nb_names():
     # file not nb
     with pytest.raises(SystemExit):
         nb_names = get_nb_names(nb_path / "images/cat.jpg")
+
+
+def test_get_nb_names_recursive(tmp_path: Path):
+    """get_nb_names recursive, skip checkpoints and ignored"""
+    nb = read_nb(nb_filename)
+    for name in (
+        "nb.ipynb",
+        "sub/nb.ipynb",
+        "sub/deep/nb.ipynb",
+        "sub/.ipynb_checkpoints/nb-checkpoint.ipynb",
+        "drafts/nb.ipynb",
+        "sub/nb_tmp.ipynb",
+    ):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        write_nb(nb, tmp_path / name)
+    nb_names = get_nb_names(tmp_path)
+    assert nb_names == [tmp_path / "nb.ipynb"]
+    nb_names = get_nb_names(tmp_path, recursive=True)
+    assert len(nb_names) == 5
+    nb_names = get_nb_names(tmp_path, recursive=True, ignore=["drafts", "*_tmp.ipynb"])
+    assert nb_names == [
+        tmp_path / "nb.ipynb",
+        tmp_path / "sub/deep/nb.ipynb",
+        tmp_path / "sub/nb.ipynb",
+    ]
+    nb_names = get_nb_names(tmp_path, recursive=True, ignore=["sub/deep"])
+    assert tmp_path / "sub/deep/nb.ipynb" not in nb_names
+    assert tmp_path / "sub/nb.ipynb" in nb_names
+
+
+def test_get_md_name():
+    """get_md_name, mirror notebooks tree"""
+    assert get_md_name(nb_filename) == Path("nb_1.md")
+    assert get_md_name(nb_filename, "tests") == Path("test_nbs/nb_1.md")
+    assert get_md_name(nb_filename, nb_path) == Path("nb_1.md")
+    # not at nbs tree or nbs_path is file
+    assert get_md_name(nb_filename, "nbs") == Path("nb_1.md")
+    assert get_md_name(nb_filename, nb_filename) == Path("nb_1.md")
+
+
+def test_write_if_changed(tmp_path: Path):
+    """write_if_changed, copy_if_changed"""
+    fn = tmp_path / "file.txt"
+    assert write_if_changed(fn, b"data")
+    assert not write_if_changed(fn, b"data")
+    assert write_if_changed(fn, b"date")  # same size
+    assert fn.read_bytes() == b"date"
+    assert write_if_changed(fn, b"new data")
+    dest = tmp_path / "copy.txt"
+    assert copy_if_changed(fn, dest)
+    assert not copy_if_changed(fn, dest)
+    write_if_changed(fn, b"new date")
+    assert copy_if_changed(fn, dest)
+    assert dest.read_bytes() == b"new date"
+
+
+def test_copy_file(tmp_path: Path):
+    """copy_file with strategies"""
+    source = tmp_path / "source.png"
+    source.write_bytes(b"image")
+    dest = tmp_path / "dest.png"
+    assert copy_file(source, dest) == "copy"
+    assert dest.read_bytes() == b"image"
+    assert dest.stat().st_mtime_ns == source.stat().st_mtime_ns
+    assert copy_file(source, dest, "hardlink") == "hardlink"
+    assert dest.samefile(source)
+    dest.unlink()
+    assert copy_file(source, dest, "auto") in ("reflink", "hardlink")
+    assert dest.read_bytes() == b"image"
+    dest.unlink()
+    dest.write_bytes(b"old")
+    try:
+        assert copy_file(source, dest, "reflink") == "reflink"
+        assert dest.read_bytes() == b"image"
+    except OSError:  # not supported by filesystem, dest not changed
+        assert dest.read_bytes() == b"old"
+    assert sorted(fn.name for fn in tmp_path.iterdir()) == ["dest.png", "source.png"]
+    with pytest.raises(ValueError):
+        copy_file(source, dest, "symlink")
+
+
+def test_copy_if_changed_parallel(tmp_path: Path):
+    """parallel copy to same dest - each writer own temporary file"""
+    source = tmp_path / "source.png"
+    source.write_bytes(b"image" * 1_000_000)
+    dest = tmp_path / "dest.png"
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: copy_if_changed(source, dest), range(16)))
+    assert dest.read_bytes() == source.read_bytes()
+    assert sorted(fn.name for fn in tmp_path.iterdir()) == ["dest.png", "source.png"]
+
+
+def test_copy_if_changed_stats(tmp_path: Path):
+    """copy_if_changed, skip same files"""
+    source = tmp_path / "source.png"
+    source.write_bytes(b"image")
+    dest = tmp_path / "dest.png"
+    stats = CopyStats()
+    assert copy_if_changed(source, dest, stats=stats)
+    assert not copy_if_changed(source, dest, stats=stats)  # same size and mtime
+    assert stats == CopyStats(copied=1, skipped=1, bytes_avoided=5)
+    dest.write_bytes(b"image")  # same content, other mtime
+    assert not copy_if_changed(source, dest, stats=stats)
+    dest.write_bytes(b"imagf")  # same size, other content
+    assert copy_if_changed(source, dest, "hardlink", stats)
+    assert not copy_if_changed(source, dest, stats=stats)  # same file
+    assert stats == CopyStats(copied=1, linked=1, skipped=3, bytes_avoided=20)
@@ -0,0 +1,91 @@
+from nbdocs.flags import FlagContext, FlagRegistry, flag_registry, register_flag
+from nbdocs.process import (
+    OUTPUT_FLAG_COLLAPSE,
+    cell_process_flags,
+    cell_process_hide_flags,
+    process_cell_collapse_output,
+)
+from nbdocs.tests.base import create_test_nb
+from nbdocs.typing import CodeCell
+
+
+def test_flag_registry():
+    """register flags, find in one pass"""
+    registry = FlagRegistry()
+    assert registry.find("# hide") == set()
+    registry.register("tab_group")
+    registry.register("pin")
+    assert "pin" in registry
+    assert registry.find("# pin\n  # tab-group \nx = 1  # pin") == {"pin", "tab_group"}
+    assert registry.find("# pinned") == set()
+    assert registry.find("pin") == set()
+    registry.unregister("pin")
+    assert registry.find("# pin\n# tab_group") == {"tab_group"}
+
+
+def test_flag_hyphen_name():
+    """flag registered with '-' stored with '_', matched both ways"""
+    calls = []
+    registry = FlagRegistry()
+    registry.register("tab-group", lambda cell, context: calls.append(context.flags))
+    assert "tab_group" in registry
+    assert "tab-group" in registry
+    cell = create_test_nb("# tab-group\ncode").cells[0]
+    context = registry.process(cell)  # type: ignore
+    assert context.flags == {"tab_group"}
+    assert calls == [{"tab_group"}]
+    assert cell.source == "\ncode"
+    cell = create_test_nb("# tab_group\ncode").cells[0]
+    registry.process(cell)  # type: ignore
+    assert cell.source == "\ncode"
+    registry.unregister("tab-group")
+    assert "tab_group" not in registry
+
+
+def test_flag_handlers():
+    """handlers called by priority, flag lines removed"""
+    calls = []
+
+    def first(cell: CodeCell, context: FlagContext) -> None:
+        calls.append("first")
+
+    def second(cell: CodeCell, context: FlagContext) -> None:
+        calls.append("second")
+        context.stop = True
+
+    registry = FlagRegistry()
+    registry.register("second", second, priority=2)
+    registry.register("first", first, priority=1)
+    registry.register("third", lambda cell, context: calls.append("third"), 3)
+    registry.register("keep", remove_line=False)
+    cell = create_test_nb("# third\n# second\n# first\n# keep\ncode").cells[0]
+    context = registry.process(cell)  # type: ignore
+    assert context.flags == {"first", "second", "third", "keep"}
+    assert calls == ["first", "second"]
+    assert cell.source == "\n# keep\ncode"
+
+
+def test_register_flag():
+    """custom flag at default registry used at cell processing"""
+
+    def skip_in_docs(cell: CodeCell, context: FlagContext) -> None:
+        cell.metadata["transient"] = {"remove_source": True}
+        cell.outputs = []
+
+    register_flag("skip_in_docs", skip_in_docs)
+    try:
+        cell = create_test_nb("# skip-in-docs\ncode").cells[0]
+        cell_process_flags(cell)  # type: ignore
+        assert cell.outputs == []
+        assert cell.metadata["transient"] == {"remove_source": True}
+        assert cell.source == "\ncode"
+        # legacy step by step processing use registry too
+        cell = create_test_nb("# skip-in-docs\n# collapse_output\ncode").cells[0]
+        cell_process_hide_flags(cell)  # type: ignore
+        assert cell.outputs == []
+        assert cell.source == "\n# collapse_output\ncode"
+        assert process_cell_collapse_output(cell) == OUTPUT_FLAG_COLLAPSE  # type: ignore
+        assert cell.source == "\ncode"
+    finally:
+        flag_registry.unregister("skip_in_docs")
+    assert "skip_in_docs" not in flag_registry
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ("nbconvert", "jinja2", "traitlets", "nbformat")
+
+
+def test_cli_imports_light():
+    """CLI apps and convert module import without nbconvert and nbformat.
+    Import time compared with imports of CLI dependencies at same process."""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import rich, argparsecfg\n"
+        "print(time.perf_counter() - start)\n"
+        "start = time.perf_counter()\n"
+        "import nbdocs.apps.app_nbdocs, nbdocs.apps.app_nb2md, nbdocs.apps.app_nbclean\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(*sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    base_time, import_time, loaded = result.stdout.splitlines()
+    assert loaded == ""
+    # nbdocs modules ~1.5 of base, nbconvert alone ~5 of base
+    assert float(import_time) < 3 * float(base_time)
+
+
+def test_lazy_names():
+    """Moved classes still available at old places."""
+    from nbdocs import convert, exporter, preprocessors, process
+
+    assert convert.MdConverter is exporter.MdConverter
+    assert process.HideFlagsPreprocessor is preprocessors.HideFlagsPreprocessor
@@ -0,0 +1,124 @@
+import os
+from pathlib import Path
+
+from pytest import CaptureFixture, MonkeyPatch
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.convert import convert2md, filter_changed, remove_stale
+from nbdocs.core import file_hash, write_nb
+from nbdocs.manifest import Manifest, get_cfg_hash
+
+from nbdocs.tests.base import create_nb, create_test_nb
+
+
+def test_manifest_filter_changed(tmp_path: Path):
+    """filter_changed use content hash from manifest, not mtime"""
+    cfg = NbDocsCfg(docs_path=str(tmp_path / "docs"))
+    nb_names = [
+        write_nb(create_test_nb(code_source=f"code_{num}"), tmp_path / f"nb_{num}")
+        for num in range(2)
+    ]
+    assert filter_changed(nb_names, cfg) == nb_names  # no manifest
+    convert2md(nb_names, cfg)
+    manifest = Manifest.load(cfg)
+    assert set(manifest.entries) == {"nb_0.md", "nb_1.md"}
+    entry = manifest.entries["nb_0.md"]
+    assert entry.hash == file_hash(nb_names[0])
+    assert "images/nb_0_files/output_0_2.png" in entry.artifacts
+    assert filter_changed(nb_names, cfg) == []
+
+    # touch - new mtime, same content
+    stat = nb_names[0].stat()
+    os.utime(nb_names[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert filter_changed(nb_names, cfg) == []
+    # stat updated at manifest
+    entry = Manifest.load(cfg).entries["nb_0.md"]
+    assert entry.mtime_ns == stat.st_mtime_ns + 10**9
+
+    # content changed
+    write_nb(create_nb(md_source="changed"), nb_names[1])
+    assert filter_changed(nb_names, cfg) == [nb_names[1]]
+
+    # artifact removed
+    (tmp_path / "docs" / "images" / "nb_0_files" / "output_0_2.png").unlink()
+    assert nb_names[0] in filter_changed(nb_names, cfg)
+
+    # config changed
+    cfg.images_path = "img"
+    assert filter_changed(nb_names, cfg) == nb_names
+
+
+def test_manifest_load_broken(tmp_path: Path):
+    """broken manifest - empty entries"""
+    cfg = NbDocsCfg(docs_path=str(tmp_path))
+    manifest = Manifest(cfg)
+    manifest.filename.parent.mkdir(parents=True)
+    manifest.filename.write_text("not json", encoding="utf-8")
+    manifest = Manifest.load(cfg)
+    assert manifest.entries == {}
+    assert manifest.cfg_hash == get_cfg_hash(cfg)
+    # old format, notebook path relative to current dir - entries dropped, rebuild
+    manifest.filename.write_text(
+        '{"notebooks": {"nb.md": {"nb": "nb.ipynb"}}}', encoding="utf-8"
+    )
+    assert Manifest.load(cfg).entries == {}
+
+
+def test_remove_stale_other_cwd(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """gc from other current dir, relative or absolute paths - live notebooks kept"""
+    monkeypatch.chdir(tmp_path)
+    Path("nbs").mkdir()
+    nb_name = write_nb(create_test_nb(code_source="code"), Path("nbs/nb.ipynb"))
+    convert2md(nb_name, NbDocsCfg(notebooks_path="nbs", docs_path="docs"))
+    assert Manifest.load(NbDocsCfg()).entries["nb.md"].nb == "../nbs/nb.ipynb"
+    cfg = NbDocsCfg(
+        notebooks_path=str(tmp_path / "nbs"), docs_path=str(tmp_path / "docs")
+    )
+    (tmp_path / "other").mkdir()
+    monkeypatch.chdir(tmp_path / "other")
+    assert remove_stale(Manifest.load(cfg)) == []
+    assert (tmp_path / "docs" / "nb.md").exists()
+    (tmp_path / "nbs" / "nb.ipynb").unlink()
+    assert remove_stale(Manifest.load(cfg), dry_run=True) == [
+        tmp_path / "docs" / "images" / "nb_files" / "output_0_2.png",
+        tmp_path / "docs" / "nb.md",
+    ]
+
+
+def test_remove_stale(tmp_path: Path, capsys: CaptureFixture[str]):
+    """remove_stale - artifacts of deleted and renamed notebooks"""
+    nbs_path = tmp_path / "nbs"
+    cfg = NbDocsCfg(
+        notebooks_path=str(nbs_path),
+        docs_path=str(tmp_path / "docs"),
+        cell_cache=True,
+    )
+    docs_path = Path(cfg.docs_path)
+    (nbs_path / "sub").mkdir(parents=True)
+    nb_names = [
+        write_nb(create_test_nb(code_source=f"code_{num}"), nbs_path / name)
+        for num, name in enumerate(("nb_0", "nb_1", "sub/nb_2"))
+    ]
+    convert2md(nb_names, cfg)
+    nb_names[0].unlink()
+    nb_names[2].rename(nbs_path / "sub" / "nb_3.ipynb")
+    manifest = Manifest.load(cfg)
+    to_remove = remove_stale(manifest, dry_run=True)
+    assert docs_path / "nb_0.md" in to_remove
+    assert docs_path / "sub/images/nb_2_files/output_0_2.png" in to_remove
+    assert docs_path / ".nbdocs/cells/sub/nb_2.json" in to_remove
+    assert all(filename.exists() for filename in to_remove)
+    assert remove_stale(manifest) == to_remove
+    assert not any(filename.exists() for filename in to_remove)
+    assert not (docs_path / "sub").exists()  # empty dirs removed
+    assert (docs_path / "nb_1.md").exists()
+    assert set(Manifest.load(cfg).entries) == {"nb_1.md"}
+    assert remove_stale(Manifest.load(cfg)) == []
+
+    # auto_gc after build
+    cfg.auto_gc = True
+    nb_names[1].unlink()
+    convert2md(nbs_path / "sub" / "nb_3.ipynb", cfg)
+    assert "Removed 3 files of deleted notebooks." in capsys.readouterr().out
+    assert not (docs_path / "nb_1.md").exists()
+    assert (docs_path / "sub" / "nb_3.md").exists()
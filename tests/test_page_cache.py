@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.convert import nb2md_memory
+from nbdocs.core import write_nb
+from nbdocs.page_cache import PageCache
+from nbdocs.tests.base import create_nbs, create_test_nb
+
+
+def test_page_cache(tmp_path: Path):
+    """notebook rendered once, entry kept between runs, rendered again on change"""
+    nbs_path = tmp_path / "nbs"
+    nb_names = create_nbs(nbs_path, 2)
+    cfg = NbDocsCfg(notebooks_path=str(nbs_path), recursive=True)
+    cache_dir = tmp_path / "cache"
+    page_cache = PageCache(cfg, cache_dir)
+    entry_dir, filenames = page_cache.get(nb_names[0])
+    assert filenames[0] == "sub/nb_0.md"
+    assert page_cache.renders == 1
+    # same layout as in memory conversion
+    result = nb2md_memory(nb_names[0].read_bytes(), cfg, "nb_0")
+    assert (entry_dir / filenames[0]).read_text(encoding="utf-8") == result.md
+    assert filenames[1:] == [f"sub/{image}" for image in sorted(result.images)]
+    for image, data in result.images.items():
+        assert (entry_dir / "sub" / image).read_bytes() == data
+    assert page_cache.get(nb_names[0]) == (entry_dir, filenames)
+    assert page_cache.renders == 1
+
+    # new cache instance - entry from disk
+    page_cache = PageCache(cfg, cache_dir)
+    assert page_cache.get(nb_names[0])[0] == entry_dir
+    assert page_cache.renders == 0
+
+    # changed notebook - new entry
+    write_nb(create_test_nb(code_source="new_code"), nb_names[0])
+    new_entry_dir, filenames = page_cache.get(nb_names[0])
+    assert new_entry_dir != entry_dir
+    assert page_cache.renders == 1
+    assert "new_code" in (new_entry_dir / filenames[0]).read_text(encoding="utf-8")
+
+    # changed config - new entry
+    cfg_cache = PageCache(
+        NbDocsCfg(notebooks_path=str(nbs_path), images_path="img"), cache_dir
+    )
+    assert cfg_cache.entry_name(nb_names[0]) != new_entry_dir.name
+
+    assert page_cache.prune({new_entry_dir}) == [entry_dir]
+    assert not entry_dir.exists()
+    assert new_entry_dir.exists()
+
+
+def test_mkdocs_plugin(tmp_path: Path):
+    """plugin adds converted notebooks to mkdocs files"""
+    pytest.importorskip("mkdocs")
+    # pylint: disable=import-outside-toplevel
+    from mkdocs.structure.files import Files
+
+    from nbdocs.mkdocs_plugin import NbDocsPlugin
+
+    create_nbs(tmp_path / "nbs", 2)
+    plugin = NbDocsPlugin()
+    plugin.load_config({"notebooks_path": "nbs", "recursive": True})
+    config = {
+        "config_file_path": str(tmp_path / "mkdocs.yml"),
+        "site_dir": str(tmp_path / "site"),
+        "use_directory_urls": True,
+    }
+    plugin.on_config(config)
+    files = plugin.on_files(Files([]), config)
+    assert {"sub/nb_0.md", "sub/nb_1.md"} <= {file.src_uri for file in files}
+    assert plugin.page_cache is not None
+    assert plugin.page_cache.renders == 2
+    # rebuild - from cache
+    plugin.on_config(config)
+    plugin.on_files(Files([]), config)
+    assert plugin.page_cache.renders == 2
+
+
+def test_mkdocs_plugin_no_notebooks(tmp_path: Path):
+    """missing notebooks path - PluginError, not exit"""
+    pytest.importorskip("mkdocs")
+    # pylint: disable=import-outside-toplevel
+    from mkdocs.exceptions import PluginError
+    from mkdocs.structure.files import Files
+
+    from nbdocs.mkdocs_plugin import NbDocsPlugin
+
+    plugin = NbDocsPlugin()
+    plugin.load_config({"notebooks_path": "nbs"})
+    config = {
+        "config_file_path": str(tmp_path / "mkdocs.yml"),
+        "site_dir": str(tmp_path / "site"),
+        "use_directory_urls": True,
+    }
+    plugin.on_config(config)
+    with pytest.raises(PluginError, match="not exists"):
+        plugin.on_files(Files([]), config)
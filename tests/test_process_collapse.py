@@ -1,10 +1,15 @@
+import re
+
+from nbdocs.convert import MdConverter
 from nbdocs.process import (
     MarkOutputPreprocessor,
     format_output,
+    format_output_close,
     format_output_collapsed,
     md_process_output_flag,
     nb_mark_output,
     OUTPUT_FLAG,
+    OUTPUT_FLAG_CLOSE,
     OUTPUT_FLAG_COLLAPSE,
 )
 
@@ -52,3 +57,37 @@ def test_md_process_output_flag():
     result_md = md_process_output_flag(test_md)
     assert OUTPUT_FLAG_COLLAPSE not in result_md
     assert format_output_collapsed in result_md
+
+
+def md_process_output_flag_regex(md: str) -> str:
+    """Reference implementation - sequential regex substitutions."""
+    result = re.sub(r"\s*\#*output_flag_collapse\#*", format_output_collapsed, md)
+    result = re.sub(r"\s*\#*output_flag\#*", format_output, result)
+    return re.sub(rf"\#*{OUTPUT_FLAG_CLOSE}\#*", format_output_close, result)
+
+
+def test_md_process_output_flag_same_as_regex():
+    """single pass result same as sequential regex substitutions"""
+    samples = [
+        "",
+        "no flags",
+        f"text  \n  {OUTPUT_FLAG}out{OUTPUT_FLAG_CLOSE}\nnext",
+        f"text\n\n{OUTPUT_FLAG_COLLAPSE}out\n{OUTPUT_FLAG_CLOSE}  \n",
+        f"##{OUTPUT_FLAG}#a#{OUTPUT_FLAG_CLOSE}##b {OUTPUT_FLAG_COLLAPSE}##",
+        "output_flag output_close #output_close# ###output_close##",
+        f"{OUTPUT_FLAG}{OUTPUT_FLAG}{OUTPUT_FLAG_CLOSE}{OUTPUT_FLAG_CLOSE}",
+        f"    \t\n{OUTPUT_FLAG_COLLAPSE}\n    " * 3,
+    ]
+    nb = create_test_nb(code_source="#collapse_output\nsome code")
+    nb.cells.append(create_test_nb(code_source="code").cells[0])
+    nb_mark_output(nb)
+    samples.append(MdConverter().md_exporter.from_notebook_node(nb)[0])
+    for md in samples:
+        assert md_process_output_flag(md) == md_process_output_flag_regex(md)
+
+
+def test_md_process_output_flag_whitespaces():
+    """long whitespace runs - linear time"""
+    md = " " * 200_000 + f"{OUTPUT_FLAG}text{OUTPUT_FLAG_CLOSE}" + "\n" * 200_000
+    result = md_process_output_flag(md)
+    assert result == format_output + "text" + format_output_close + "\n" * 200_000
@@ -1,5 +1,8 @@
 from nbconvert.exporters.exporter import ResourcesDict
 from nbdocs.process import (
+    OUTPUT_FLAG,
+    OUTPUT_FLAG_CLOSE,
+    OUTPUT_FLAG_COLLAPSE,
     HideFlagsPreprocessor,
     nb_process_hide_flags,
     RemoveEmptyCellPreprocessor,
@@ -75,3 +78,53 @@ def testRemoveEmptyCellPreprocessor() -> None:
     # assert len(nb.cells) == 0
     cell = nb.cells[0]
     assert cell.metadata["transient"] == {"remove_source": True}
+
+
+def test_CellFlagsPreprocessor_same_as_chain():
+    """fused preprocessor and RemoveEmpty, HideFlags, MarkOutput chain
+    give same result as regex based processing before flag registry"""
+    from nbdocs.preprocessors import CellFlagsPreprocessor, MarkOutputPreprocessor
+
+    chain = [
+        RemoveEmptyCellPreprocessor(enabled=True),
+        HideFlagsPreprocessor(enabled=True),
+        MarkOutputPreprocessor(enabled=True),
+    ]
+    fused = CellFlagsPreprocessor(enabled=True)
+    # source: result source, source removed, output flag, None - outputs removed
+    expected_results = {
+        "": ("", True, OUTPUT_FLAG),
+        "some code": ("some code", False, OUTPUT_FLAG),
+        "# hide": ("", True, None),
+        "# hide\n# collapse_output": ("", True, None),
+        "# hide_input\n some code": ("", True, OUTPUT_FLAG),
+        "# hide-input\n# collapse_output\n some code": ("", True, OUTPUT_FLAG),
+        "# hide_output\n some code": ("\n some code", False, None),
+        "# hide_output\n# collapse-output\n some code": ("\n some code", False, None),
+        "# collapse_output\n some code": ("\n some code", False, OUTPUT_FLAG_COLLAPSE),
+        "  #  hide \n some code": ("", True, None),
+        "# hide_inputs\n some code": ("# hide_inputs\n some code", False, OUTPUT_FLAG),
+        "x = 1  # hide": ("x = 1  # hide", False, OUTPUT_FLAG),
+    }
+    for source, (result_source, removed, flag) in expected_results.items():
+        for preprocessors in ([fused], chain):
+            nb = create_test_nb(source)
+            for preprocessor in preprocessors:
+                nb, _ = preprocessor(nb, ResourcesDict())
+            cell = nb.cells[0]
+            assert cell.source == result_source, source
+            assert ("transient" in cell.metadata) == removed, source
+            if removed:
+                assert cell.metadata.transient == {"remove_source": True}
+            if flag is None:
+                assert cell.outputs == [], source
+                continue
+            texts = [
+                output.get("text") or output.data["text/plain"]
+                for output in cell.outputs[:2]
+            ]
+            assert texts == [
+                f"{flag}- test/plain in output{OUTPUT_FLAG_CLOSE}",
+                f"{flag}- text in stdout (stream) output{OUTPUT_FLAG_CLOSE}",
+            ], source
+            assert "image/png" in cell.outputs[2].data
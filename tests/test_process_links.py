@@ -6,6 +6,7 @@ from nbdocs.process import (
     copy_images,
     correct_markdown_image_link,
     md_correct_image_link,
+    md_correct_image_links,
     get_image_link_re,
     md_find_image_names,
 )
@@ -52,7 +53,19 @@ def test_get_image_link_re():
 def test_md_find_image_names():
     """test md_find_image_names"""
     image_names = md_find_image_names(text)
-    assert len(image_names) == 5
+    assert image_names == {
+        "images/dog.jpg",
+        "images/cat.jpg",
+        "output.jpg",
+        "output2.jpg",
+    }
+    # names same as rewritten by md_correct_image_links
+    md = "![a](x.png) ![b](y.png) ![c](pic(1).png) ![d](my img.png) ![e](<e f.png>)"
+    image_names = md_find_image_names(md)
+    assert image_names == {"x.png", "y.png", "pic(1).png", "my img.png", "e f.png"}
+    assert md_correct_image_links(md, {name: f"i/{name}" for name in image_names}) == (
+        "![a](i/x.png) ![b](i/y.png) ![c](i/pic(1).png) ![d](i/my img.png) ![e](<i/e f.png>)"
+    )
 
 
 def test_copy_images(tmp_path: Path) -> None:
@@ -83,6 +96,40 @@ def test_md_correct_image_link():
         md=text_with_output_image_link, image_name="output2.jpg", image_path="images"
     )
     assert corrected_text == text_with_output_image_link
+    # name with regex symbols - dot is not any symbol
+    corrected_text = md_correct_image_link(
+        md="![jpg](outputXjpg)", image_name="output.jpg", image_path="images"
+    )
+    assert corrected_text == "![jpg](outputXjpg)"
+    # path with spaces, path at <>
+    assert md_correct_image_link("![a](my img.png)", "my img.png", "images") == (
+        "![a](images/my img.png)"
+    )
+    assert md_correct_image_link("![a]( <my img.png> )", "my img.png", "images") == (
+        "![a](<images/my img.png>)"
+    )
+
+
+def test_md_correct_image_links():
+    """test md_correct_image_links - all links in one pass"""
+    image_links = {
+        "images/dog.jpg": "dest/dog.jpg",
+        "output.jpg": "dest\\1/output.jpg",
+        "output2.jpg": "dest/output2.jpg",
+    }
+    corrected_text = md_correct_image_links(text, image_links)
+    assert "here - ![dog](dest/dog.jpg) ---" in corrected_text
+    assert "--- ![cat](images/cat.jpg) ---" in corrected_text
+    assert "output link ![jpg](dest\\1/output.jpg) dsf" in corrected_text
+    assert "second output ![jpg](dest/output2.jpg) dsf" in corrected_text
+    assert "whitespaces ![asdf](dest\\1/output.jpg) dsf" in corrected_text
+    assert "![mkd link] (https://images/some.jpg)" in corrected_text
+    # two links at line
+    md = "![a](a.png) and ![b](b.png)"
+    assert md_correct_image_links(md, {"a.png": "x/a.png", "b.png": "x/b.png"}) == (
+        "![a](x/a.png) and ![b](x/b.png)"
+    )
+    assert md_correct_image_links(md, {}) == md
 
 
 # def test_cell_md_correct_image_link():
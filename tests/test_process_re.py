@@ -1,6 +1,7 @@
 from nbformat import NotebookNode
 
-from nbdocs.process import cell_check_flags, generate_flags_string, re_flags
+from nbdocs.flags import flag_registry, register_flag
+from nbdocs.process import cell_check_flags, generate_flags_string
 
 
 def test_generate_flags_string():
@@ -16,8 +17,8 @@ def test_generate_flags_string():
 
 def test_re_flags():
     """test search"""
-    assert re_flags.search("hide") is None
-    assert re_flags.search("hide\n #hide") is not None
+    assert flag_registry.re_flags.search("hide") is None
+    assert flag_registry.re_flags.search("hide\n #hide") is not None
 
 
 def test_cell_check_flags():
@@ -35,5 +36,15 @@ def test_cell_check_flags():
     cell["source"] = "aaa # hide"
     assert not cell_check_flags(cell)
 
+    # output flag is not cell flag, registered flags are
+    cell["source"] = "# collapse_output"
+    assert not cell_check_flags(cell)
+    register_flag("pin")
+    try:
+        cell["source"] = "# pin"
+        assert cell_check_flags(cell)
+    finally:
+        flag_registry.unregister("pin")
+
     cell["cell_type"] = "markdown"
     assert not cell_check_flags(cell)
@@ -0,0 +1,46 @@
+import pstats
+from pathlib import Path
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.convert import convert2md
+from nbdocs.core import write_nb
+from nbdocs.profiling import get_profiler, named_frame, profile_build, profile_if
+from nbdocs.tests.base import create_test_nb
+
+
+def test_named_frame():
+    """func called at frame with given name"""
+    frame = named_frame("nb:test")
+    assert frame.__code__.co_name == "nb:test"
+    assert frame(sum, [1, 2]) == 3
+
+
+def test_profile_build(tmp_path: Path):
+    """stats file with notebook frames"""
+    nbs_path = tmp_path / "nbs"
+    nbs_path.mkdir()
+    nb_names = [
+        write_nb(create_test_nb(code_source="test_code"), nbs_path / f"nb_{num}.ipynb")
+        for num in range(2)
+    ]
+    cfg = NbDocsCfg(notebooks_path=str(nbs_path), docs_path=str(tmp_path / "docs"))
+    prof_fn = tmp_path / "build.prof"
+    with profile_build(prof_fn) as profiler:
+        assert get_profiler() is profiler
+        convert2md(nb_names, cfg, jobs=2)  # run at one process
+    assert get_profiler() is None
+    stats = pstats.Stats(str(prof_fn))
+    frames = sorted(func[2] for func in stats.stats if func[2].startswith("nb:"))  # type: ignore
+    assert frames == [f"nb:{nb_fn.as_posix()}" for nb_fn in nb_names]
+    assert any(func[2] == "convert2md" for func in stats.stats)  # type: ignore
+    # chosen notebook
+    with profile_if(prof_fn, "nb_1.ipynb"):
+        convert2md(nb_names, cfg)
+    stats = pstats.Stats(str(prof_fn))
+    frames = [func[2] for func in stats.stats if func[2].startswith("nb:")]  # type: ignore
+    assert frames == [f"nb:{nb_names[1].as_posix()}"]
+    assert not any(func[2] == "convert2md" for func in stats.stats)  # type: ignore
+    # no filename - no profile
+    with profile_if(None) as profiler:
+        assert profiler is None
+        assert get_profiler() is None
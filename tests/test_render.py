@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import pytest
+from nbformat import v4 as nbformat
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.convert import MdConverter, convert2md, create_md_converter
+from nbdocs.core import read_nb, write_nb
+from nbdocs.render import NativeMdConverter, indent, nb_supported
+from nbdocs.tests.base import (
+    create_code_cell,
+    create_markdown_cell,
+    create_test_nb,
+    create_test_outputs,
+)
+
+
+def create_nbs_native():
+    """Notebooks supported by native renderer."""
+    stream = nbformat.new_output("stream", name="stdout", text="a\nb\n")
+    stderr = nbformat.new_output("stream", name="stderr", text="a\nb")
+    execute_result = nbformat.new_output(
+        "execute_result", data={"text/plain": "a\nb"}, execution_count=1
+    )
+    images = nbformat.new_output(
+        "display_data",
+        data={"image/jpeg": "Zw==", "image/png": "Zw==", "text/plain": "<Fig>"},
+    )
+    jpeg_result = nbformat.new_output(
+        "execute_result", data={"image/jpeg": "Zw==", "text/plain": "<Fig>"}
+    )
+    cells_list = [
+        [create_markdown_cell("md"), create_code_cell("x=1"), create_markdown_cell("")],
+        [create_code_cell("x=1", [stream, stderr, execute_result])],
+        [create_code_cell("#collapse_output\nx=1", create_test_outputs())],
+        [create_code_cell("", create_test_outputs())],
+        [create_code_cell("#hide_input\nx", create_test_outputs())],
+        [
+            create_code_cell("#hide\nx", create_test_outputs()),
+            create_markdown_cell("md"),
+        ],
+        [create_code_cell("#hide_output\nx", create_test_outputs())],
+        [create_code_cell("x\n\n", [images, jpeg_result]), create_code_cell("  ")],
+    ]
+    nbs = [nbformat.new_notebook(cells=cells) for cells in cells_list]
+    for nb in nbs[::2]:
+        nb.metadata["language_info"] = {"name": "python"}
+    return nbs + [read_nb(fn) for fn in Path("tests/test_nbs").glob("*.ipynb")]
+
+
+def test_native_same_as_nbconvert():
+    """native renderer result same as nbconvert"""
+    md_converter = MdConverter()
+    native_converter = NativeMdConverter()
+    for nb in create_nbs_native():
+        assert nb_supported(nb)
+        md_expected, resources_expected = md_converter.nb2md(nb)
+        md, resources = native_converter(nb)
+        assert md == md_expected
+        assert resources["outputs"] == dict(resources_expected["outputs"])
+        assert resources.get("image_names") == resources_expected.get("image_names")
+    assert native_converter._fallback is None
+
+
+def test_native_fallback():
+    """not supported notebooks converted by nbconvert"""
+    html = nbformat.new_output(
+        "display_data", data={"text/html": "<b>", "text/plain": "b"}
+    )
+    error = nbformat.new_output("error", ename="E", evalue="e", traceback=["line"])
+    nbs = [
+        nbformat.new_notebook(cells=[create_code_cell("x", [html])]),
+        nbformat.new_notebook(cells=[create_code_cell("x", [error])]),
+        nbformat.new_notebook(cells=[nbformat.new_raw_cell("raw")]),
+        nbformat.new_notebook(cells=[create_code_cell("%%bash\nls")]),
+    ]
+    md_converter = MdConverter()
+    native_converter = NativeMdConverter()
+    for nb in nbs:
+        assert not nb_supported(nb)
+        assert native_converter.nb2md(nb)[0] == md_converter.nb2md(nb)[0]
+    assert isinstance(native_converter.fallback, MdConverter)
+
+
+def test_indent():
+    """indent same as nbconvert filter"""
+    assert indent("a\nb\n") == "    a\n    b\n"
+    assert indent("a\nb") == "    a\n    b"
+
+
+def test_create_md_converter(tmp_path: Path):
+    """engine from config"""
+    assert isinstance(create_md_converter(), MdConverter)
+    assert isinstance(create_md_converter("native"), NativeMdConverter)
+    with pytest.raises(ValueError):
+        create_md_converter("wrong")
+
+    nb_name = write_nb(
+        create_test_nb(code_source="code", md_source="md"), tmp_path / "nb"
+    )
+    for engine in ("nbconvert", "native"):
+        cfg = NbDocsCfg(docs_path=str(tmp_path / engine), engine=engine)
+        convert2md(nb_name, cfg)
+    assert (tmp_path / "native" / "nb.md").read_text(encoding="utf-8") == (
+        tmp_path / "nbconvert" / "nb.md"
+    ).read_text(encoding="utf-8")
+    assert (tmp_path / "native" / "images" / "nb_files" / "output_0_2.png").exists()
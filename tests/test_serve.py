@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.core import write_nb
+from nbdocs.serve import LRUCache, NbPreview, create_server
+from nbdocs.tests.base import create_nbs, create_test_nb
+
+
+def test_lru_cache():
+    """least recently used items removed over size"""
+    cache = LRUCache(10)
+    cache.put("a", 1, 4)
+    cache.put("b", 2, 4)
+    assert cache.get("a") == 1  # b least recently used
+    cache.put("c", 3, 4)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert (len(cache), cache.size) == (2, 8)
+    cache.put("d", 4, 20)  # bigger than limit - only last kept
+    assert (len(cache), cache.size) == (1, 20)
+    cache.pop("d")
+    assert (len(cache), cache.size) == (0, 0)
+
+
+def test_nb_preview(tmp_path: Path):
+    """notebook rendered on first request, cached, rendered again on change"""
+    nb_names = create_nbs(tmp_path, 3, md_image=True)
+    cfg = NbDocsCfg(notebooks_path=str(tmp_path), recursive=True)
+    preview = NbPreview(cfg)
+    assert "sub/nb_1.md" in preview.index()
+    assert preview.renders == 0
+    page = preview.page("sub/nb_1.md")
+    assert page is not None
+    assert "code_1" in page.md
+    assert preview.page("sub/nb_1.md") is page
+    assert preview.renders == 1
+    assert preview.page("sub/nb_5.md") is None
+    assert preview.image("sub/images/nb_1_files/output_0_2.png") == b"g"
+    assert preview.image("sub/img/dog.png") == b"dog"
+    assert preview.image("../outside.png") is None
+    # changed notebook
+    write_nb(create_test_nb(code_source="new_code"), nb_names[1])
+    page = preview.page("sub/nb_1.md")
+    assert "new_code" in page.md  # type: ignore
+    assert preview.renders == 2
+    assert len(preview.cache) == 1
+    # small cache - page removed, rendered again
+    preview = NbPreview(cfg, cache_size=1)
+    preview.page("sub/nb_0.md")
+    preview.page("sub/nb_2.md")
+    preview.page("sub/nb_0.md")
+    assert preview.renders == 3
+
+
+def test_server(tmp_path: Path):
+    """pages and images by http"""
+    create_nbs(tmp_path, 2, md_image=True)
+    cfg = NbDocsCfg(notebooks_path=str(tmp_path), recursive=True)
+    preview = NbPreview(cfg)
+    server = create_server(preview, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+    try:
+        with urlopen(url) as response:
+            assert "sub/nb_0.md" in response.read().decode()
+        with urlopen(url + "sub/nb_0.md") as response:
+            assert response.headers["Content-Type"].startswith("text/html")
+            assert "code_0" in response.read().decode()
+        with urlopen(url + "sub/images/nb_0_files/output_0_2.png") as response:
+            assert response.headers["Content-Type"] == "image/png"
+            assert response.read() == b"g"
+        with pytest.raises(HTTPError):
+            urlopen(url + "sub/nb_5.md")
+        assert preview.renders == 1
+    finally:
+        server.shutdown()
+        server.server_close()
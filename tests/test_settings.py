@@ -71,3 +71,10 @@ def test_get_config(tmp_path: Path) -> None:
     cfg = get_config(tmp_path, images_path="tst_images")
     assert cfg.docs_path == "test_docs_path"
     assert cfg.images_path == "tst_images"
+
+
+def test_cfg_values_from_ini() -> None:
+    """string values converted to type of default"""
+    cfg = NbDocsCfg(cell_cache="no", memory_budget="2.5")  # type: ignore
+    assert cfg.cell_cache is False
+    assert cfg.memory_budget == 2.5
@@ -0,0 +1,138 @@
+import json
+from pathlib import Path
+
+import pytest
+from pytest import CaptureFixture, MonkeyPatch
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.clean import clean_nb_file
+from nbdocs.convert import convert2md
+from nbdocs.core import write_nb
+from nbdocs.render import NativeMdConverter
+from nbdocs.timings import (
+    MB,
+    NULL_TIMER,
+    STAGE_MEMORY,
+    StageTimer,
+    print_memory,
+    report_timings,
+    stages_total,
+)
+from nbdocs.tests.base import create_test_nb
+
+
+def test_stage_timer():
+    """nested stages, repeated stages summed"""
+    timer = StageTimer()
+    with timer.stage("export"):
+        with timer.stage("render"):
+            pass
+    with timer.stage("export"):
+        pass
+    assert set(timer.stages) == {"export", "export/render"}
+    assert timer.stages["export"] >= timer.stages["export/render"]
+    assert stages_total(timer.stages) == timer.stages["export"]
+    # disabled timer records nothing
+    with NULL_TIMER.stage("export"):
+        pass
+    assert not NULL_TIMER.stages
+
+
+def test_convert_timings(tmp_path: Path, capsys: CaptureFixture[str]):
+    """timings at results, report and json lines"""
+    (tmp_path / "nbs").mkdir()
+    nb_fn = write_nb(
+        create_test_nb(code_source="test_code"), tmp_path / "nbs" / "nb_1.ipynb"
+    )
+    cfg = NbDocsCfg(
+        notebooks_path=str(tmp_path / "nbs"),
+        docs_path=str(tmp_path / "docs"),
+    )
+    results = convert2md(nb_fn, cfg)
+    assert not results[0].timings
+    cfg.timings = True
+    results = convert2md(nb_fn, cfg)
+    timings = results[0].timings
+    for stage in ("hash", "read_nb", "export", "export/render", "output_flag", "write"):
+        assert stage in timings
+    assert "export/preprocess/ExtractOutputPreprocessor" in timings
+    # disabled preprocessors not at timings
+    assert "export/preprocess/ExecutePreprocessor" not in timings
+    results = convert2md(nb_fn, cfg, md_converter=NativeMdConverter())
+    assert "render" in results[0].timings
+    capsys.readouterr()
+    timings_fn = tmp_path / "timings.jsonl"
+    report_timings(results, cfg, timings_fn)
+    captured = capsys.readouterr()
+    assert "Slowest notebooks, of 1:" in captured.out
+    assert "read_nb" in captured.out
+    lines = timings_fn.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    line = json.loads(lines[0])
+    assert line["nb"] == nb_fn.as_posix()
+    assert line["total"] == stages_total(line["stages"])
+
+
+@pytest.mark.skipif(not STAGE_MEMORY, reason="no tracemalloc.reset_peak")
+def test_stage_timer_memory():
+    """peak and retained memory of stages"""
+    with StageTimer(memory=True) as timer:
+        with timer.stage("parse"):
+            data = bytearray(2 * MB)
+            with timer.stage("temp"):
+                temp = bytearray(4 * MB)
+                del temp
+        with timer.stage("write"):
+            pass
+    peak, retained = timer.memory["parse"]
+    assert peak >= 6 * MB
+    assert 2 * MB <= retained < 3 * MB
+    peak, retained = timer.memory["parse/temp"]
+    assert 4 * MB <= peak < 5 * MB
+    assert retained < MB
+    assert timer.memory["write"][0] < MB
+    assert timer.memory["total"][0] >= 6 * MB
+    assert len(data) == 2 * MB
+
+
+def test_stage_timer_memory_total(monkeypatch: MonkeyPatch):
+    """no reset_peak (Python 3.8) - only total memory"""
+    monkeypatch.setattr("nbdocs.timings.STAGE_MEMORY", False)
+    with StageTimer(memory=True) as timer:
+        with timer.stage("parse"):
+            data = bytearray(2 * MB)
+    assert list(timer.memory) == ["total"]
+    peak, retained = timer.memory["total"]
+    assert peak >= 2 * MB
+    assert retained >= 2 * MB
+    assert "parse" in timer.stages
+    assert len(data) == 2 * MB
+
+
+def test_memory(tmp_path: Path, capsys: CaptureFixture[str]):
+    """memory at convert and clean, budget"""
+    (tmp_path / "nbs").mkdir()
+    nb_fn = write_nb(
+        create_test_nb(code_source="test_code"), tmp_path / "nbs" / "nb_1.ipynb"
+    )
+    cfg = NbDocsCfg(
+        notebooks_path=str(tmp_path / "nbs"),
+        docs_path=str(tmp_path / "docs"),
+        memory=True,
+    )
+    results = convert2md(nb_fn, cfg)
+    memory = results[0].memory
+    stages = ("read_nb", "export", "export/render", "write") if STAGE_MEMORY else ()
+    assert set(memory) >= {"total", *stages}
+    capsys.readouterr()
+    over_budget = print_memory({nb_fn: memory}, budget=1e-6)
+    assert over_budget == [nb_fn]
+    captured = capsys.readouterr()
+    assert "over budget" in captured.out
+    assert all(stage in captured.out for stage in stages)
+    assert not print_memory({nb_fn: memory}, budget=1e6)
+    # clean
+    usage = clean_nb_file(nb_fn, memory=True)
+    stages = ("read_nb", "clean") if STAGE_MEMORY else ()
+    assert set(usage[nb_fn]) >= {"total", *stages}
+    assert clean_nb_file(nb_fn) == {}
@@ -0,0 +1,70 @@
+import threading
+import time
+from pathlib import Path
+
+from pytest import CaptureFixture
+
+from nbdocs.cfg_tools import NbDocsCfg
+from nbdocs.core import write_nb
+from nbdocs.watch import NbWatcher, scan_nb_stats, watch
+
+from nbdocs.tests.base import create_nb
+
+
+def test_nb_watcher(tmp_path: Path):
+    """NbWatcher poll and wait_changes"""
+    nb_name = write_nb(create_nb(md_source="md"), tmp_path / "nb_1")
+    assert list(scan_nb_stats(tmp_path)) == [nb_name]
+    assert scan_nb_stats(tmp_path / "not_exists") == {}
+    watcher = NbWatcher(tmp_path)
+    assert watcher.poll() == []
+    write_nb(create_nb(md_source="md changed"), nb_name)
+    new_nb_name = write_nb(create_nb(md_source="md"), tmp_path / "nb_2")
+    (tmp_path / "not_nb.txt").touch()
+    assert watcher.poll() == [nb_name, new_nb_name]
+    assert watcher.poll() == []
+
+    write_nb(create_nb(md_source="md"), nb_name)
+    assert watcher.wait_changes(interval=0.01, debounce=0.01) == [nb_name]
+
+
+def test_watch(tmp_path: Path):
+    """watch - initial convert and convert on change"""
+    nbs_path = tmp_path / "nbs"
+    nbs_path.mkdir()
+    cfg = NbDocsCfg(notebooks_path=str(nbs_path), docs_path=str(tmp_path / "docs"))
+    nb_name = write_nb(create_nb(md_source="md"), nbs_path / "nb_1")
+    md_name = tmp_path / "docs" / "nb_1.md"
+
+    def change_nb():
+        while not md_name.exists():  # wait initial conversion
+            time.sleep(0.01)  # pragma: no cover
+        time.sleep(0.05)
+        write_nb(create_nb(md_source="md changed"), nb_name)
+
+    thread = threading.Thread(target=change_nb)
+    thread.start()
+    watch(cfg, interval=0.01, debounce=0.01, max_rounds=1)
+    thread.join()
+    assert md_name.read_text(encoding="utf-8") == "md changed\n"
+
+
+def test_watch_error(tmp_path: Path, capsys: CaptureFixture[str]):
+    """watch - invalid notebook reported, watching continues"""
+    nbs_path = tmp_path / "nbs"
+    nbs_path.mkdir()
+    cfg = NbDocsCfg(notebooks_path=str(nbs_path), docs_path=str(tmp_path / "docs"))
+    nb_name = nbs_path / "nb_1.ipynb"
+    nb_name.write_text("{not json", encoding="utf-8")
+    md_name = tmp_path / "docs" / "nb_1.md"
+
+    def fix_nb():
+        time.sleep(0.05)
+        write_nb(create_nb(md_source="md fixed"), nb_name)
+
+    thread = threading.Thread(target=fix_nb)
+    thread.start()
+    watch(cfg, interval=0.01, debounce=0.01, max_rounds=1)
+    thread.join()
+    assert "Error converting" in capsys.readouterr().out
+    assert md_name.read_text(encoding="utf-8") == "md fixed\n"